@@ -51,6 +51,11 @@ from .models import (
 # Endpoint functions
 from .records import (
     list_records,
+    list_records_pages,
+    fetch_record_bundle,
+    afetch_record_bundle,
+    RecordBundle,
+    iter_records_with_relations,
     iter_records,
     iter_record_guests,
     iter_record_additional_locations,
@@ -58,6 +63,30 @@ from .records import (
     iter_record_workflow_steps,
     iter_record_workflow_step_comments,
     iter_record_collections,
+    aiter_records,
+    aiter_record_guests,
+    aiter_record_additional_locations,
+    aiter_record_attachments,
+    aiter_record_workflow_steps,
+    aiter_record_workflow_step_comments,
+    aiter_record_collections,
+    alist_record_guests,
+    aget_record_guest,
+    aget_record_primary_location,
+    alist_record_additional_locations,
+    aget_record_additional_location,
+    alist_record_attachments,
+    aget_record_attachment,
+    aget_record_change_request,
+    aget_most_recent_record_change_request,
+    alist_record_workflow_steps,
+    aget_record_workflow_step,
+    alist_record_workflow_step_comments,
+    aget_record_workflow_step_comment,
+    alist_record_collections,
+    aget_record_collection,
+    aget_record_collection_entry,
+    clear_record_cache,
     get_record,
     create_record,
     update_record,
@@ -98,6 +127,7 @@ from .records import (
     list_record_collections,
     get_record_collection,
     create_record_collection_entry,
+    create_record_collection_entries,
     get_record_collection_entry,
     update_record_collection_entry,
 )
@@ -149,6 +179,7 @@ from .record_types import (
     get_record_type_form,
     list_record_type_workflow,
     get_record_type_workflow_step,
+    clear_record_type_cache,
 )
 
 # Exceptions
@@ -158,6 +189,7 @@ from .exceptions import (
     OpenGovAPIConnectionError,
     OpenGovAPITimeoutError,
     OpenGovResponseParseError,
+    OpenGovBulkRequestError,
     OpenGovAPIStatusError,
     OpenGovBadRequestError,
     OpenGovAuthenticationError,
@@ -201,6 +233,11 @@ __all__ = [
     "WorkflowStepStatus",
     # Records
     "list_records",
+    "list_records_pages",
+    "fetch_record_bundle",
+    "afetch_record_bundle",
+    "RecordBundle",
+    "iter_records_with_relations",
     "iter_records",
     "iter_record_guests",
     "iter_record_additional_locations",
@@ -208,6 +245,30 @@ __all__ = [
     "iter_record_workflow_steps",
     "iter_record_workflow_step_comments",
     "iter_record_collections",
+    "aiter_records",
+    "aiter_record_guests",
+    "aiter_record_additional_locations",
+    "aiter_record_attachments",
+    "aiter_record_workflow_steps",
+    "aiter_record_workflow_step_comments",
+    "aiter_record_collections",
+    "alist_record_guests",
+    "aget_record_guest",
+    "aget_record_primary_location",
+    "alist_record_additional_locations",
+    "aget_record_additional_location",
+    "alist_record_attachments",
+    "aget_record_attachment",
+    "aget_record_change_request",
+    "aget_most_recent_record_change_request",
+    "alist_record_workflow_steps",
+    "aget_record_workflow_step",
+    "alist_record_workflow_step_comments",
+    "aget_record_workflow_step_comment",
+    "alist_record_collections",
+    "aget_record_collection",
+    "aget_record_collection_entry",
+    "clear_record_cache",
     "get_record",
     "create_record",
     "update_record",
@@ -248,6 +309,7 @@ __all__ = [
     "list_record_collections",
     "get_record_collection",
     "create_record_collection_entry",
+    "create_record_collection_entries",
     "get_record_collection_entry",
     "update_record_collection_entry",
     # Users
@@ -296,12 +358,14 @@ __all__ = [
     "get_record_type_form",
     "list_record_type_workflow",
     "get_record_type_workflow_step",
+    "clear_record_type_cache",
     # Exceptions
     "OpenGovAPIError",
     "OpenGovConfigurationError",
     "OpenGovAPIConnectionError",
     "OpenGovAPITimeoutError",
     "OpenGovResponseParseError",
+    "OpenGovBulkRequestError",
     "OpenGovAPIStatusError",
     "OpenGovBadRequestError",
     "OpenGovAuthenticationError",
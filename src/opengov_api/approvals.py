@@ -33,7 +33,7 @@ updated = opengov_api.update_approval_step("approval-step-12345", {
 from typing import Any
 
 
-from .base import build_url, handle_request_errors, parse_json_response
+from .base import build_url, dump_json, handle_request_errors, parse_json_response
 from .client import _get_client, get_base_url, get_community
 
 
@@ -59,11 +59,11 @@ def list_approval_steps() -> dict[str, Any]:
         >>> approval_steps = opengov_api.list_approval_steps()
         >>> print(approval_steps)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "approval-steps")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "approval-steps")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -91,13 +91,13 @@ def get_approval_step(approval_step_id: str) -> dict[str, Any]:
         >>> approval_step = opengov_api.get_approval_step("approval-step-12345")
         >>> print(approval_step)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"approval-steps/{approval_step_id}"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(
+        get_base_url(), get_community(), f"approval-steps/{approval_step_id}"
+    )
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -130,10 +130,10 @@ def update_approval_step(approval_step_id: str, data: dict[str, Any]) -> dict[st
         ...     }
         ... })
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"approval-steps/{approval_step_id}"
-        )
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(
+        get_base_url(), get_community(), f"approval-steps/{approval_step_id}"
+    )
+    response = client.patch(url, content=dump_json(data))
+    response.raise_for_status()
+    return parse_json_response(response)
@@ -2,22 +2,45 @@
 Base utilities for OpenGov API SDK.
 
 Provides:
-- URL construction helpers
+- URL construction helpers, with a cache of parsed request URLs
 - Error handling and exception mapping
+- Request body serialization for write endpoints
 - Response parsing with validation
+- Direct JSON-to-model validation via pydantic TypeAdapters
+- Direct JSON-to-struct decoding via msgspec (optional)
 - Request execution wrapper
 - Automatic retry with exponential backoff for transient errors
+  (sync and async)
+- Pagination with background prefetch of the next page
+- Incremental parsing of streamed list pages (optional)
 """
 
+import asyncio
 import functools
 import json
 import random
 import time
-from typing import Any, Callable, ParamSpec, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterator, ParamSpec, TypeVar
 import logging
 
 import httpx
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
 from .exceptions import (
     OpenGovAPIConnectionError,
@@ -35,6 +58,9 @@ from .exceptions import (
 # Type variables for preserving function signatures in decorators
 P = ParamSpec("P")
 R = TypeVar("R")
+T = TypeVar("T")
+PageT = TypeVar("PageT")
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 _log = logging.getLogger(__name__)
 
@@ -56,6 +82,25 @@ def build_url(base_url: str, community: str, endpoint: str) -> str:
     return f"{base_url}/{community}/{endpoint}"
 
 
+@functools.lru_cache(maxsize=1024)
+def parse_url(url: str) -> httpx.URL:
+    """
+    Parse a request URL once and reuse the result for repeated requests.
+
+    httpx parses every URL string it is given, which costs more than the
+    rest of building a request. Polled resources and paginated endpoints
+    hit the same URLs over and over, so the parsed, immutable httpx.URL
+    is cached.
+
+    Args:
+        url: Absolute request URL
+
+    Returns:
+        The parsed URL
+    """
+    return httpx.URL(url)
+
+
 def make_status_error(response: httpx.Response) -> OpenGovAPIStatusError:
     """
     Create appropriate exception from HTTP status code.
@@ -105,10 +150,54 @@ def make_status_error(response: httpx.Response) -> OpenGovAPIStatusError:
     return error_class(error_message, response=response, body=body)
 
 
+def dump_json(data: Any) -> bytes:
+    """
+    Serialize a request body to JSON bytes.
+
+    Uses orjson when it is installed (``pip install opengov-api[fast]``),
+    otherwise the standard library encoder with the same compact output
+    httpx produces for its json argument.
+
+    Args:
+        data: JSON-serializable request body
+
+    Returns:
+        UTF-8 encoded JSON, ready for the httpx content argument
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode()
+
+
+def encode_request_body(data: dict[str, Any] | BaseModel) -> bytes:
+    """
+    Serialize a write-endpoint request body to JSON bytes.
+
+    Request models are serialized by alias with None-valued fields omitted,
+    so optional attributes the caller left unset are not sent over the wire.
+    Plain dictionaries are passed to dump_json unchanged.
+
+    Args:
+        data: Request body as a dictionary or pydantic model
+
+    Returns:
+        UTF-8 encoded JSON, ready for the httpx content argument
+    """
+    if isinstance(data, BaseModel):
+        return data.model_dump_json(by_alias=True, exclude_none=True).encode()
+    return dump_json(data)
+
+
 def parse_json_response(response: httpx.Response) -> dict[str, Any]:
     """
     Parse and validate JSON response with error handling.
 
+    Decodes the raw response bytes with orjson when it is installed
+    (``pip install opengov-api[fast]``), otherwise falls back to the
+    standard library decoder used by httpx.
+
     Args:
         response: The HTTP response object
 
@@ -119,8 +208,11 @@ def parse_json_response(response: httpx.Response) -> dict[str, Any]:
         OpenGovResponseParseError: If JSON parsing fails
     """
     try:
-        resp = response.json()
-        _log.debug(f"Parsed JSON response: {resp}")
+        if orjson is not None:
+            resp = orjson.loads(response.content)
+        else:
+            resp = response.json()
+        _log.debug("Parsed JSON response: %s", resp)
         return resp
     except json.JSONDecodeError as e:
         raise OpenGovResponseParseError(
@@ -130,6 +222,121 @@ def parse_json_response(response: httpx.Response) -> dict[str, Any]:
         ) from e
 
 
+def validate_json_response(response: httpx.Response, adapter: TypeAdapter[T]) -> T:
+    """
+    Parse and validate a JSON response directly into a typed model.
+
+    The raw response bytes are handed to pydantic-core, which parses and
+    validates in a single pass without building an intermediate dict.
+
+    Args:
+        response: The HTTP response object
+        adapter: TypeAdapter for the expected response type
+
+    Returns:
+        The validated response model
+
+    Raises:
+        OpenGovResponseParseError: If the body is not valid JSON
+        ValidationError: If the JSON does not match the expected model
+    """
+    try:
+        return adapter.validate_json(response.content)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise OpenGovResponseParseError(
+                f"Failed to parse JSON response: {e}",
+                response=response,
+                body=response.text,
+            ) from e
+        raise
+
+
+def decode_struct_response(response: httpx.Response, decoder: Any) -> Any:
+    """
+    Decode a JSON response body straight into msgspec structs.
+
+    Only usable when the optional msgspec package is installed.
+
+    Args:
+        response: The HTTP response object
+        decoder: Reusable ``msgspec.json.Decoder`` for the target type
+
+    Returns:
+        The decoded struct
+
+    Raises:
+        OpenGovResponseParseError: If the body is not valid JSON
+        msgspec.ValidationError: If the JSON does not match the target type
+    """
+    try:
+        return decoder.decode(response.content)
+    except msgspec.ValidationError:
+        raise
+    except msgspec.DecodeError as e:
+        raise OpenGovResponseParseError(
+            f"Failed to parse JSON response: {e}",
+            response=response,
+            body=response.text,
+        ) from e
+
+
+def iter_prefetched_pages(
+    fetch_page: Callable[[int], PageT],
+    has_next_page: Callable[[PageT], bool] | None = None,
+) -> Iterator[PageT]:
+    """
+    Yield successive pages, fetching the next one in the background.
+
+    As soon as page N arrives and reports a next page, page N+1 is requested
+    on a worker thread so the network round trip overlaps with the caller
+    consuming page N. No request is made past the last page.
+
+    Args:
+        fetch_page: Callable returning the response for a 1-based page number
+        has_next_page: Callable telling whether a page has a successor
+            (default: the page's own has_next_page method; use
+            raw_has_next_page for parsed JSON documents)
+
+    Yields:
+        Page responses in order
+
+    Raises:
+        Any exception raised by fetch_page, at the point its page is reached
+    """
+    if has_next_page is None:
+        has_next_page = _page_has_next
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="opengov-prefetch")
+    try:
+        page_number = 1
+        page = fetch_page(page_number)
+        while True:
+            next_page: Future[PageT] | None = None
+            if has_next_page(page):
+                page_number += 1
+                next_page = pool.submit(fetch_page, page_number)
+
+            yield page
+
+            if next_page is None:
+                return
+            page = next_page.result()
+    finally:
+        # Don't block an abandoned iteration on an in-flight prefetch
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _page_has_next(page: Any) -> bool:
+    """Default next-page check for response models."""
+    return page.has_next_page()
+
+
+def raw_has_next_page(document: dict[str, Any]) -> bool:
+    """Check whether a parsed JSON:API document links to a next page."""
+    links = document.get("links")
+    return bool(links and links.get("next"))
+
+
 def _calculate_retry_delay(attempt: int, retry_after: float | None = None) -> float:
     """
     Calculate retry delay with exponential backoff and jitter.
@@ -201,6 +408,60 @@ def _is_retryable_error(
     return (False, None)
 
 
+def _convert_request_error(e: Exception, attempt: int) -> Exception | None:
+    """
+    Convert an httpx exception raised on the final attempt to an SDK exception.
+
+    Args:
+        e: The exception raised by the request
+        attempt: Current retry attempt (0-indexed)
+
+    Returns:
+        The SDK exception to raise, or None if the exception is not an
+        httpx error and should be re-raised unchanged
+    """
+    if isinstance(e, httpx.TimeoutException):
+        request = None
+        try:
+            request = e.request
+        except (RuntimeError, AttributeError):
+            pass
+        return OpenGovAPITimeoutError(
+            f"Request timed out after {attempt} attempts: {e}",
+            request=request,
+            attempts=attempt + 1,
+        )
+    elif isinstance(e, httpx.ConnectError):
+        request = None
+        try:
+            request = e.request
+        except (RuntimeError, AttributeError):
+            pass
+        return OpenGovAPIConnectionError(
+            f"Connection failed after {attempt} attempts: {e}",
+            request=request,
+            attempts=attempt + 1,
+        )
+    elif isinstance(e, httpx.NetworkError):
+        request = None
+        try:
+            request = e.request
+        except (RuntimeError, AttributeError):
+            pass
+        return OpenGovAPIConnectionError(
+            f"Network error after {attempt} attempts: {e}",
+            request=request,
+            attempts=attempt + 1,
+        )
+    elif isinstance(e, httpx.HTTPStatusError):
+        # Create status error with attempt count
+        status_error = make_status_error(e.response)
+        status_error.attempts = attempt + 1
+        return status_error
+    # Unknown exception
+    return None
+
+
 def handle_request_errors(
     func: Callable[P, R],
 ) -> Callable[P, R]:
@@ -239,48 +500,10 @@ def handle_request_errors(
 
                 # If not retryable or out of retries, convert and raise
                 if not is_retryable or attempt >= config.max_retries:
-                    # Convert to custom exceptions
-                    if isinstance(e, httpx.TimeoutException):
-                        request = None
-                        try:
-                            request = e.request
-                        except (RuntimeError, AttributeError):
-                            pass
-                        raise OpenGovAPITimeoutError(
-                            f"Request timed out after {attempt} attempts: {e}",
-                            request=request,
-                            attempts=attempt + 1,
-                        ) from e
-                    elif isinstance(e, httpx.ConnectError):
-                        request = None
-                        try:
-                            request = e.request
-                        except (RuntimeError, AttributeError):
-                            pass
-                        raise OpenGovAPIConnectionError(
-                            f"Connection failed after {attempt} attempts: {e}",
-                            request=request,
-                            attempts=attempt + 1,
-                        ) from e
-                    elif isinstance(e, httpx.NetworkError):
-                        request = None
-                        try:
-                            request = e.request
-                        except (RuntimeError, AttributeError):
-                            pass
-                        raise OpenGovAPIConnectionError(
-                            f"Network error after {attempt} attempts: {e}",
-                            request=request,
-                            attempts=attempt + 1,
-                        ) from e
-                    elif isinstance(e, httpx.HTTPStatusError):
-                        # Create status error with attempt count
-                        status_error = make_status_error(e.response)
-                        status_error.attempts = attempt + 1
-                        raise status_error from e
-                    else:
-                        # Unknown exception, re-raise
+                    error = _convert_request_error(e, attempt)
+                    if error is None:
                         raise
+                    raise error from e
 
                 # Calculate delay and retry
                 delay = _calculate_retry_delay(attempt, retry_after)
@@ -293,3 +516,197 @@ def handle_request_errors(
         raise RuntimeError("Unexpected error in retry loop")
 
     return wrapper
+
+
+def handle_async_request_errors(
+    func: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """
+    Async counterpart of handle_request_errors.
+
+    Applies the same retry policy and exception mapping to a coroutine
+    function, waiting between attempts with asyncio.sleep so the event
+    loop is not blocked.
+
+    Args:
+        func: Coroutine function to wrap
+
+    Returns:
+        Wrapped coroutine function with error handling and retry logic
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        from .client import get_retry_config
+
+        config = get_retry_config()
+        attempt = 0
+
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                is_retryable, retry_after = _is_retryable_error(e)
+
+                if not is_retryable or attempt >= config.max_retries:
+                    error = _convert_request_error(e, attempt)
+                    if error is None:
+                        raise
+                    raise error from e
+
+                delay = _calculate_retry_delay(attempt, retry_after)
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    return wrapper
+
+
+@handle_request_errors
+def send_request(
+    client: httpx.Client, method: str, url: str, **kwargs: Any
+) -> httpx.Response:
+    """
+    Send a request and raise for error statuses, with retries.
+
+    Fuses the request, the status check and the retry/exception mapping of
+    handle_request_errors into one call, so page fetchers inside iterators
+    need no decorator of their own.
+
+    Args:
+        client: Client to send the request on
+        method: HTTP method
+        url: Request URL
+        **kwargs: Passed through to ``client.request`` (params, json, ...)
+
+    Returns:
+        The successful response, body already read
+    """
+    response = client.request(method, parse_url(url), **kwargs)
+    response.raise_for_status()
+    return response
+
+
+@handle_request_errors
+def open_stream(
+    client: httpx.Client, url: str, params: dict[str, Any]
+) -> httpx.Response:
+    """
+    Send a GET request and return the response with its body unread.
+
+    Error responses are read and closed before raising, so status errors
+    can still report the body. Callers must close successful responses.
+
+    Args:
+        client: Client to send the request on
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        The open streaming response
+    """
+    request = client.build_request("GET", parse_url(url), params=params)
+    response = client.send(request, stream=True)
+    if response.is_error:
+        # Error bodies are small; load them so the status error can report them
+        response.read()
+        response.close()
+    response.raise_for_status()
+    return response
+
+
+def iter_streamed_items(
+    open_page: Callable[[int], httpx.Response], model: type[ModelT]
+) -> Iterator[ModelT]:
+    """
+    Yield validated items from every page of a list endpoint as they download.
+
+    Each page body is fed chunk by chunk into ijson, so items are yielded
+    before the page has fully arrived and the raw page is never held in
+    memory. The body is tokenized once; links.next is picked from the same
+    event stream to decide whether to request another page. Requires the optional ijson package.
+
+    Args:
+        open_page: Callable returning the open streaming response for a
+            1-based page number (see open_stream)
+        model: Model each item in the page's data array is validated as
+
+    Yields:
+        Validated model instances one at a time across all pages
+
+    Raises:
+        OpenGovAPIConnectionError: If the connection fails mid-page
+        OpenGovAPITimeoutError: If reading a page body times out
+        OpenGovResponseParseError: If a page body is not valid JSON
+    """
+    page_number = 1
+    while True:
+        response = open_page(page_number)
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events, use_float=True)
+        items: list[Any] = []
+        next_links: list[Any] = []
+        router = _PrefixRouter({"data.item": items, "links.next": next_links})
+        try:
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                router.feed(events)
+                yield from _drain_items(items, model)
+            parser.close()
+            router.feed(events)
+            yield from _drain_items(items, model)
+        except ijson.JSONError as e:
+            raise OpenGovResponseParseError(
+                f"Failed to parse JSON response: {e}", response=response
+            ) from e
+        except httpx.HTTPError as e:
+            # Items were already yielded, so a broken page is not retried
+            error = _convert_request_error(e, 0)
+            if error is None:
+                raise
+            raise error from e
+        finally:
+            response.close()
+
+        if all(link is None for link in next_links):
+            return
+        page_number += 1
+
+
+class _PrefixRouter:
+    """
+    Build the values found at selected prefixes of one ijson event stream.
+
+    Args:
+        targets: Maps an ijson prefix (e.g. "data.item") to the list each
+            complete value found at that prefix is appended to
+    """
+
+    def __init__(self, targets: dict[str, list[Any]]) -> None:
+        self._targets = targets
+        self._prefix: str | None = None
+        self._builder: Any = None
+
+    def feed(self, events: list[tuple[str, str, Any]]) -> None:
+        """Consume parsed events, emptying the buffer."""
+        for prefix, event, value in events:
+            if self._builder is not None:
+                self._builder.event(event, value)
+                if prefix == self._prefix and event in ("end_map", "end_array"):
+                    self._targets[prefix].append(self._builder.value)
+                    self._builder = None
+            elif prefix in self._targets:
+                if event in ("start_map", "start_array"):
+                    self._builder = ijson.common.ObjectBuilder()
+                    self._builder.event(event, value)
+                    self._prefix = prefix
+                else:
+                    self._targets[prefix].append(value)
+        del events[:]
+
+
+def _drain_items(items: list[Any], model: type[ModelT]) -> Iterator[ModelT]:
+    """Validate and yield parsed items, emptying the buffer."""
+    batch = items[:]
+    del items[:]
+    for item in batch:
+        yield model.model_validate(item)
@@ -0,0 +1,235 @@
+"""
+Response caching for idempotent OpenGov API GET endpoints.
+
+Provides:
+- A thread-safe TTL cache with least-recently-used eviction
+- A decorator that caches endpoint results per configured API target
+- Conditional GETs that revalidate cached models with their ETag
+- Collapsing of concurrent identical requests into one in-flight call
+"""
+
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, ParamSpec, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+from .base import parse_url
+from .client import get_api_key, get_base_url, get_community
+
+# Type variables for preserving function signatures in decorators
+P = ParamSpec("P")
+R = TypeVar("R")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe cache whose entries expire after a fixed time-to-live.
+
+    When full, the least recently used entry is evicted first.
+
+    Attributes:
+        maxsize: Maximum number of entries held at once
+        ttl: Seconds an entry stays valid after it is stored
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a live entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or the module sentinel ``_MISSING`` if the key
+            is absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for and share its result or exception. Nothing is kept
+    once the call finishes, so later calls run again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        """
+        Run func, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifies identical calls
+            func: Zero-argument callable performing the call
+
+        Returns:
+            The result of func, shared by all concurrent callers
+
+        Raises:
+            Any exception raised by func, in every waiting caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def cached_response(cache: TTLCache) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator to serve repeated calls to an idempotent GET from a cache.
+
+    Entries are keyed on the endpoint, the configured base URL, community
+    and API key, and the call arguments, so reconfiguring the SDK never
+    serves another target's data. Only successful results are cached.
+    Callers receive a deep copy so mutating a result cannot corrupt the
+    cached entry.
+
+    Args:
+        cache: Cache instance to store results in
+
+    Returns:
+        Decorator that wraps the endpoint function
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = (
+                func.__qualname__,
+                get_base_url(),
+                get_community(),
+                get_api_key(),
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+            value = cache.get(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return copy.deepcopy(value)
+
+        return wrapper
+
+    return decorator
+
+
+def conditional_get(
+    client: httpx.Client,
+    url: str,
+    cache: TTLCache,
+    parse: Callable[[httpx.Response], ModelT],
+    inflight: SingleFlight | None = None,
+) -> ModelT:
+    """
+    GET a resource, revalidating a previously cached copy by its ETag.
+
+    When the URL has been fetched before with an ETag, the request carries
+    ``If-None-Match`` and a 304 answer is served from the cache without
+    reading or validating a body. Entries are keyed on the API key and the
+    full URL, and only responses with an ETag are stored. Callers receive
+    a deep copy so mutating a result cannot corrupt the cached entry.
+
+    Args:
+        client: Client to send the request on
+        url: Resource URL
+        cache: Cache holding ``(etag, model)`` pairs
+        parse: Callable turning a successful response into the model
+        inflight: When given, concurrent requests for the same key share
+            one round trip
+
+    Returns:
+        The parsed or cached model
+
+    Raises:
+        httpx.HTTPStatusError: If the API returns an error status code
+    """
+    key = (get_api_key(), url)
+
+    def fetch() -> ModelT:
+        entry = cache.get(key)
+        headers = None
+        if entry is not _MISSING:
+            headers = {"If-None-Match": entry[0]}
+
+        response = client.get(parse_url(url), headers=headers)
+        if response.status_code == 304 and entry is not _MISSING:
+            cache.set(key, entry)
+            return entry[1]
+        response.raise_for_status()
+
+        value = parse(response)
+        etag = response.headers.get("etag")
+        if etag:
+            cache.set(key, (etag, value))
+        return value
+
+    value = fetch() if inflight is None else inflight.do(key, fetch)
+    return value.model_copy(deep=True)
@@ -1,17 +1,34 @@
 """
 Client factory and configuration for OpenGov API SDK.
 
-Provides module-level configuration management and client factory.
+Provides module-level configuration management and a pooled HTTP client.
 """
 
+import asyncio
+import atexit
+import functools
 import os
+import sys
+import threading
+import weakref
 from dataclasses import dataclass
 from typing import Literal, Optional
 
 import httpx
 
+from .base import build_url
 from .exceptions import OpenGovConfigurationError
 
+# Negotiate HTTP/2 via ALPN when h2 is installed (``http2`` extra), so
+# concurrent page requests multiplex over one connection; servers without
+# HTTP/2 support fall back to HTTP/1.1 keep-alive on the same pool
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2 = False
+else:
+    _HTTP2 = True
+
 # Type for authentication scheme
 AuthScheme = Literal["token", "bearer"]
 
@@ -44,6 +61,22 @@ _timeout: float = 30.0
 _retry_config: RetryConfig = RetryConfig()
 _auth_scheme: AuthScheme = "token"  # Default for production
 
+# Connection pool for the shared client; keep-alive headroom covers
+# background page prefetching alongside the caller's own requests
+_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Shared HTTP client, rebuilt whenever the settings it was built with change
+_client: Optional[httpx.Client] = None
+_client_settings: Optional[tuple[str, float]] = None
+_client_lock = threading.Lock()
+
+# Async clients are bound to an event loop, so one is shared per running loop
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[tuple[str, float], httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+# Strong references to the tasks that close shared async clients
+_closing_tasks: set[asyncio.Task[None]] = set()
+
 
 def set_api_key(key: str) -> None:
     """
@@ -244,12 +277,46 @@ def get_auth_scheme() -> AuthScheme:
     return _auth_scheme
 
 
-def _get_client() -> httpx.Client:
+@functools.lru_cache(maxsize=32)
+def _url_prefix(base_url: str, community: str, resource: str) -> str:
+    """
+    Build and intern the URL prefix for a resource collection.
+
+    Keyed on the configuration values themselves, so changing the base URL
+    or community simply produces a new entry instead of needing invalidation.
     """
-    Create configured httpx.Client with authentication and defaults.
+    return sys.intern(build_url(base_url, community, resource))
+
+
+def _record_types_prefix() -> str:
+    """
+    Get the record-types URL prefix for the current configuration.
 
     Returns:
-        Configured httpx.Client instance
+        URL such as "https://api.plce.opengov.com/plce/v2/your-community/record-types"
+
+    Raises:
+        OpenGovConfigurationError: If community is not set
+    """
+    return _url_prefix(_base_url, get_community(), "record-types")
+
+
+def _records_prefix() -> str:
+    """
+    Get the records URL prefix for the current configuration.
+
+    Returns:
+        URL such as "https://api.plce.opengov.com/plce/v2/your-community/records"
+
+    Raises:
+        OpenGovConfigurationError: If community is not set
+    """
+    return _url_prefix(_base_url, get_community(), "records")
+
+
+def _auth_header() -> str:
+    """
+    Build the Authorization header value for the configured auth scheme.
 
     Raises:
         OpenGovConfigurationError: If API key is not configured
@@ -258,14 +325,126 @@ def _get_client() -> httpx.Client:
 
     # Set auth header based on configured scheme
     if _auth_scheme == "bearer":
-        auth_header = f"Bearer {api_key}"
-    else:
-        auth_header = f"Token {api_key}"
+        return f"Bearer {api_key}"
+    return f"Token {api_key}"
+
 
-    return httpx.Client(
+def _get_client() -> httpx.Client:
+    """
+    Get the shared httpx.Client configured with authentication and defaults.
+
+    The client is created lazily and reused across calls so connections
+    are kept alive between requests. It is rebuilt automatically when the
+    API key, auth scheme or timeout changes, or if it has been closed. A
+    replaced client is left open, since other threads may still be sending
+    on it, and its connections are released once it is garbage collected.
+    Callers must not close it; the current client is closed when the
+    interpreter exits.
+
+    Returns:
+        Configured httpx.Client instance
+
+    Raises:
+        OpenGovConfigurationError: If API key is not configured
+    """
+    global _client, _client_settings
+
+    auth_header = _auth_header()
+    settings = (auth_header, _timeout)
+    client = _client
+    if client is not None and not client.is_closed and _client_settings == settings:
+        return client
+
+    with _client_lock:
+        if _client is None or _client.is_closed or _client_settings != settings:
+            _client = httpx.Client(
+                headers={
+                    "Authorization": auth_header,
+                    "Content-Type": "application/json",
+                },
+                timeout=_timeout,
+                limits=_POOL_LIMITS,
+                http2=_HTTP2,
+            )
+            _client_settings = settings
+        return _client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Create an httpx.AsyncClient configured with authentication and defaults.
+
+    Async clients are bound to the event loop they are used on, so unlike
+    _get_client a new one is returned on every call. Use it as an async
+    context manager around a batch of requests so they share its pool.
+
+    Returns:
+        Configured httpx.AsyncClient instance
+
+    Raises:
+        OpenGovConfigurationError: If API key is not configured
+    """
+    return httpx.AsyncClient(
         headers={
-            "Authorization": auth_header,
+            "Authorization": _auth_header(),
             "Content-Type": "application/json",
         },
         timeout=_timeout,
+        limits=_POOL_LIMITS,
+        http2=_HTTP2,
     )
+
+
+def _get_shared_async_client() -> httpx.AsyncClient:
+    """
+    Get the httpx.AsyncClient shared by async endpoints on the running loop.
+
+    One client is kept per event loop so concurrent calls (e.g. gathered
+    aget_* coroutines) reuse its keep-alive connections. Like _get_client,
+    it is replaced when the API key, auth scheme or timeout changes. Every
+    client, replaced or current, stays open until asyncio.run (or
+    asyncio.Runner) cancels the loop's remaining tasks on shutdown, so
+    requests still in flight on a replaced client are never cut off. Must
+    be called from a coroutine.
+
+    Returns:
+        Configured httpx.AsyncClient instance
+
+    Raises:
+        OpenGovConfigurationError: If API key is not configured
+        RuntimeError: If no event loop is running
+    """
+    loop = asyncio.get_running_loop()
+    settings = (_auth_header(), _timeout)
+    entry = _async_clients.get(loop)
+    if entry is not None:
+        entry_settings, client = entry
+        if entry_settings == settings and not client.is_closed:
+            return client
+
+    client = _get_async_client()
+    task = loop.create_task(_close_on_shutdown(client))
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+    _async_clients[loop] = (settings, client)
+    return client
+
+
+async def _close_on_shutdown(client: httpx.AsyncClient) -> None:
+    """Close the client once the loop cancels its remaining tasks."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await client.aclose()
+
+
+@atexit.register
+def _close_client() -> None:
+    """Close the shared client and release its pooled connections."""
+    global _client, _client_settings
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _client_settings = None
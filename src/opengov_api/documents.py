@@ -35,19 +35,26 @@ print(document_step)
 from datetime import date, datetime
 from typing import Any, Iterator
 
+from pydantic import TypeAdapter
 
-from .base import build_url, handle_request_errors, parse_json_response
+from .base import (
+    build_url,
+    handle_request_errors,
+    parse_json_response,
+    validate_json_response,
+)
 from .client import _get_client, get_base_url, get_community
 from .models import (
     DateRangeFilter,
     DocumentStepResource,
     DocumentStepStatus,
     JSONAPIResponse,
-    Links,
     ListDocumentStepsParams,
-    Meta,
 )
 
+# Validate whole responses straight from the response bytes
+_DOCUMENT_STEP_ADAPTER = TypeAdapter(JSONAPIResponse[DocumentStepResource])
+
 
 @handle_request_errors
 def list_document_steps(
@@ -126,19 +133,11 @@ def list_document_steps(
         sort=sort,
     )
 
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "document-steps")
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        # Parse into typed response
-        return JSONAPIResponse[DocumentStepResource](
-            data=[DocumentStepResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "document-steps")
+    response = client.get(url, params=params_model.to_query_params())
+    response.raise_for_status()
+    return validate_json_response(response, _DOCUMENT_STEP_ADAPTER)
 
 
 @handle_request_errors
@@ -226,10 +225,10 @@ def get_document_step(document_step_id: str) -> dict[str, Any]:
         >>> document_step = opengov_api.get_document_step("document-step-12345")
         >>> print(document_step)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"document-steps/{document_step_id}"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(
+        get_base_url(), get_community(), f"document-steps/{document_step_id}"
+    )
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
@@ -63,6 +63,24 @@ class OpenGovResponseParseError(OpenGovAPIError):
         self.body = body
 
 
+class OpenGovBulkRequestError(OpenGovAPIError):
+    """Some requests of a bulk operation failed; others may have succeeded."""
+
+    def __init__(self, message: str, *, results: list[Any]) -> None:
+        super().__init__(message)
+        # One entry per request, in order: its parsed response or exception
+        self.results = results
+
+    @property
+    def errors(self) -> dict[int, BaseException]:
+        """Exceptions of the failed requests, keyed by position."""
+        return {
+            index: result
+            for index, result in enumerate(self.results)
+            if isinstance(result, BaseException)
+        }
+
+
 class OpenGovAPIStatusError(OpenGovAPIError):
     """HTTP 4xx/5xx responses."""
 
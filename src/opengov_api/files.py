@@ -52,7 +52,7 @@ upload_info = opengov_api.create_file_upload({
 from typing import Any
 
 
-from .base import build_url, handle_request_errors, parse_json_response
+from .base import build_url, dump_json, handle_request_errors, parse_json_response
 from .client import _get_client, get_base_url, get_community
 
 
@@ -81,11 +81,11 @@ def list_files() -> dict[str, Any]:
         >>> files = opengov_api.list_files()
         >>> print(files)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "files")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "files")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -116,11 +116,11 @@ def get_file(file_id: str) -> dict[str, Any]:
         >>> file = opengov_api.get_file("file-12345")
         >>> download_url = file["data"]["attributes"]["downloadUrl"]
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"files/{file_id}")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"files/{file_id}")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -165,8 +165,8 @@ def create_file_upload(data: dict[str, Any]) -> dict[str, Any]:
         >>> upload_url = upload_info["data"]["attributes"]["uploadUrl"]
         >>> file_id = upload_info["data"]["id"]
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "files")
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "files")
+    response = client.post(url, content=dump_json(data))
+    response.raise_for_status()
+    return parse_json_response(response)
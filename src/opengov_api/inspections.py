@@ -47,7 +47,7 @@ new_type = opengov_api.create_inspection_type("inspection-step-12345", {
 from typing import Any
 
 
-from .base import build_url, handle_request_errors, parse_json_response
+from .base import build_url, dump_json, handle_request_errors, parse_json_response
 from .client import _get_client, get_base_url, get_community
 
 
@@ -73,11 +73,11 @@ def list_inspection_steps() -> dict[str, Any]:
         >>> inspection_steps = opengov_api.list_inspection_steps()
         >>> print(inspection_steps)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "inspection-steps")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "inspection-steps")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -105,13 +105,13 @@ def get_inspection_step(inspection_step_id: str) -> dict[str, Any]:
         >>> inspection_step = opengov_api.get_inspection_step("inspection-step-12345")
         >>> print(inspection_step)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"inspection-steps/{inspection_step_id}"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(
+        get_base_url(), get_community(), f"inspection-steps/{inspection_step_id}"
+    )
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -146,13 +146,13 @@ def update_inspection_step(
         ...     }
         ... })
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"inspection-steps/{inspection_step_id}"
-        )
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(
+        get_base_url(), get_community(), f"inspection-steps/{inspection_step_id}"
+    )
+    response = client.patch(url, content=dump_json(data))
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -180,15 +180,15 @@ def list_inspection_types(inspection_step_id: str) -> dict[str, Any]:
         >>> types = opengov_api.list_inspection_types("inspection-step-12345")
         >>> print(types)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"inspection-steps/{inspection_step_id}/inspection-types",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(
+        get_base_url(),
+        get_community(),
+        f"inspection-steps/{inspection_step_id}/inspection-types",
+    )
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -223,12 +223,12 @@ def create_inspection_type(
         ...     }
         ... })
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"inspection-steps/{inspection_step_id}/inspection-types",
-        )
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(
+        get_base_url(),
+        get_community(),
+        f"inspection-steps/{inspection_step_id}/inspection-types",
+    )
+    response = client.post(url, content=dump_json(data))
+    response.raise_for_status()
+    return parse_json_response(response)
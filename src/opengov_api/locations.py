@@ -53,7 +53,7 @@ print(flags)
 from typing import Any
 
 
-from .base import build_url, handle_request_errors, parse_json_response
+from .base import build_url, dump_json, handle_request_errors, parse_json_response
 from .client import _get_client, get_base_url, get_community
 
 
@@ -79,11 +79,11 @@ def list_locations() -> dict[str, Any]:
         >>> locations = opengov_api.list_locations()
         >>> print(locations)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "locations")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "locations")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -111,11 +111,11 @@ def get_location(location_id: str) -> dict[str, Any]:
         >>> location = opengov_api.get_location("location-12345")
         >>> print(location)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"locations/{location_id}")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"locations/{location_id}")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -150,11 +150,11 @@ def create_location(data: dict[str, Any]) -> dict[str, Any]:
         ...     }
         ... })
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "locations")
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "locations")
+    response = client.post(url, content=dump_json(data))
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -187,11 +187,11 @@ def update_location(location_id: str, data: dict[str, Any]) -> dict[str, Any]:
         ...     }
         ... })
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"locations/{location_id}")
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"locations/{location_id}")
+    response = client.patch(url, content=dump_json(data))
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -214,10 +214,10 @@ def delete_location(location_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.delete_location("location-12345")
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"locations/{location_id}")
-        response = client.delete(url)
-        response.raise_for_status()
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"locations/{location_id}")
+    response = client.delete(url)
+    response.raise_for_status()
 
 
 @handle_request_errors
@@ -245,10 +245,8 @@ def list_location_flags(location_id: str) -> dict[str, Any]:
         >>> flags = opengov_api.list_location_flags("location-12345")
         >>> print(flags)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"locations/{location_id}/flags"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"locations/{location_id}/flags")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
@@ -0,0 +1,163 @@
+"""
+msgspec mirrors of the record and record-type response models.
+
+Used by ``list_records(fast=True)`` and ``list_record_types(fast=True)`` to
+decode a page straight from JSON bytes into structs, skipping pydantic
+validation entirely. Field names and pagination helpers match the pydantic
+models, so attribute access is the same either way. Requires the optional
+msgspec package.
+"""
+
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+import msgspec
+
+from .enums import RecordStatus
+
+T = TypeVar("T")
+
+
+class Links(msgspec.Struct, frozen=True):
+    """JSON:API Links object."""
+
+    self: str | None = None
+    related: str | None = None
+    first: str | None = None
+    prev: str | None = None
+    next: str | None = None
+    last: str | None = None
+
+
+class Meta(msgspec.Struct, frozen=True, rename="camel"):
+    """JSON:API Meta object for pagination."""
+
+    page: int | None = None
+    size: int | None = None
+    total_pages: int | None = None
+    total_records: int | None = None
+
+
+class RecordAttributes(msgspec.Struct, frozen=True, rename="camel"):
+    """Record attributes."""
+
+    number: str | None = None
+    hist_id: str | None = msgspec.field(default=None, name="histID")
+    hist_number: str | None = None
+    type_description: str | None = None
+    status: RecordStatus | None = None
+    is_enabled: bool | None = None
+    submitted_at: datetime | None = None
+    expires_at: datetime | None = None
+    renewal_of_record_id: str | None = msgspec.field(
+        default=None, name="renewalOfRecordID"
+    )
+    renewal_number: float | None = None
+    submitted_online: bool | None = None
+    renewal_submitted: bool | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    created_by: str | None = None
+    updated_by: str | None = None
+
+
+class RecordResource(msgspec.Struct, frozen=True):
+    """Record resource object."""
+
+    id: str
+    type: str
+    attributes: RecordAttributes
+    relationships: dict[str, Any] | None = None
+    links: dict[str, str] | None = None
+
+
+class RecordTypeAttributes(msgspec.Struct, frozen=True, rename="camel"):
+    """Record Type attributes."""
+
+    name: str | None = None
+    apply_access: str | None = None
+    is_enabled: bool | None = None
+    applicant: bool | None = None
+    location: bool | None = None
+    offline_payments: bool | None = None
+    view_access: str | None = None
+    allow_projects: bool | None = None
+    htmlcontent: str | None = None
+    status: str | None = None
+    renews: bool | None = None
+    order_no: int | None = None
+    ad_hoc_attachment_view_access: str | None = None
+    cloned_date: datetime | None = None
+    parent_record_type_id: str | None = msgspec.field(
+        default=None, name="parentRecordTypeID"
+    )
+    allow_point_locations: bool | None = None
+    allow_address_locations: bool | None = None
+    allow_segment_locations: bool | None = None
+    max_locations: int | None = None
+    point_locations_help_text: str | None = None
+    address_locations_help_text: str | None = None
+    segment_locations_help_text: str | None = None
+    allow_additional_locations: bool | None = None
+    automatic_expiration_date_extension: bool | None = None
+    automatic_project_records_expiration_date_extension: bool | None = None
+    disable_record_attachments: bool | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    created_by: str | None = None
+    updated_by: str | None = None
+
+
+class RecordTypeResource(msgspec.Struct, frozen=True):
+    """Record Type resource object."""
+
+    id: str
+    type: str
+    attributes: RecordTypeAttributes
+    relationships: dict[str, Any] | None = None
+    links: dict[str, str] | None = None
+
+
+class JSONAPIPage(msgspec.Struct, Generic[T], frozen=True):
+    """A page of resources with the JSONAPIResponse pagination helpers."""
+
+    data: list[T]
+    included: list[dict[str, Any]] | None = None
+    links: Links | None = None
+    meta: Meta | None = None
+
+    def has_next_page(self) -> bool:
+        """Check if there is a next page available."""
+        return self.links is not None and self.links.next is not None
+
+    def has_prev_page(self) -> bool:
+        """Check if there is a previous page available."""
+        return self.links is not None and self.links.prev is not None
+
+    def current_page(self) -> int | None:
+        """Get the current page number."""
+        return self.meta.page if self.meta else None
+
+    def page_size(self) -> int | None:
+        """Get the page size."""
+        return self.meta.size if self.meta else None
+
+    def total_pages(self) -> int | None:
+        """Get the total number of pages."""
+        return self.meta.total_pages if self.meta else None
+
+    def total_records(self) -> int | None:
+        """Get the total number of records across all pages."""
+        return self.meta.total_records if self.meta else None
+
+    def next_page_url(self) -> str | None:
+        """Get the URL for the next page."""
+        return self.links.next if self.links else None
+
+    def prev_page_url(self) -> str | None:
+        """Get the URL for the previous page."""
+        return self.links.prev if self.links else None
+
+
+RecordPage = JSONAPIPage[RecordResource]
+RecordTypePage = JSONAPIPage[RecordTypeResource]
@@ -28,7 +28,7 @@ class DocumentStepAttributes(BaseModel):
     last_updated_by_user_id: str | None = Field(None, alias="lastUpdatedByUserID")
     updated_at: datetime | None = Field(None, alias="updatedAt")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True, "defer_build": True}
 
 
 class DocumentStepResource(BaseModel):
@@ -39,3 +39,5 @@ class DocumentStepResource(BaseModel):
     attributes: DocumentStepAttributes
     relationships: dict[str, Any] | None = None
     links: dict[str, str] | None = None
+
+    model_config = {"frozen": True, "defer_build": True}
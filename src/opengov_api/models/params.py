@@ -190,64 +190,117 @@ class ListRecordsParams(BaseModel):
         Returns:
             Dictionary suitable for httpx params argument
         """
-        params: dict[str, Any] = {}
-
-        # Simple filters
-        if self.filter_number:
-            params["filter[number]"] = self.filter_number
-        if self.filter_hist_id:
-            params["filter[histID]"] = self.filter_hist_id
-        if self.filter_hist_number:
-            params["filter[histNumber]"] = self.filter_hist_number
-        if self.filter_type_id:
-            params["filter[typeID]"] = self.filter_type_id
-        if self.filter_project_id:
-            params["filter[projectID]"] = self.filter_project_id
-        if self.filter_status:
-            params["filter[status]"] = self.filter_status.value
-        if self.filter_is_enabled is not None:
-            params["filter[isEnabled]"] = self.filter_is_enabled
-        if self.filter_renewal_submitted is not None:
-            params["filter[renewalSubmitted]"] = self.filter_renewal_submitted
-        if self.filter_submitted_online is not None:
-            params["filter[submittedOnline]"] = self.filter_submitted_online
-        if self.filter_renewal_number:
-            params["filter[renewalNumber]"] = self.filter_renewal_number
-        if self.filter_renewal_of_record_id:
-            params["filter[renewalOfRecordID]"] = self.filter_renewal_of_record_id
-
-        # Date filters (can be simple date or range)
-        for field_name, param_value in [
-            ("createdAt", self.filter_created_at),
-            ("updatedAt", self.filter_updated_at),
-            ("submittedAt", self.filter_submitted_at),
-            ("expiresAt", self.filter_expires_at),
-        ]:
-            if param_value:
-                if isinstance(param_value, DateRangeFilter):
-                    params.update(param_value.to_query_params(field_name))
-                else:
-                    # Simple date/datetime
-                    params[f"filter[{field_name}]"] = (
-                        param_value.isoformat()
-                        if isinstance(param_value, (date, datetime))
-                        else param_value
-                    )
-
-        # Pagination
-        params["page[number]"] = self.page_number
-        params["page[size]"] = self.page_size
-
-        # JSON:API standard params
-        if self.include:
-            params["include"] = ",".join(self.include)
-        if self.fields:
-            for resource_type, field_list in self.fields.items():
-                params[f"fields[{resource_type}]"] = ",".join(field_list)
-        if self.sort:
-            params["sort"] = self.sort
-
-        return params
+        return _encode_records_params(
+            {name: getattr(self, f"filter_{name}") for name in _RECORD_FILTERS},
+            self.page_number,
+            self.page_size,
+            self.include,
+            self.fields,
+            self.sort,
+        )
+
+
+# list_records filter keyword -> (API field name, types accepted without
+# validation). Order matches the query string the model has always built.
+_RECORD_FILTERS: dict[str, tuple[str, type | tuple[type, ...]]] = {
+    "number": ("number", str),
+    "hist_id": ("histID", str),
+    "hist_number": ("histNumber", str),
+    "type_id": ("typeID", str),
+    "project_id": ("projectID", str),
+    "status": ("status", RecordStatus),
+    "is_enabled": ("isEnabled", bool),
+    "renewal_submitted": ("renewalSubmitted", bool),
+    "submitted_online": ("submittedOnline", bool),
+    "renewal_number": ("renewalNumber", str),
+    "renewal_of_record_id": ("renewalOfRecordID", str),
+    "created_at": ("createdAt", (date, DateRangeFilter)),
+    "updated_at": ("updatedAt", (date, DateRangeFilter)),
+    "submitted_at": ("submittedAt", (date, DateRangeFilter)),
+    "expires_at": ("expiresAt", (date, DateRangeFilter)),
+}
+
+
+def _encode_records_params(
+    filters: dict[str, Any],
+    page_number: int,
+    page_size: int,
+    include: list[str] | None,
+    fields: dict[str, list[str]] | None,
+    sort: str | None,
+) -> dict[str, Any]:
+    """Encode already-validated list_records params in bracket notation."""
+    params: dict[str, Any] = {}
+
+    for name, (api_name, _) in _RECORD_FILTERS.items():
+        value = filters[name]
+        # Empty strings are skipped like unset filters; False is a value
+        if value is None or value == "":
+            continue
+        if isinstance(value, DateRangeFilter):
+            params.update(value.to_query_params(api_name))
+        elif isinstance(value, RecordStatus):
+            params[f"filter[{api_name}]"] = value.value
+        elif isinstance(value, date):
+            params[f"filter[{api_name}]"] = value.isoformat()
+        else:
+            params[f"filter[{api_name}]"] = value
+
+    params.update(_encode_list_params(page_number, page_size, include, fields, sort))
+    return params
+
+
+def list_records_query_params(
+    *,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    **filters: Any,
+) -> dict[str, Any]:
+    """
+    Build list_records query params without constructing a model.
+
+    Produces the same dict as ListRecordsParams(...).to_query_params(),
+    with filters named as in list_records (``status``, ``created_at``,
+    ...). Filter, include, fields or sort values of any other type, and
+    pagination that is not an in-range int, go through the model so they
+    are coerced or raise its ValidationError as before.
+
+    Args:
+        page_number: Page number (1-based)
+        page_size: Number of items per page (1-100)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+        **filters: list_records filter keywords
+
+    Returns:
+        Dictionary suitable for httpx params argument
+
+    Raises:
+        TypeError: If a filter keyword is not a list_records filter
+    """
+    unknown = filters.keys() - _RECORD_FILTERS.keys()
+    if unknown:
+        raise TypeError(f"Unknown list_records filters: {sorted(unknown)}")
+    filters = {name: filters.get(name) for name in _RECORD_FILTERS}
+    if not _valid_list_params(page_number, page_size, include, fields, sort) or any(
+        value is not None and not isinstance(value, _RECORD_FILTERS[name][1])
+        for name, value in filters.items()
+    ):
+        return ListRecordsParams(
+            **{f"filter_{name}": value for name, value in filters.items()},
+            page_number=page_number,
+            page_size=page_size,
+            include=include,
+            fields=fields,
+            sort=sort,
+        ).to_query_params()
+    return _encode_records_params(
+        filters, page_number, page_size, include, fields, sort
+    )
 
 
 class BaseListParams(BaseModel):
@@ -274,22 +327,109 @@ class BaseListParams(BaseModel):
         Returns:
             Dictionary suitable for httpx params argument
         """
-        params: dict[str, Any] = {}
-
+        return _encode_list_params(
+            self.page_number, self.page_size, self.include, self.fields, self.sort
+        )
+
+
+def _valid_page(page_number: Any, page_size: Any) -> bool:
+    """Check pagination is exact ints in range, needing no validation."""
+    return (
+        type(page_number) is int
+        and type(page_size) is int
+        and page_number >= 1
+        and 1 <= page_size <= 100
+    )
+
+
+def _is_str_list(value: Any) -> bool:
+    """Check a value is a list or tuple of strings."""
+    return isinstance(value, (list, tuple)) and all(
+        isinstance(item, str) for item in value
+    )
+
+
+def _valid_list_params(
+    page_number: Any, page_size: Any, include: Any, fields: Any, sort: Any
+) -> bool:
+    """Check list params already have the types the model would produce."""
+    return (
+        _valid_page(page_number, page_size)
+        and (include is None or _is_str_list(include))
+        and (
+            fields is None
+            or (
+                isinstance(fields, dict)
+                and all(
+                    isinstance(key, str) and _is_str_list(value)
+                    for key, value in fields.items()
+                )
+            )
+        )
+        and (sort is None or isinstance(sort, str))
+    )
+
+
+def _encode_list_params(
+    page_number: int,
+    page_size: int,
+    include: list[str] | None,
+    fields: dict[str, list[str]] | None,
+    sort: str | None,
+) -> dict[str, Any]:
+    """Encode already-validated nested list params in bracket notation."""
+    params: dict[str, Any] = {
         # Pagination
-        params["page[number]"] = self.page_number
-        params["page[size]"] = self.page_size
+        "page[number]": page_number,
+        "page[size]": page_size,
+    }
 
-        # JSON:API standard params
-        if self.include:
-            params["include"] = ",".join(self.include)
-        if self.fields:
-            for resource_type, field_list in self.fields.items():
-                params[f"fields[{resource_type}]"] = ",".join(field_list)
-        if self.sort:
-            params["sort"] = self.sort
-
-        return params
+    # JSON:API standard params
+    if include:
+        params["include"] = ",".join(include)
+    if fields:
+        for resource_type, field_list in fields.items():
+            params[f"fields[{resource_type}]"] = ",".join(field_list)
+    if sort:
+        params["sort"] = sort
+
+    return params
+
+
+def list_query_params(
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> dict[str, Any]:
+    """
+    Build nested resource list query params without constructing a model.
+
+    Produces the same dict as BaseListParams(...).to_query_params().
+    Pagination that is not an in-range int, and include, fields or sort
+    values of any other type, go through the model so they are coerced or
+    raise its ValidationError as before.
+
+    Args:
+        page_number: Page number (1-based)
+        page_size: Number of items per page (1-100)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+
+    Returns:
+        Dictionary suitable for httpx params argument
+    """
+    if not _valid_list_params(page_number, page_size, include, fields, sort):
+        return BaseListParams(
+            page_number=page_number,
+            page_size=page_size,
+            include=include,
+            fields=fields,
+            sort=sort,
+        ).to_query_params()
+    return _encode_list_params(page_number, page_size, include, fields, sort)
 
 
 # Nested resource params - inherit from BaseListParams
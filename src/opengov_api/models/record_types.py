@@ -52,7 +52,7 @@ class RecordTypeAttributes(BaseModel):
     created_by: str | None = Field(None, alias="createdBy")
     updated_by: str | None = Field(None, alias="updatedBy")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True, "defer_build": True}
 
 
 class RecordTypeResource(BaseModel):
@@ -63,3 +63,5 @@ class RecordTypeResource(BaseModel):
     attributes: RecordTypeAttributes
     relationships: dict | None = None
     links: dict[str, str] | None = None
+
+    model_config = {"frozen": True, "defer_build": True}
@@ -2,12 +2,20 @@
 
 from datetime import datetime
 from typing import Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .enums import ChangeRequestStatus, RecordStatus, StepKind, WorkflowStepStatus
 
 
-class RecordAttributes(BaseModel):
+class _OGResourceBase(BaseModel):
+    """Shared configuration for response resources and their attributes."""
+
+    model_config = ConfigDict(
+        populate_by_name=True, frozen=True, extra="ignore", defer_build=True
+    )
+
+
+class RecordAttributes(_OGResourceBase):
     """Record attributes."""
 
     number: str | None = None
@@ -27,10 +35,8 @@ class RecordAttributes(BaseModel):
     created_by: str | None = Field(None, alias="createdBy")
     updated_by: str | None = Field(None, alias="updatedBy")
 
-    model_config = {"populate_by_name": True}
 
-
-class RecordResource(BaseModel):
+class RecordResource(_OGResourceBase):
     """Record resource object."""
 
     id: str
@@ -47,6 +53,8 @@ class RecordCreateAttributes(BaseModel):
     description: str | None = None
     # Add other required/optional fields based on your API needs
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class RecordCreateData(BaseModel):
     """Data wrapper for creating a record."""
@@ -55,12 +63,16 @@ class RecordCreateData(BaseModel):
     attributes: RecordCreateAttributes
     relationships: dict[str, Any] | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class RecordCreateRequest(BaseModel):
     """Request body for creating a record."""
 
     data: RecordCreateData
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class RecordUpdateAttributes(BaseModel):
     """Attributes for updating a record."""
@@ -70,6 +82,8 @@ class RecordUpdateAttributes(BaseModel):
     status: RecordStatus | None = None
     # Add other updatable fields
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class RecordUpdateData(BaseModel):
     """Data wrapper for updating a record."""
@@ -77,15 +91,19 @@ class RecordUpdateData(BaseModel):
     type: str = "records"
     attributes: RecordUpdateAttributes
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class RecordUpdateRequest(BaseModel):
     """Request body for updating a record."""
 
     data: RecordUpdateData
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # Guest models
-class GuestAttributes(BaseModel):
+class GuestAttributes(_OGResourceBase):
     """Guest attributes."""
 
     first_name: str | None = Field(None, alias="firstName")
@@ -98,10 +116,8 @@ class GuestAttributes(BaseModel):
     state: str | None = None
     zip_code: str | None = Field(None, alias="zip")
 
-    model_config = {"populate_by_name": True}
 
-
-class GuestResource(BaseModel):
+class GuestResource(_OGResourceBase):
     """Guest resource object."""
 
     id: str
@@ -112,7 +128,7 @@ class GuestResource(BaseModel):
 
 
 # Location models
-class LocationAttributes(BaseModel):
+class LocationAttributes(_OGResourceBase):
     """Location attributes."""
 
     name: str | None = None
@@ -158,10 +174,8 @@ class LocationAttributes(BaseModel):
     updated_at: datetime | None = Field(None, alias="updatedAt")
     gis_id: str | None = Field(None, alias="gisID")
 
-    model_config = {"populate_by_name": True}
-
 
-class LocationResource(BaseModel):
+class LocationResource(_OGResourceBase):
     """Location resource object."""
 
     id: str
@@ -172,7 +186,7 @@ class LocationResource(BaseModel):
 
 
 # Attachment models
-class AttachmentAttributes(BaseModel):
+class AttachmentAttributes(_OGResourceBase):
     """Record attachment attributes."""
 
     name: str | None = None
@@ -187,10 +201,8 @@ class AttachmentAttributes(BaseModel):
     created_by: str | None = Field(None, alias="createdBy")
     updated_by: str | None = Field(None, alias="updatedBy")
 
-    model_config = {"populate_by_name": True}
-
 
-class AttachmentResource(BaseModel):
+class AttachmentResource(_OGResourceBase):
     """Attachment resource object."""
 
     id: str
@@ -201,7 +213,7 @@ class AttachmentResource(BaseModel):
 
 
 # Workflow Step models
-class WorkflowStepAttributes(BaseModel):
+class WorkflowStepAttributes(_OGResourceBase):
     """Workflow step attributes."""
 
     label: str | None = None
@@ -212,8 +224,6 @@ class WorkflowStepAttributes(BaseModel):
     activated_at: datetime | None = Field(None, alias="activatedAt")
     completed_at: datetime | None = Field(None, alias="completedAt")
 
-    model_config = {"populate_by_name": True}
-
     @field_validator("activated_at", "completed_at", mode="before")
     @classmethod
     def set_empty_datetime_to_none(cls, v):
@@ -222,7 +232,7 @@ class WorkflowStepAttributes(BaseModel):
         return v
 
 
-class WorkflowStepResource(BaseModel):
+class WorkflowStepResource(_OGResourceBase):
     """Workflow step resource object."""
 
     id: str
@@ -233,7 +243,7 @@ class WorkflowStepResource(BaseModel):
 
 
 # Workflow Step Comment models
-class WorkflowStepCommentAttributes(BaseModel):
+class WorkflowStepCommentAttributes(_OGResourceBase):
     """Workflow step comment attributes."""
 
     comment_type: str | None = Field(None, alias="commentType")
@@ -241,10 +251,8 @@ class WorkflowStepCommentAttributes(BaseModel):
     created_by: str | None = Field(None, alias="createdBy")
     created_at: datetime | None = Field(None, alias="createdAt")
 
-    model_config = {"populate_by_name": True}
-
 
-class WorkflowStepCommentResource(BaseModel):
+class WorkflowStepCommentResource(_OGResourceBase):
     """Workflow step comment resource object."""
 
     id: str
@@ -255,16 +263,14 @@ class WorkflowStepCommentResource(BaseModel):
 
 
 # Collection models
-class CollectionAttributes(BaseModel):
+class CollectionAttributes(_OGResourceBase):
     """Collection attributes."""
 
     label: str | None = None
     ordinal: int | None = None
 
-    model_config = {"populate_by_name": True}
 
-
-class CollectionResource(BaseModel):
+class CollectionResource(_OGResourceBase):
     """Collection resource object."""
 
     id: str
@@ -275,23 +281,21 @@ class CollectionResource(BaseModel):
 
 
 # Form models
-class FormResource(BaseModel):
+class FormResource(_OGResourceBase):
     """Form resource object. Note: Forms use a non-standard API response format."""
 
     fields: list[dict[str, Any]]
 
 
 # Applicant models
-class ApplicantAttributes(BaseModel):
+class ApplicantAttributes(_OGResourceBase):
     """Applicant attributes."""
 
     first_name: str | None = Field(None, alias="firstName")
     last_name: str | None = Field(None, alias="lastName")
 
-    model_config = {"populate_by_name": True}
-
 
-class ApplicantResource(BaseModel):
+class ApplicantResource(_OGResourceBase):
     """Applicant resource object."""
 
     id: str
@@ -302,7 +306,7 @@ class ApplicantResource(BaseModel):
 
 
 # Change Request models
-class ChangeRequestAttributes(BaseModel):
+class ChangeRequestAttributes(_OGResourceBase):
     """Change request attributes."""
 
     overall_note: str | None = Field(None, alias="overallNote")
@@ -315,10 +319,8 @@ class ChangeRequestAttributes(BaseModel):
     form_fields: list[dict[str, Any]] | None = Field(None, alias="formFields")
     attachments: list[dict[str, Any]] | None = None
 
-    model_config = {"populate_by_name": True}
 
-
-class ChangeRequestResource(BaseModel):
+class ChangeRequestResource(_OGResourceBase):
     """Change request resource object."""
 
     id: str
@@ -329,15 +331,13 @@ class ChangeRequestResource(BaseModel):
 
 
 # Collection Entry models
-class CollectionEntryAttributes(BaseModel):
+class CollectionEntryAttributes(_OGResourceBase):
     """Collection entry attributes."""
 
     fields: list[dict[str, Any]] | None = None
 
-    model_config = {"populate_by_name": True}
-
 
-class CollectionEntryResource(BaseModel):
+class CollectionEntryResource(_OGResourceBase):
     """Collection entry resource object."""
 
     id: str
@@ -57,11 +57,11 @@ def list_projects() -> dict[str, Any]:
         >>> projects = opengov_api.list_projects()
         >>> print(projects)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "projects")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "projects")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -89,8 +89,8 @@ def get_project(project_id: str) -> dict[str, Any]:
         >>> project = opengov_api.get_project("project-12345")
         >>> print(project)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"projects/{project_id}")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"projects/{project_id}")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
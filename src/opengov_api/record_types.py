@@ -22,23 +22,122 @@ print(record_types)
 record_type = opengov_api.get_record_type("rt-456789")
 print(record_type)
 
+# Repeated lookups by ID are served from a short-lived cache;
+# clear it after changing record-type configuration
+opengov_api.clear_record_type_cache()
+
 # Record types define the configuration for permits, licenses, and other records
 # They specify required fields, workflows, fees, and other settings
 ```
 """
 
-from typing import Any, Iterator
-
-from .base import build_url, handle_request_errors, parse_json_response
-from .client import _get_client, get_base_url, get_community
+import sys
+from typing import Any, Iterator, Literal, overload
+
+import httpx
+from pydantic import TypeAdapter
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import msgspec
+
+    from .models import _msgspec_models
+except ImportError:  # pragma: no cover - optional dependency
+    _RT_FAST_DECODER = None
+else:
+    _RT_FAST_DECODER = msgspec.json.Decoder(_msgspec_models.RecordTypePage)
+
+from .base import (
+    decode_struct_response,
+    handle_request_errors,
+    iter_prefetched_pages,
+    iter_streamed_items,
+    open_stream,
+    parse_json_response,
+    validate_json_response,
+)
+from .cache import TTLCache, cached_response
+from .client import _get_client, _record_types_prefix
 from .models import (
     JSONAPIResponse,
     Links,
     ListRecordTypesParams,
     Meta,
+    RecordTypeAttributes,
     RecordTypeResource,
 )
 
+# Validates a whole page straight from the response bytes
+_JSONAPI_RT_ADAPTER = TypeAdapter(JSONAPIResponse[RecordTypeResource])
+
+# Query keys for the nested list endpoints; the default first page is shared
+_PN_KEY = sys.intern("page[number]")
+_PS_KEY = sys.intern("page[size]")
+_DEFAULT_PAGE_PARAMS = ((_PN_KEY, 1), (_PS_KEY, 20))
+
+# Record-type configuration rarely changes, so single-resource lookups by ID
+# are served from memory for a few minutes
+_record_type_cache = TTLCache(maxsize=1024, ttl=300.0)
+
+
+def clear_record_type_cache() -> None:
+    """
+    Clear cached record-type lookups.
+
+    Results of get_record_type and the get_record_type_* template getters
+    are cached for five minutes. Call this to force fresh data, e.g. after
+    editing record-type configuration.
+
+    Example:
+        >>> import opengov_api
+        >>> opengov_api.clear_record_type_cache()
+    """
+    _record_type_cache.clear()
+
+
+def _get_json(
+    path: str, params: tuple[tuple[str, int], ...] | None = None
+) -> dict[str, Any]:
+    """GET a path under record-types and return the decoded JSON body."""
+    client = _get_client()
+    url = f"{_record_types_prefix()}/{path}"
+    response = client.get(url, params=params)
+    response.raise_for_status()
+    return parse_json_response(response)
+
+
+def _paging(page_number: int, page_size: int) -> tuple[tuple[str, int], ...]:
+    """Build pagination query params, reusing the default first page."""
+    if page_number == 1 and page_size == 20:
+        return _DEFAULT_PAGE_PARAMS
+    return ((_PN_KEY, page_number), (_PS_KEY, page_size))
+
+
+@overload
+def list_record_types(
+    *,
+    department_id: str | None = None,
+    page_number: int = 1,
+    page_size: int = 20,
+    validate: bool = True,
+    fast: Literal[False] = False,
+) -> JSONAPIResponse[RecordTypeResource]: ...
+
+
+@overload
+def list_record_types(
+    *,
+    department_id: str | None = None,
+    page_number: int = 1,
+    page_size: int = 20,
+    validate: bool = True,
+    fast: Literal[True],
+) -> "_msgspec_models.RecordTypePage | JSONAPIResponse[RecordTypeResource]": ...
+
 
 @handle_request_errors
 def list_record_types(
@@ -46,7 +145,9 @@ def list_record_types(
     department_id: str | None = None,
     page_number: int = 1,
     page_size: int = 20,
-) -> JSONAPIResponse[RecordTypeResource]:
+    validate: bool = True,
+    fast: bool = False,
+) -> "JSONAPIResponse[RecordTypeResource] | _msgspec_models.RecordTypePage":
     """
     List record types for the configured community with pagination.
 
@@ -57,9 +158,20 @@ def list_record_types(
         department_id: Filter by department ID
         page_number: Page number (1-based, default 1)
         page_size: Number of records per page (1-100, default 20)
+        validate: Validate the response against the models (default True).
+            Pass False for read-only paths that trust the API: models are
+            built with model_construct, which is much faster but performs no
+            type coercion, so datetimes stay ISO strings and unexpected
+            values are not rejected.
+        fast: Decode the page with msgspec into lightweight frozen structs
+            (default False). Attribute names and pagination helpers match
+            the pydantic models. Requires the optional msgspec package
+            (``fast`` extra); without it the regular path is used. Takes
+            precedence over ``validate``.
 
     Returns:
         JSONAPIResponse containing RecordTypeResource objects with pagination info
+        (a msgspec RecordTypePage with the same interface when fast=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -67,6 +179,8 @@ def list_record_types(
         OpenGovAPITimeoutError: If request times out
         OpenGovAPIStatusError: If API returns an error status code
         OpenGovResponseParseError: If response cannot be parsed
+        msgspec.ValidationError: If fast=True and the page does not match the
+            struct types
 
     Example:
         >>> import opengov_api
@@ -90,19 +204,37 @@ def list_record_types(
         page_size=page_size,
     )
 
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "record-types")
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        # Parse into typed response
-        return JSONAPIResponse[RecordTypeResource](
-            data=[RecordTypeResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    client = _get_client()
+    url = _record_types_prefix()
+    response = client.get(url, params=params_model.to_query_params())
+    response.raise_for_status()
+    if fast and _RT_FAST_DECODER is not None:
+        return decode_struct_response(response, _RT_FAST_DECODER)
+    if not validate:
+        return _construct_record_types_page(parse_json_response(response))
+    return validate_json_response(response, _JSONAPI_RT_ADAPTER)
+
+
+def _construct_record_types_page(
+    data: dict[str, Any],
+) -> JSONAPIResponse[RecordTypeResource]:
+    """Assemble a record-types page from trusted JSON without validation."""
+    return JSONAPIResponse[RecordTypeResource].model_construct(
+        data=[
+            RecordTypeResource.model_construct(
+                **{
+                    **item,
+                    "attributes": RecordTypeAttributes.model_construct(
+                        **item.get("attributes", {})
+                    ),
+                }
+            )
+            for item in data["data"]
+        ],
+        included=data.get("included"),
+        links=Links.model_construct(**links) if (links := data.get("links")) else None,
+        meta=Meta.model_construct(**meta) if (meta := data.get("meta")) else None,
+    )
 
 
 @handle_request_errors
@@ -110,16 +242,23 @@ def iter_record_types(
     *,
     department_id: str | None = None,
     page_size: int = 100,
+    stream: bool = False,
 ) -> Iterator[RecordTypeResource]:
     """
     Iterate through all record types automatically handling pagination.
 
     This generator function fetches all pages automatically, yielding
-    individual record types one at a time.
+    individual record types one at a time. The next page is fetched in
+    the background while the current one is being consumed.
 
     Args:
         department_id: Filter by department ID
         page_size: Number of records per page (1-100, default 100 for efficiency)
+        stream: Parse each page incrementally as it downloads (default False).
+            Record types are yielded before the whole page has arrived and
+            the raw page is never held in memory. Requires the optional
+            ``ijson`` package (``stream`` extra); without it the regular
+            path is used. Streamed pages are not prefetched.
 
     Yields:
         RecordTypeResource objects one at a time across all pages
@@ -128,14 +267,29 @@ def iter_record_types(
         >>> for record_type in opengov_api.iter_record_types():
         ...     print(f"{record_type.attributes.name}")
     """
-    page = 1
-    while True:
-        response = list_record_types(
+    if stream and ijson is not None:
+
+        def open_page(page: int) -> httpx.Response:
+            params_model = ListRecordTypesParams(
+                filter_department_id=department_id,
+                page_number=page,
+                page_size=page_size,
+            )
+            return open_stream(
+                _get_client(), _record_types_prefix(), params_model.to_query_params()
+            )
+
+        yield from iter_streamed_items(open_page, RecordTypeResource)
+        return
+
+    def fetch_page(page: int) -> JSONAPIResponse[RecordTypeResource]:
+        return list_record_types(
             department_id=department_id,
             page_number=page,
             page_size=page_size,
         )
 
+    for response in iter_prefetched_pages(fetch_page):
         # Yield all items from this page
         if isinstance(response.data, list):
             for item in response.data:
@@ -143,13 +297,8 @@ def iter_record_types(
         else:
             yield response.data
 
-        # Check if there's a next page
-        if not response.has_next_page():
-            break
-
-        page += 1
-
 
+@cached_response(_record_type_cache)
 @handle_request_errors
 def get_record_type(record_type_id: str) -> dict[str, Any]:
     """
@@ -176,13 +325,7 @@ def get_record_type(record_type_id: str) -> dict[str, Any]:
         >>> record_type = opengov_api.get_record_type("rt-456789")
         >>> print(record_type)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"record-types/{record_type_id}"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(record_type_id)
 
 
 # Nested resource endpoints
@@ -210,18 +353,10 @@ def list_record_type_attachments(
         >>> attachments = opengov_api.list_record_type_attachments("rt-456789")
         >>> print(attachments)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/{record_type_id}/attachments",
-        )
-        params = {"page[number]": page_number, "page[size]": page_size}
-        response = client.get(url, params=params)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"{record_type_id}/attachments", _paging(page_number, page_size))
 
 
+@cached_response(_record_type_cache)
 @handle_request_errors
 def get_record_type_attachment(attachment_id: str) -> dict[str, Any]:
     """
@@ -237,15 +372,7 @@ def get_record_type_attachment(attachment_id: str) -> dict[str, Any]:
         >>> attachment = opengov_api.get_record_type_attachment("rt-attachment-334455")
         >>> print(attachment)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/attachments/{attachment_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"attachments/{attachment_id}")
 
 
 @handle_request_errors
@@ -270,18 +397,13 @@ def list_record_type_document_templates(
         >>> docs = opengov_api.list_record_type_document_templates("rt-456789")
         >>> print(docs)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/{record_type_id}/document-templates",
-        )
-        params = {"page[number]": page_number, "page[size]": page_size}
-        response = client.get(url, params=params)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(
+        f"{record_type_id}/document-templates",
+        _paging(page_number, page_size),
+    )
 
 
+@cached_response(_record_type_cache)
 @handle_request_errors
 def get_record_type_document_template(document_template_id: str) -> dict[str, Any]:
     """
@@ -297,15 +419,7 @@ def get_record_type_document_template(document_template_id: str) -> dict[str, An
         >>> doc = opengov_api.get_record_type_document_template("rt-document-556677")
         >>> print(doc)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/document-templates/{document_template_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"document-templates/{document_template_id}")
 
 
 @handle_request_errors
@@ -330,18 +444,10 @@ def list_record_type_fees(
         >>> fees = opengov_api.list_record_type_fees("rt-456789")
         >>> print(fees)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/{record_type_id}/fees",
-        )
-        params = {"page[number]": page_number, "page[size]": page_size}
-        response = client.get(url, params=params)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"{record_type_id}/fees", _paging(page_number, page_size))
 
 
+@cached_response(_record_type_cache)
 @handle_request_errors
 def get_record_type_fee(fee_id: str) -> dict[str, Any]:
     """
@@ -357,17 +463,10 @@ def get_record_type_fee(fee_id: str) -> dict[str, Any]:
         >>> fee = opengov_api.get_record_type_fee("record-type-fees-1000013")
         >>> print(fee)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/fees/{fee_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"fees/{fee_id}")
 
 
+@cached_response(_record_type_cache)
 @handle_request_errors
 def get_record_type_form(record_type_id: str) -> dict[str, Any]:
     """
@@ -383,15 +482,7 @@ def get_record_type_form(record_type_id: str) -> dict[str, Any]:
         >>> form = opengov_api.get_record_type_form("rt-456789")
         >>> print(form)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/{record_type_id}/form",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"{record_type_id}/form")
 
 
 @handle_request_errors
@@ -416,18 +507,10 @@ def list_record_type_workflow(
         >>> workflow = opengov_api.list_record_type_workflow("rt-456789")
         >>> print(workflow)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/{record_type_id}/workflow",
-        )
-        params = {"page[number]": page_number, "page[size]": page_size}
-        response = client.get(url, params=params)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"{record_type_id}/workflow", _paging(page_number, page_size))
 
 
+@cached_response(_record_type_cache)
 @handle_request_errors
 def get_record_type_workflow_step(
     record_type_id: str, workflow_template_id: str
@@ -446,12 +529,4 @@ def get_record_type_workflow_step(
         >>> step = opengov_api.get_record_type_workflow_step("rt-456789", "rt-template-step-101112")
         >>> print(step)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"record-types/{record_type_id}/workflow/{workflow_template_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    return _get_json(f"{record_type_id}/workflow/{workflow_template_id}")
@@ -50,11 +50,49 @@ opengov_api.create_record_workflow_step_comment(
 ```
 """
 
+import asyncio
+import itertools
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Iterator
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    TypedDict,
+    TypeVar,
+    overload,
+)
 
-from .base import build_url, handle_request_errors, parse_json_response
-from .client import _get_client, get_base_url, get_community
+import httpx
+from pydantic import TypeAdapter
+
+from .base import (
+    decode_struct_response,
+    dump_json,
+    encode_request_body,
+    handle_async_request_errors,
+    handle_request_errors,
+    iter_prefetched_pages,
+    iter_streamed_items,
+    open_stream,
+    parse_json_response,
+    parse_url,
+    raw_has_next_page,
+    send_request,
+    validate_json_response,
+)
+from .cache import SingleFlight, TTLCache, conditional_get
+from .client import (
+    _get_async_client,
+    _get_client,
+    _get_shared_async_client,
+    _records_prefix,
+)
+from .exceptions import OpenGovBulkRequestError
 from .models import (
     ApplicantResource,
     AttachmentResource,
@@ -65,24 +103,123 @@ from .models import (
     FormResource,
     GuestResource,
     JSONAPIResponse,
-    Links,
-    ListRecordAdditionalLocationsParams,
-    ListRecordAttachmentsParams,
-    ListRecordCollectionsParams,
-    ListRecordGuestsParams,
-    ListRecordsParams,
-    ListRecordWorkflowStepCommentsParams,
-    ListRecordWorkflowStepsParams,
     LocationResource,
-    Meta,
+    RecordCreateRequest,
     RecordResource,
     RecordStatus,
+    RecordUpdateRequest,
     WorkflowStepCommentResource,
     WorkflowStepResource,
 )
+from .models.params import list_query_params, list_records_query_params
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import msgspec
+
+    from .models import _msgspec_models
+except ImportError:  # pragma: no cover - optional dependency
+    _RECORDS_FAST_DECODER = None
+else:
+    _RECORDS_FAST_DECODER = msgspec.json.Decoder(_msgspec_models.RecordPage)
+
+
+class _FormDocument(TypedDict):
+    """Forms use a non-standard format: {"data": {"fields": [...]}}."""
+
+    data: FormResource
+
+
+@dataclass
+class RecordBundle:
+    """
+    A record's workflow steps, their comments and its collections.
+
+    Attributes:
+        workflow_steps: All workflow steps on the record
+        comments: Comments for each workflow step, keyed by step ID
+        collections: All collections on the record
+    """
+
+    workflow_steps: list[WorkflowStepResource] = field(default_factory=list)
+    comments: dict[str, list[WorkflowStepCommentResource]] = field(default_factory=dict)
+    collections: list[CollectionResource] = field(default_factory=list)
+
+
+# Validate whole responses straight from the response bytes
+_RECORD_ADAPTER = TypeAdapter(JSONAPIResponse[RecordResource])
+_APPLICANT_ADAPTER = TypeAdapter(JSONAPIResponse[ApplicantResource])
+_FORM_ADAPTER = TypeAdapter(_FormDocument)
+_GUEST_ADAPTER = TypeAdapter(JSONAPIResponse[GuestResource])
+_LOCATION_ADAPTER = TypeAdapter(JSONAPIResponse[LocationResource])
+_ATTACHMENT_ADAPTER = TypeAdapter(JSONAPIResponse[AttachmentResource])
+_WORKFLOW_STEP_ADAPTER = TypeAdapter(JSONAPIResponse[WorkflowStepResource])
+_COMMENT_ADAPTER = TypeAdapter(JSONAPIResponse[WorkflowStepCommentResource])
+_COLLECTION_ADAPTER = TypeAdapter(JSONAPIResponse[CollectionResource])
+_COLLECTION_ENTRY_ADAPTER = TypeAdapter(JSONAPIResponse[CollectionEntryResource])
+_CHANGE_REQUEST_ADAPTER = TypeAdapter(JSONAPIResponse[ChangeRequestResource])
+
+# Per-record list endpoints that iter_records_with_relations can fetch
+_RELATION_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    "guests": _GUEST_ADAPTER,
+    "additional-locations": _LOCATION_ADAPTER,
+    "attachments": _ATTACHMENT_ADAPTER,
+    "workflow-steps": _WORKFLOW_STEP_ADAPTER,
+    "collections": _COLLECTION_ADAPTER,
+}
+
+T = TypeVar("T")
+
+# Single records, forms, applicants and their sub-resources are often polled;
+# the last response for each URL is kept with its ETag and revalidated with
+# If-None-Match
+_record_etag_cache = TTLCache(maxsize=1024, ttl=3600.0)
+# Concurrent lookups of the same URL (e.g. from worker threads) share one request
+_record_inflight = SingleFlight()
+
+
+def clear_record_cache() -> None:
+    """
+    Clear cached record lookups.
+
+    get_record, get_record_form, get_record_applicant and the single guest,
+    location, attachment, change-request, workflow-step, comment and
+    collection lookups keep the last response for each URL with its ETag
+    and revalidate it on the next call, so a 304 Not Modified answer is
+    served without parsing a body.
+    Call this to drop those entries and free their memory.
+
+    Example:
+        >>> import opengov_api
+        >>> opengov_api.clear_record_cache()
+    """
+    _record_etag_cache.clear()
 
 
 @handle_request_errors
+def _get_cached_resource(
+    url: str, adapter: TypeAdapter[JSONAPIResponse[T]], raw: bool = False
+) -> JSONAPIResponse[T] | dict[str, Any]:
+    """GET a single resource, revalidating the cached model by its ETag."""
+    client = _get_client()
+    if raw:
+        response = client.get(parse_url(url))
+        response.raise_for_status()
+        return parse_json_response(response)
+    return conditional_get(
+        client,
+        url,
+        _record_etag_cache,
+        lambda response: validate_json_response(response, adapter),
+        _record_inflight,
+    )
+
+
+@overload
 def list_records(
     *,
     number: str | None = None,
@@ -105,7 +242,92 @@ def list_records(
     include: list[str] | None = None,
     fields: dict[str, list[str]] | None = None,
     sort: str | None = None,
-) -> JSONAPIResponse[RecordResource]:
+    fast: Literal[False] = False,
+    raw: Literal[False] = False,
+) -> JSONAPIResponse[RecordResource]: ...
+
+
+@overload
+def list_records(
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    fast: Literal[True],
+    raw: Literal[False] = False,
+) -> "_msgspec_models.RecordPage | JSONAPIResponse[RecordResource]": ...
+
+
+@overload
+def list_records(
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    fast: bool = False,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def list_records(
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    fast: bool = False,
+    raw: bool = False,
+) -> "JSONAPIResponse[RecordResource] | _msgspec_models.RecordPage | dict[str, Any]":
     """
     List records for the configured community with pagination.
 
@@ -130,9 +352,17 @@ def list_records(
         include: List of related resources to include
         fields: Sparse fieldsets dict (e.g., {"records": ["name", "status"]})
         sort: Sort order (e.g., "name", "-createdAt")
+        fast: Decode the page with msgspec into lightweight frozen structs
+            (default False). Attribute names and pagination helpers match
+            the pydantic models. Requires the optional msgspec package
+            (``fast`` extra); without it the regular path is used.
+        raw: Return the parsed JSON document as plain dicts without
+            building any models (default False). Takes precedence over fast.
 
     Returns:
         JSONAPIResponse containing RecordResource objects with pagination info
+        (a msgspec RecordPage with the same interface when fast=True, or
+        the parsed JSON:API document as a dict when raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -140,6 +370,8 @@ def list_records(
         OpenGovAPITimeoutError: If request times out
         OpenGovAPIStatusError: If API returns an error status code
         OpenGovResponseParseError: If response cannot be parsed
+        msgspec.ValidationError: If fast=True and a page does not match the
+            struct types
 
     Example:
         >>> import opengov_api
@@ -176,43 +408,162 @@ def list_records(
         ...         page_number=response.current_page() + 1
         ...     )
     """
-    # Build params using ListRecordsParams model
-    params_model = ListRecordsParams(
-        filter_number=number,
-        filter_hist_id=hist_id,
-        filter_hist_number=hist_number,
-        filter_type_id=type_id,
-        filter_project_id=project_id,
-        filter_status=status,
-        filter_created_at=created_at,
-        filter_updated_at=updated_at,
-        filter_submitted_at=submitted_at,
-        filter_expires_at=expires_at,
-        filter_is_enabled=is_enabled,
-        filter_renewal_submitted=renewal_submitted,
-        filter_submitted_online=submitted_online,
-        filter_renewal_number=renewal_number,
-        filter_renewal_of_record_id=renewal_of_record_id,
+    params = list_records_query_params(
+        number=number,
+        hist_id=hist_id,
+        hist_number=hist_number,
+        type_id=type_id,
+        project_id=project_id,
+        status=status,
+        created_at=created_at,
+        updated_at=updated_at,
+        submitted_at=submitted_at,
+        expires_at=expires_at,
+        is_enabled=is_enabled,
+        renewal_submitted=renewal_submitted,
+        submitted_online=submitted_online,
+        renewal_number=renewal_number,
+        renewal_of_record_id=renewal_of_record_id,
         page_number=page_number,
         page_size=page_size,
         include=include,
         fields=fields,
         sort=sort,
     )
+    if raw:
+        return _fetch_raw_page(_records_prefix(), params)
+    return _fetch_records_page(params, fast)
 
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "records")
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        # Parse into typed response
-        return JSONAPIResponse[RecordResource](
-            data=[RecordResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+
+def _fetch_records_page(
+    params: dict[str, Any], fast: bool = False
+) -> JSONAPIResponse[RecordResource]:
+    """GET one page of records with already-encoded query params."""
+    response = send_request(_get_client(), "GET", _records_prefix(), params=params)
+    if fast and _RECORDS_FAST_DECODER is not None:
+        return decode_struct_response(response, _RECORDS_FAST_DECODER)
+    return validate_json_response(response, _RECORD_ADAPTER)
+
+
+def _fetch_raw_page(url: str, params: dict[str, Any]) -> dict[str, Any]:
+    """GET one page and return the parsed JSON without building models."""
+    response = send_request(_get_client(), "GET", url, params=params)
+    return parse_json_response(response)
+
+
+def _iter_raw_items(
+    url: str, build_params: Callable[[int], dict[str, Any]]
+) -> Iterator[dict[str, Any]]:
+    """Yield every item dict of a paginated list endpoint, unvalidated."""
+
+    def fetch_page(page: int) -> dict[str, Any]:
+        return _fetch_raw_page(url, build_params(page))
+
+    for document in iter_prefetched_pages(fetch_page, raw_has_next_page):
+        yield from document["data"]
+
+
+def _iter_pages(
+    url: str,
+    build_params: Callable[[int], dict[str, Any]],
+    adapter: TypeAdapter[JSONAPIResponse[T]],
+    raw: bool = False,
+) -> Iterator[T | dict[str, Any]]:
+    """Yield every item of a paginated list endpoint, prefetching pages."""
+    if raw:
+        yield from _iter_raw_items(url, build_params)
+        return
+
+    def fetch_page(page: int) -> JSONAPIResponse[T]:
+        response = send_request(_get_client(), "GET", url, params=build_params(page))
+        return validate_json_response(response, adapter)
+
+    for response in iter_prefetched_pages(fetch_page):
+        yield from response.data
+
+
+@overload
+def iter_records(
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    fast: Literal[False] = False,
+    stream: bool = False,
+    raw: Literal[False] = False,
+) -> Iterator[RecordResource]: ...
+
+
+@overload
+def iter_records(
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    fast: Literal[True],
+    stream: bool = False,
+    raw: Literal[False] = False,
+) -> Iterator["_msgspec_models.RecordResource | RecordResource"]: ...
+
+
+@overload
+def iter_records(
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    fast: bool = False,
+    stream: bool = False,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
 
 
 @handle_request_errors
@@ -237,20 +588,34 @@ def iter_records(
     include: list[str] | None = None,
     fields: dict[str, list[str]] | None = None,
     sort: str | None = None,
-) -> Iterator[RecordResource]:
+    fast: bool = False,
+    stream: bool = False,
+    raw: bool = False,
+) -> Iterator["RecordResource | _msgspec_models.RecordResource | dict[str, Any]"]:
     """
     Iterate through all records automatically handling pagination.
 
     This generator function fetches all pages automatically, yielding
     individual records one at a time. Use this when you want to process
-    all matching records without manually handling pagination.
+    all matching records without manually handling pagination. The next
+    page is fetched in the background while the current one is consumed.
 
     Args:
         Same as list_records, but page_number is managed automatically
-        and page_size defaults to 100 for efficiency
+        and page_size defaults to 100 for efficiency. With fast=True,
+        records are yielded as msgspec structs. With stream=True, each
+        page is parsed incrementally as it downloads, so records are
+        yielded before the whole page has arrived and large pages (e.g.
+        with include) are never held in memory at once. Streaming needs
+        the optional ijson package (``stream`` extra), takes precedence
+        over fast, and does not prefetch; without ijson the regular path
+        is used. With raw=True, records are yielded as the plain dicts
+        parsed from each page, skipping model construction entirely;
+        raw takes precedence over fast and stream.
 
     Yields:
-        RecordResource objects one at a time across all pages
+        RecordResource objects one at a time across all pages (dicts when
+        raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -258,6 +623,8 @@ def iter_records(
         OpenGovAPITimeoutError: If request times out
         OpenGovAPIStatusError: If API returns an error status code
         OpenGovResponseParseError: If response cannot be parsed
+        msgspec.ValidationError: If fast=True and a page does not match the
+            struct types
 
     Example:
         >>> import opengov_api
@@ -280,43 +647,78 @@ def iter_records(
         ... ):
         ...     process_record(record)
     """
-    page = 1
-    while True:
-        response = list_records(
-            number=number,
-            hist_id=hist_id,
-            hist_number=hist_number,
-            type_id=type_id,
-            project_id=project_id,
-            status=status,
-            created_at=created_at,
-            updated_at=updated_at,
-            submitted_at=submitted_at,
-            expires_at=expires_at,
-            is_enabled=is_enabled,
-            renewal_submitted=renewal_submitted,
-            submitted_online=submitted_online,
-            renewal_number=renewal_number,
-            renewal_of_record_id=renewal_of_record_id,
-            page_number=page,
-            page_size=page_size,
-            include=include,
-            fields=fields,
-            sort=sort,
-        )
 
-        # Yield all records from this page
-        if isinstance(response.data, list):
-            for record in response.data:
-                yield record
-        else:
-            yield response.data
+    # Encode the filters once; only the page number changes between pages
+    base_params = list_records_query_params(
+        number=number,
+        hist_id=hist_id,
+        hist_number=hist_number,
+        type_id=type_id,
+        project_id=project_id,
+        status=status,
+        created_at=created_at,
+        updated_at=updated_at,
+        submitted_at=submitted_at,
+        expires_at=expires_at,
+        is_enabled=is_enabled,
+        renewal_submitted=renewal_submitted,
+        submitted_online=submitted_online,
+        renewal_number=renewal_number,
+        renewal_of_record_id=renewal_of_record_id,
+        page_size=page_size,
+        include=include,
+        fields=fields,
+        sort=sort,
+    )
 
-        # Check if there's a next page
-        if not response.has_next_page():
-            break
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
 
-        page += 1
+    if raw:
+        yield from _iter_raw_items(_records_prefix(), build_params)
+        return
+
+    if stream and ijson is not None:
+
+        def open_page(page: int) -> httpx.Response:
+            return open_stream(
+                _get_client(),
+                _records_prefix(),
+                build_params(page),
+            )
+
+        yield from iter_streamed_items(open_page, RecordResource)
+        return
+
+    def fetch_page(page: int) -> JSONAPIResponse[RecordResource]:
+        return _fetch_records_page(build_params(page), fast)
+
+    for response in iter_prefetched_pages(fetch_page):
+        yield from response.data
+
+
+@overload
+def iter_record_guests(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[GuestResource]: ...
+
+
+@overload
+def iter_record_guests(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
 
 
 @handle_request_errors
@@ -327,7 +729,8 @@ def iter_record_guests(
     include: list[str] | None = None,
     fields: dict[str, list[str]] | None = None,
     sort: str | None = None,
-) -> Iterator[GuestResource]:
+    raw: bool = False,
+) -> Iterator[GuestResource | dict[str, Any]]:
     """
     Iterate through all guests for a record, automatically handling pagination.
 
@@ -337,283 +740,1507 @@ def iter_record_guests(
         include: List of related resources to include
         fields: Sparse fieldsets dict
         sort: Sort order
+        raw: Yield the parsed item dicts without building models
+            (default False)
 
     Yields:
-        GuestResource objects one at a time across all pages
+        GuestResource objects one at a time across all pages (dicts
+        when raw=True)
 
     Example:
         >>> for guest in opengov_api.iter_record_guests("12345"):
         ...     print(f"{guest.attributes.name}")
     """
-    page = 1
-    while True:
-        response = list_record_guests(
-            record_id=record_id,
-            page_number=page,
-            page_size=page_size,
-            include=include,
-            fields=fields,
-            sort=sort,
-        )
 
-        if isinstance(response.data, list):
-            for item in response.data:
-                yield item
-        else:
-            yield response.data
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
 
-        if not response.has_next_page():
-            break
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
 
-        page += 1
+    yield from _iter_pages(
+        f"{_records_prefix()}/{record_id}/guests",
+        build_params,
+        _GUEST_ADAPTER,
+        raw,
+    )
+
+
+@overload
+def iter_record_additional_locations(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[LocationResource]: ...
+
+
+@overload
+def iter_record_additional_locations(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
 
 
 @handle_request_errors
 def iter_record_additional_locations(
     record_id: str,
     *,
-    page_size: int = 100,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: bool = False,
+) -> Iterator[LocationResource | dict[str, Any]]:
+    """
+    Iterate through all additional locations for a record, automatically handling pagination.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+        raw: Yield the parsed item dicts without building models
+            (default False)
+
+    Yields:
+        LocationResource objects one at a time across all pages (dicts
+        when raw=True)
+
+    Example:
+        >>> for location in opengov_api.iter_record_additional_locations("12345"):
+        ...     print(f"{location.attributes.address}")
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    yield from _iter_pages(
+        f"{_records_prefix()}/{record_id}/additional-locations",
+        build_params,
+        _LOCATION_ADAPTER,
+        raw,
+    )
+
+
+@overload
+def iter_record_attachments(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    stream: bool = False,
+    raw: Literal[False] = False,
+) -> Iterator[AttachmentResource]: ...
+
+
+@overload
+def iter_record_attachments(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    stream: bool = False,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
+
+@handle_request_errors
+def iter_record_attachments(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    stream: bool = False,
+    raw: bool = False,
+) -> Iterator[AttachmentResource | dict[str, Any]]:
+    """
+    Iterate through all attachments for a record, automatically handling pagination.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+        stream: Parse each page incrementally as it downloads, yielding
+            attachments before the whole page has arrived (default False).
+            Needs the optional ijson package (``stream`` extra) and does
+            not prefetch; without ijson the regular path is used.
+        raw: Yield the parsed item dicts without building models
+            (default False). Takes precedence over stream.
+
+    Yields:
+        AttachmentResource objects one at a time across all pages (dicts
+        when raw=True)
+
+    Example:
+        >>> for attachment in opengov_api.iter_record_attachments("12345"):
+        ...     print(f"{attachment.attributes.filename}")
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    url = f"{_records_prefix()}/{record_id}/attachments"
+
+    if stream and not raw and ijson is not None:
+
+        def open_page(page: int) -> httpx.Response:
+            return open_stream(_get_client(), url, build_params(page))
+
+        yield from iter_streamed_items(open_page, AttachmentResource)
+        return
+
+    yield from _iter_pages(url, build_params, _ATTACHMENT_ADAPTER, raw)
+
+
+@overload
+def iter_record_workflow_steps(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[WorkflowStepResource]: ...
+
+
+@overload
+def iter_record_workflow_steps(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
+
+@handle_request_errors
+def iter_record_workflow_steps(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: bool = False,
+) -> Iterator[WorkflowStepResource | dict[str, Any]]:
+    """
+    Iterate through all workflow steps for a record, automatically handling pagination.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+        raw: Yield the parsed item dicts without building models
+            (default False)
+
+    Yields:
+        WorkflowStepResource objects one at a time across all pages (dicts
+        when raw=True)
+
+    Example:
+        >>> for step in opengov_api.iter_record_workflow_steps("12345"):
+        ...     print(f"{step.attributes.name}")
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    yield from _iter_pages(
+        f"{_records_prefix()}/{record_id}/workflow-steps",
+        build_params,
+        _WORKFLOW_STEP_ADAPTER,
+        raw,
+    )
+
+
+@overload
+def iter_record_workflow_step_comments(
+    record_id: str,
+    step_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[WorkflowStepCommentResource]: ...
+
+
+@overload
+def iter_record_workflow_step_comments(
+    record_id: str,
+    step_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
+
+@handle_request_errors
+def iter_record_workflow_step_comments(
+    record_id: str,
+    step_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: bool = False,
+) -> Iterator[WorkflowStepCommentResource | dict[str, Any]]:
+    """
+    Iterate through all comments for a workflow step, automatically handling pagination.
+
+    Args:
+        record_id: The ID of the record
+        step_id: The ID of the workflow step
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+        raw: Yield the parsed item dicts without building models
+            (default False)
+
+    Yields:
+        WorkflowStepCommentResource objects one at a time across all pages (dicts
+        when raw=True)
+
+    Example:
+        >>> for comment in opengov_api.iter_record_workflow_step_comments("12345", "step-123"):
+        ...     print(f"{comment.attributes.text}")
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    yield from _iter_pages(
+        f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments",
+        build_params,
+        _COMMENT_ADAPTER,
+        raw,
+    )
+
+
+@overload
+def iter_record_collections(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[CollectionResource]: ...
+
+
+@overload
+def iter_record_collections(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
+
+@handle_request_errors
+def iter_record_collections(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    raw: bool = False,
+) -> Iterator[CollectionResource | dict[str, Any]]:
+    """
+    Iterate through all collections for a record, automatically handling pagination.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+        raw: Yield the parsed item dicts without building models
+            (default False)
+
+    Yields:
+        CollectionResource objects one at a time across all pages (dicts
+        when raw=True)
+
+    Example:
+        >>> for collection in opengov_api.iter_record_collections("12345"):
+        ...     print(f"{collection.attributes.name}")
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    yield from _iter_pages(
+        f"{_records_prefix()}/{record_id}/collections",
+        build_params,
+        _COLLECTION_ADAPTER,
+        raw,
+    )
+
+
+# Async iteration
+
+
+@handle_async_request_errors
+async def _afetch_page(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, Any] | None,
+    adapter: TypeAdapter[T],
+) -> T:
+    """GET one page or resource on an async client and validate it."""
+    response = await client.get(parse_url(url), params=params)
+    response.raise_for_status()
+    return validate_json_response(response, adapter)
+
+
+async def _aiter_pages(
+    url: str,
+    build_params: Callable[[int], dict[str, Any]],
+    adapter: TypeAdapter[JSONAPIResponse[T]],
+    max_concurrency: int = 1,
+) -> AsyncIterator[T]:
+    """Yield every item of a paginated list endpoint, prefetching pages."""
+    async with _get_async_client() as client:
+        page = 1
+        response = await _afetch_page(client, url, build_params(page), adapter)
+        total_pages = response.total_pages()
+        if max_concurrency > 1 and total_pages is not None and total_pages > 1:
+            async for item in _aiter_page_windows(
+                client,
+                url,
+                build_params,
+                adapter,
+                response,
+                total_pages,
+                max_concurrency,
+            ):
+                yield item
+            return
+
+        next_page: asyncio.Task[JSONAPIResponse[T]] | None = None
+        try:
+            while True:
+                if response.has_next_page():
+                    # Request page N+1 while the caller consumes page N
+                    page += 1
+                    next_page = asyncio.create_task(
+                        _afetch_page(client, url, build_params(page), adapter)
+                    )
+
+                for item in response.data:
+                    yield item
+
+                if next_page is None:
+                    return
+                response = await next_page
+                next_page = None
+        finally:
+            # Don't leave an abandoned prefetch running on a closing client
+            if next_page is not None:
+                next_page.cancel()
+                await asyncio.wait([next_page])
+                if not next_page.cancelled():
+                    next_page.exception()  # mark a failed prefetch as retrieved
+
+
+async def _aiter_page_windows(
+    client: httpx.AsyncClient,
+    url: str,
+    build_params: Callable[[int], dict[str, Any]],
+    adapter: TypeAdapter[JSONAPIResponse[T]],
+    first: JSONAPIResponse[T],
+    total_pages: int,
+    max_concurrency: int,
+) -> AsyncIterator[T]:
+    """
+    Yield items of pages 1..total_pages, fetching max_concurrency at a time.
+
+    total_pages comes from the first page and may be stale. If the last
+    page still links to a next one, the remaining pages are followed one by
+    one, so records added during iteration are not skipped.
+    """
+
+    def fetch_window(start: int) -> list[asyncio.Task[JSONAPIResponse[T]]]:
+        end = min(start + max_concurrency, total_pages + 1)
+        return [
+            asyncio.create_task(_afetch_page(client, url, build_params(page), adapter))
+            for page in range(start, end)
+        ]
+
+    start = 2
+    window = fetch_window(start)
+    last = first
+    try:
+        for item in first.data:
+            yield item
+
+        while window:
+            responses = await asyncio.gather(*window)
+            # Request the next window while the caller consumes this one
+            start += max_concurrency
+            window = fetch_window(start)
+            for response in responses:
+                for item in response.data:
+                    yield item
+            last = responses[-1]
+
+        page = total_pages
+        while last.has_next_page():
+            page += 1
+            last = await _afetch_page(client, url, build_params(page), adapter)
+            for item in last.data:
+                yield item
+    finally:
+        # Don't leave abandoned fetches running on a closing client
+        for task in window:
+            task.cancel()
+        if window:
+            await asyncio.wait(window)
+        for task in window:
+            if not task.cancelled():
+                task.exception()  # mark a failed fetch as retrieved
+
+
+def _check_max_concurrency(max_concurrency: int) -> None:
+    """Reject concurrency limits that would leave a semaphore blocked forever."""
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+
+async def _gather_pages(
+    url: str,
+    params_list: list[dict[str, Any]],
+    adapter: TypeAdapter[T],
+    max_concurrency: int,
+) -> list[T]:
+    """GET several pages concurrently over one async client, in order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with _get_async_client() as client:
+
+        async def fetch(params: dict[str, Any]) -> T:
+            async with semaphore:
+                return await _afetch_page(client, url, params, adapter)
+
+        return await asyncio.gather(*(fetch(params) for params in params_list))
+
+
+@handle_async_request_errors
+async def _apost(
+    client: httpx.AsyncClient,
+    url: str,
+    content: bytes,
+    adapter: TypeAdapter[T],
+    semaphore: asyncio.Semaphore,
+) -> T:
+    """POST one body on an async client, bounded by a semaphore, and validate."""
+    async with semaphore:
+        response = await client.post(parse_url(url), content=content)
+    response.raise_for_status()
+    return validate_json_response(response, adapter)
+
+
+async def _gather_posts(
+    url: str,
+    bodies: list[bytes],
+    adapter: TypeAdapter[T],
+    max_concurrency: int,
+) -> list[T]:
+    """
+    POST several bodies concurrently over one async client, in order.
+
+    Every request runs to completion even if others fail, so the caller
+    learns exactly which bodies were accepted.
+
+    Raises:
+        OpenGovBulkRequestError: If any request failed, carrying every
+            request's response or exception
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    async with _get_async_client() as client:
+        results = await asyncio.gather(
+            *(_apost(client, url, body, adapter, semaphore) for body in bodies),
+            return_exceptions=True,
+        )
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        raise OpenGovBulkRequestError(
+            f"{len(failures)} of {len(results)} requests failed: {failures[0]}",
+            results=results,
+        ) from failures[0]
+    return results
+
+
+def list_records_pages(
+    page_numbers: list[int],
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    max_concurrency: int = 16,
+) -> list[JSONAPIResponse[RecordResource]]:
+    """
+    Fetch several pages of records concurrently.
+
+    Pages are requested over a single pooled httpx.AsyncClient, so the
+    round trips overlap instead of being paid one after another. At most
+    max_concurrency are in flight at a time, so a large export does not
+    queue on the connection pool. Useful for bulk exports once the total
+    page count is known (e.g. from the first list_records response). Must
+    be called from synchronous code; inside a running event loop, gather
+    aiter_records or the async client directly instead.
+
+    Args:
+        page_numbers: 1-based page numbers to fetch
+        max_concurrency: Maximum number of pages in flight (default 16)
+        Remaining arguments are the same as list_records
+
+    Returns:
+        One JSONAPIResponse per requested page, in the order given
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+        OpenGovConfigurationError: If API key or community is not configured
+        OpenGovAPIConnectionError: If connection fails
+        OpenGovAPITimeoutError: If request times out
+        OpenGovAPIStatusError: If API returns an error status code
+        OpenGovResponseParseError: If response cannot be parsed
+
+    Example:
+        >>> import opengov_api
+        >>>
+        >>> first = opengov_api.list_records(page_size=100)
+        >>> rest = opengov_api.list_records_pages(
+        ...     list(range(2, first.total_pages() + 1)), page_size=100
+        ... )
+        >>> records = first.data + [r for page in rest for r in page.data]
+    """
+    _check_max_concurrency(max_concurrency)
+    base_params = list_records_query_params(
+        number=number,
+        hist_id=hist_id,
+        hist_number=hist_number,
+        type_id=type_id,
+        project_id=project_id,
+        status=status,
+        created_at=created_at,
+        updated_at=updated_at,
+        submitted_at=submitted_at,
+        expires_at=expires_at,
+        is_enabled=is_enabled,
+        renewal_submitted=renewal_submitted,
+        submitted_online=submitted_online,
+        renewal_number=renewal_number,
+        renewal_of_record_id=renewal_of_record_id,
+        page_size=page_size,
+        include=include,
+        fields=fields,
+        sort=sort,
+    )
+
+    params_list = [{**base_params, "page[number]": page} for page in page_numbers]
+    return asyncio.run(
+        _gather_pages(_records_prefix(), params_list, _RECORD_ADAPTER, max_concurrency)
+    )
+
+
+async def aiter_records(
+    *,
+    number: str | None = None,
+    hist_id: str | None = None,
+    hist_number: str | None = None,
+    type_id: str | None = None,
+    project_id: str | None = None,
+    status: RecordStatus | None = None,
+    created_at: date | datetime | DateRangeFilter | None = None,
+    updated_at: date | datetime | DateRangeFilter | None = None,
+    submitted_at: date | datetime | DateRangeFilter | None = None,
+    expires_at: date | datetime | DateRangeFilter | None = None,
+    is_enabled: bool | None = None,
+    renewal_submitted: bool | None = None,
+    submitted_online: bool | None = None,
+    renewal_number: str | None = None,
+    renewal_of_record_id: str | None = None,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+    max_concurrency: int = 1,
+) -> AsyncIterator[RecordResource]:
+    """
+    Asynchronously iterate through all records, handling pagination.
+
+    Async counterpart of iter_records. All pages are fetched over one
+    httpx.AsyncClient, so many iterations (e.g. one per filter) can run
+    concurrently on a single event loop. The next page is requested as
+    soon as the current one arrives, while its records are consumed.
+
+    With max_concurrency above 1, the page count reported by the first
+    page is used to request the remaining pages in windows of that many
+    at once, the next window while the current one is consumed. Records
+    are still yielded in page order, and pages added after the count was
+    read are followed one at a time.
+
+    Args:
+        Same as iter_records, except fast, plus:
+        max_concurrency: Maximum number of pages in flight after the
+            first (default 1, prefetch one page ahead)
+
+    Yields:
+        RecordResource objects one at a time across all pages
+
+    Raises:
+        OpenGovConfigurationError: If API key or community is not configured
+        OpenGovAPIConnectionError: If connection fails
+        OpenGovAPITimeoutError: If request times out
+        OpenGovAPIStatusError: If API returns an error status code
+        OpenGovResponseParseError: If response cannot be parsed
+
+    Example:
+        >>> import asyncio
+        >>> import opengov_api
+        >>> from opengov_api.models import RecordStatus
+        >>>
+        >>> async def main():
+        ...     async for record in opengov_api.aiter_records(
+        ...         status=RecordStatus.ACTIVE
+        ...     ):
+        ...         print(record.attributes.number)
+        >>>
+        >>> asyncio.run(main())
+    """
+    base_params = list_records_query_params(
+        number=number,
+        hist_id=hist_id,
+        hist_number=hist_number,
+        type_id=type_id,
+        project_id=project_id,
+        status=status,
+        created_at=created_at,
+        updated_at=updated_at,
+        submitted_at=submitted_at,
+        expires_at=expires_at,
+        is_enabled=is_enabled,
+        renewal_submitted=renewal_submitted,
+        submitted_online=submitted_online,
+        renewal_number=renewal_number,
+        renewal_of_record_id=renewal_of_record_id,
+        page_size=page_size,
+        include=include,
+        fields=fields,
+        sort=sort,
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    async for record in _aiter_pages(
+        _records_prefix(), build_params, _RECORD_ADAPTER, max_concurrency
+    ):
+        yield record
+
+
+async def aiter_record_guests(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> AsyncIterator[GuestResource]:
+    """
+    Asynchronously iterate through all guests for a record.
+
+    Async counterpart of iter_record_guests.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+
+    Yields:
+        GuestResource objects one at a time across all pages
+
+    Example:
+        >>> async for guest in opengov_api.aiter_record_guests("12345"):
+        ...     print(guest.attributes.name)
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    async for guest in _aiter_pages(
+        f"{_records_prefix()}/{record_id}/guests", build_params, _GUEST_ADAPTER
+    ):
+        yield guest
+
+
+async def aiter_record_additional_locations(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> AsyncIterator[LocationResource]:
+    """
+    Asynchronously iterate through all additional locations for a record.
+
+    Async counterpart of iter_record_additional_locations.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+
+    Yields:
+        LocationResource objects one at a time across all pages
+
+    Example:
+        >>> async for location in opengov_api.aiter_record_additional_locations("12345"):
+        ...     print(location.id)
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    async for location in _aiter_pages(
+        f"{_records_prefix()}/{record_id}/additional-locations",
+        build_params,
+        _LOCATION_ADAPTER,
+    ):
+        yield location
+
+
+async def aiter_record_attachments(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> AsyncIterator[AttachmentResource]:
+    """
+    Asynchronously iterate through all attachments for a record.
+
+    Async counterpart of iter_record_attachments.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+
+    Yields:
+        AttachmentResource objects one at a time across all pages
+
+    Example:
+        >>> async for attachment in opengov_api.aiter_record_attachments("12345"):
+        ...     print(attachment.id)
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    async for attachment in _aiter_pages(
+        f"{_records_prefix()}/{record_id}/attachments",
+        build_params,
+        _ATTACHMENT_ADAPTER,
+    ):
+        yield attachment
+
+
+async def aiter_record_workflow_steps(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> AsyncIterator[WorkflowStepResource]:
+    """
+    Asynchronously iterate through all workflow steps for a record.
+
+    Async counterpart of iter_record_workflow_steps.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+
+    Yields:
+        WorkflowStepResource objects one at a time across all pages
+
+    Example:
+        >>> async for step in opengov_api.aiter_record_workflow_steps("12345"):
+        ...     print(step.attributes.label)
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    async for step in _aiter_pages(
+        f"{_records_prefix()}/{record_id}/workflow-steps",
+        build_params,
+        _WORKFLOW_STEP_ADAPTER,
+    ):
+        yield step
+
+
+async def aiter_record_workflow_step_comments(
+    record_id: str,
+    step_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> AsyncIterator[WorkflowStepCommentResource]:
+    """
+    Asynchronously iterate through all comments on a workflow step for a record.
+
+    Async counterpart of iter_record_workflow_step_comments.
+
+    Args:
+        record_id: The ID of the record
+        step_id: The ID of the workflow step
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+
+    Yields:
+        WorkflowStepCommentResource objects one at a time across all pages
+
+    Example:
+        >>> async for comment in opengov_api.aiter_record_workflow_step_comments("12345", "step-123"):
+        ...     print(comment.id)
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    async for comment in _aiter_pages(
+        f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments",
+        build_params,
+        _COMMENT_ADAPTER,
+    ):
+        yield comment
+
+
+async def aiter_record_collections(
+    record_id: str,
+    *,
+    page_size: int = 100,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> AsyncIterator[CollectionResource]:
+    """
+    Asynchronously iterate through all collections for a record.
+
+    Async counterpart of iter_record_collections.
+
+    Args:
+        record_id: The ID of the record
+        page_size: Number of records per page (1-100, default 100 for efficiency)
+        include: List of related resources to include
+        fields: Sparse fieldsets dict
+        sort: Sort order
+
+    Yields:
+        CollectionResource objects one at a time across all pages
+
+    Example:
+        >>> async for collection in opengov_api.aiter_record_collections("12345"):
+        ...     print(collection.attributes.name)
+    """
+
+    base_params = list_query_params(
+        page_size=page_size, include=include, fields=fields, sort=sort
+    )
+
+    def build_params(page: int) -> dict[str, Any]:
+        return {**base_params, "page[number]": page}
+
+    async for collection in _aiter_pages(
+        f"{_records_prefix()}/{record_id}/collections",
+        build_params,
+        _COLLECTION_ADAPTER,
+    ):
+        yield collection
+
+
+# Async lookups: calls on the same event loop share one pooled
+# httpx.AsyncClient, so many can be awaited together with asyncio.gather
+
+
+async def alist_record_guests(
+    record_id: str,
+    *,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> JSONAPIResponse[GuestResource]:
+    """Async counterpart of list_record_guests."""
+    params = list_query_params(page_number, page_size, include, fields, sort)
+
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/guests",
+        params,
+        _GUEST_ADAPTER,
+    )
+
+
+async def aget_record_guest(
+    record_id: str, user_id: str
+) -> JSONAPIResponse[GuestResource]:
+    """Async counterpart of get_record_guest."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/guests/{user_id}",
+        None,
+        _GUEST_ADAPTER,
+    )
+
+
+async def aget_record_primary_location(
+    record_id: str,
+) -> JSONAPIResponse[LocationResource]:
+    """Async counterpart of get_record_primary_location."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/primary-location",
+        None,
+        _LOCATION_ADAPTER,
+    )
+
+
+async def alist_record_additional_locations(
+    record_id: str,
+    *,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> JSONAPIResponse[LocationResource]:
+    """Async counterpart of list_record_additional_locations."""
+    params = list_query_params(page_number, page_size, include, fields, sort)
+
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/additional-locations",
+        params,
+        _LOCATION_ADAPTER,
+    )
+
+
+async def aget_record_additional_location(
+    record_id: str, location_id: str
+) -> JSONAPIResponse[LocationResource]:
+    """Async counterpart of get_record_additional_location."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/additional-locations/{location_id}",
+        None,
+        _LOCATION_ADAPTER,
+    )
+
+
+async def alist_record_attachments(
+    record_id: str,
+    *,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> JSONAPIResponse[AttachmentResource]:
+    """Async counterpart of list_record_attachments."""
+    params = list_query_params(page_number, page_size, include, fields, sort)
+
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/attachments",
+        params,
+        _ATTACHMENT_ADAPTER,
+    )
+
+
+async def aget_record_attachment(
+    record_id: str, attachment_id: str
+) -> JSONAPIResponse[AttachmentResource]:
+    """Async counterpart of get_record_attachment."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/attachments/{attachment_id}",
+        None,
+        _ATTACHMENT_ADAPTER,
+    )
+
+
+async def aget_record_change_request(
+    record_id: str, change_request_id: str
+) -> JSONAPIResponse[ChangeRequestResource]:
+    """Async counterpart of get_record_change_request."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/change-requests/{change_request_id}",
+        None,
+        _CHANGE_REQUEST_ADAPTER,
+    )
+
+
+async def aget_most_recent_record_change_request(
+    record_id: str,
+) -> JSONAPIResponse[ChangeRequestResource]:
+    """Async counterpart of get_most_recent_record_change_request."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/change-requests",
+        None,
+        _CHANGE_REQUEST_ADAPTER,
+    )
+
+
+async def alist_record_workflow_steps(
+    record_id: str,
+    *,
+    page_number: int = 1,
+    page_size: int = 20,
     include: list[str] | None = None,
     fields: dict[str, list[str]] | None = None,
     sort: str | None = None,
-) -> Iterator[LocationResource]:
-    """
-    Iterate through all additional locations for a record, automatically handling pagination.
+) -> JSONAPIResponse[WorkflowStepResource]:
+    """Async counterpart of list_record_workflow_steps."""
+    params = list_query_params(page_number, page_size, include, fields, sort)
+
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/workflow-steps",
+        params,
+        _WORKFLOW_STEP_ADAPTER,
+    )
 
-    Args:
-        record_id: The ID of the record
-        page_size: Number of records per page (1-100, default 100 for efficiency)
-        include: List of related resources to include
-        fields: Sparse fieldsets dict
-        sort: Sort order
 
-    Yields:
-        LocationResource objects one at a time across all pages
+async def aget_record_workflow_step(
+    record_id: str, step_id: str
+) -> JSONAPIResponse[WorkflowStepResource]:
+    """Async counterpart of get_record_workflow_step."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}",
+        None,
+        _WORKFLOW_STEP_ADAPTER,
+    )
 
-    Example:
-        >>> for location in opengov_api.iter_record_additional_locations("12345"):
-        ...     print(f"{location.attributes.address}")
-    """
-    page = 1
-    while True:
-        response = list_record_additional_locations(
-            record_id=record_id,
-            page_number=page,
-            page_size=page_size,
-            include=include,
-            fields=fields,
-            sort=sort,
-        )
 
-        if isinstance(response.data, list):
-            for item in response.data:
-                yield item
-        else:
-            yield response.data
+async def alist_record_workflow_step_comments(
+    record_id: str,
+    step_id: str,
+    *,
+    page_number: int = 1,
+    page_size: int = 20,
+    include: list[str] | None = None,
+    fields: dict[str, list[str]] | None = None,
+    sort: str | None = None,
+) -> JSONAPIResponse[WorkflowStepCommentResource]:
+    """Async counterpart of list_record_workflow_step_comments."""
+    params = list_query_params(page_number, page_size, include, fields, sort)
+
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments",
+        params,
+        _COMMENT_ADAPTER,
+    )
 
-        if not response.has_next_page():
-            break
 
-        page += 1
+async def aget_record_workflow_step_comment(
+    record_id: str, step_id: str, comment_id: str
+) -> JSONAPIResponse[WorkflowStepCommentResource]:
+    """Async counterpart of get_record_workflow_step_comment."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments/{comment_id}",
+        None,
+        _COMMENT_ADAPTER,
+    )
 
 
-@handle_request_errors
-def iter_record_attachments(
+async def alist_record_collections(
     record_id: str,
     *,
-    page_size: int = 100,
+    page_number: int = 1,
+    page_size: int = 20,
     include: list[str] | None = None,
     fields: dict[str, list[str]] | None = None,
     sort: str | None = None,
-) -> Iterator[AttachmentResource]:
-    """
-    Iterate through all attachments for a record, automatically handling pagination.
+) -> JSONAPIResponse[CollectionResource]:
+    """Async counterpart of list_record_collections."""
+    params = list_query_params(page_number, page_size, include, fields, sort)
+
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/collections",
+        params,
+        _COLLECTION_ADAPTER,
+    )
 
-    Args:
-        record_id: The ID of the record
-        page_size: Number of records per page (1-100, default 100 for efficiency)
-        include: List of related resources to include
-        fields: Sparse fieldsets dict
-        sort: Sort order
 
-    Yields:
-        AttachmentResource objects one at a time across all pages
+async def aget_record_collection(
+    record_id: str, collection_id: str
+) -> JSONAPIResponse[CollectionResource]:
+    """Async counterpart of get_record_collection."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/collections/{collection_id}",
+        None,
+        _COLLECTION_ADAPTER,
+    )
 
-    Example:
-        >>> for attachment in opengov_api.iter_record_attachments("12345"):
-        ...     print(f"{attachment.attributes.filename}")
-    """
+
+async def aget_record_collection_entry(
+    record_id: str, collection_id: str, entry_id: str
+) -> JSONAPIResponse[CollectionEntryResource]:
+    """Async counterpart of get_record_collection_entry."""
+    return await _afetch_page(
+        _get_shared_async_client(),
+        f"{_records_prefix()}/{record_id}/collections/{collection_id}/entries/{entry_id}",
+        None,
+        _COLLECTION_ENTRY_ADAPTER,
+    )
+
+
+async def _acollect_items(
+    client: httpx.AsyncClient,
+    url: str,
+    adapter: TypeAdapter[JSONAPIResponse[T]],
+) -> list[T]:
+    """GET every page of a list endpoint on an async client."""
+    items: list[T] = []
     page = 1
     while True:
-        response = list_record_attachments(
-            record_id=record_id,
-            page_number=page,
-            page_size=page_size,
-            include=include,
-            fields=fields,
-            sort=sort,
+        response = await _afetch_page(
+            client, url, list_query_params(page, 100), adapter
         )
+        items.extend(response.data)
+        if not response.has_next_page():
+            return items
+        page += 1
 
-        if isinstance(response.data, list):
-            for item in response.data:
-                yield item
-        else:
-            yield response.data
 
-        if not response.has_next_page():
-            break
+async def _gather_record_bundle(
+    client: httpx.AsyncClient, record_id: str, max_concurrency: int
+) -> RecordBundle:
+    """Fetch steps and collections together, then every step's comments."""
+    prefix = f"{_records_prefix()}/{record_id}"
+    steps, collections = await asyncio.gather(
+        _acollect_items(client, f"{prefix}/workflow-steps", _WORKFLOW_STEP_ADAPTER),
+        _acollect_items(client, f"{prefix}/collections", _COLLECTION_ADAPTER),
+    )
 
-        page += 1
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def step_comments(step_id: str) -> list[WorkflowStepCommentResource]:
+        async with semaphore:
+            return await _acollect_items(
+                client,
+                f"{prefix}/workflow-steps/{step_id}/comments",
+                _COMMENT_ADAPTER,
+            )
+
+    comments = await asyncio.gather(*(step_comments(step.id) for step in steps))
+    return RecordBundle(
+        workflow_steps=steps,
+        comments={step.id: items for step, items in zip(steps, comments)},
+        collections=collections,
+    )
 
 
-@handle_request_errors
-def iter_record_workflow_steps(
-    record_id: str,
-    *,
-    page_size: int = 100,
-    include: list[str] | None = None,
-    fields: dict[str, list[str]] | None = None,
-    sort: str | None = None,
-) -> Iterator[WorkflowStepResource]:
+async def afetch_record_bundle(
+    record_id: str, *, max_concurrency: int = 16
+) -> RecordBundle:
     """
-    Iterate through all workflow steps for a record, automatically handling pagination.
+    Fetch a record's workflow steps, step comments and collections asynchronously.
+
+    Steps and collections are listed concurrently; once the steps are
+    known, the comments of every step are fetched in parallel, at most
+    max_concurrency at a time. All pages of every list are fetched over
+    the event loop's shared pooled httpx.AsyncClient, so a dashboard needs
+    about two round trips of latency instead of one per step.
 
     Args:
         record_id: The ID of the record
-        page_size: Number of records per page (1-100, default 100 for efficiency)
-        include: List of related resources to include
-        fields: Sparse fieldsets dict
-        sort: Sort order
+        max_concurrency: Maximum number of comment lists fetched at once
+            (default 16)
 
-    Yields:
-        WorkflowStepResource objects one at a time across all pages
+    Returns:
+        RecordBundle with the steps, comments keyed by step ID, and
+        collections
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+        OpenGovConfigurationError: If API key or community is not configured
+        OpenGovAPIConnectionError: If connection fails
+        OpenGovAPITimeoutError: If request times out
+        OpenGovAPIStatusError: If API returns an error status code
+        OpenGovResponseParseError: If response cannot be parsed
 
     Example:
-        >>> for step in opengov_api.iter_record_workflow_steps("12345"):
-        ...     print(f"{step.attributes.name}")
+        >>> import asyncio
+        >>> import opengov_api
+        >>>
+        >>> bundle = asyncio.run(opengov_api.afetch_record_bundle("12345"))
+        >>> for step in bundle.workflow_steps:
+        ...     print(step.attributes.name, len(bundle.comments[step.id]))
     """
-    page = 1
-    while True:
-        response = list_record_workflow_steps(
-            record_id=record_id,
-            page_number=page,
-            page_size=page_size,
-            include=include,
-            fields=fields,
-            sort=sort,
-        )
-
-        if isinstance(response.data, list):
-            for item in response.data:
-                yield item
-        else:
-            yield response.data
-
-        if not response.has_next_page():
-            break
-
-        page += 1
+    _check_max_concurrency(max_concurrency)
+    return await _gather_record_bundle(
+        _get_shared_async_client(), record_id, max_concurrency
+    )
 
 
-@handle_request_errors
-def iter_record_workflow_step_comments(
-    record_id: str,
-    step_id: str,
-    *,
-    page_size: int = 100,
-    include: list[str] | None = None,
-    fields: dict[str, list[str]] | None = None,
-    sort: str | None = None,
-) -> Iterator[WorkflowStepCommentResource]:
+def fetch_record_bundle(record_id: str, *, max_concurrency: int = 16) -> RecordBundle:
     """
-    Iterate through all comments for a workflow step, automatically handling pagination.
+    Fetch a record's workflow steps, step comments and collections concurrently.
+
+    Sync counterpart of afetch_record_bundle. The requests run on a
+    short-lived pooled httpx.AsyncClient. Must be called from synchronous
+    code; inside a running event loop, await afetch_record_bundle instead.
 
     Args:
         record_id: The ID of the record
-        step_id: The ID of the workflow step
-        page_size: Number of records per page (1-100, default 100 for efficiency)
-        include: List of related resources to include
-        fields: Sparse fieldsets dict
-        sort: Sort order
+        max_concurrency: Maximum number of comment lists fetched at once
+            (default 16)
 
-    Yields:
-        WorkflowStepCommentResource objects one at a time across all pages
+    Returns:
+        RecordBundle with the steps, comments keyed by step ID, and
+        collections
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+        OpenGovConfigurationError: If API key or community is not configured
+        OpenGovAPIConnectionError: If connection fails
+        OpenGovAPITimeoutError: If request times out
+        OpenGovAPIStatusError: If API returns an error status code
+        OpenGovResponseParseError: If response cannot be parsed
 
     Example:
-        >>> for comment in opengov_api.iter_record_workflow_step_comments("12345", "step-123"):
-        ...     print(f"{comment.attributes.text}")
+        >>> import opengov_api
+        >>> bundle = opengov_api.fetch_record_bundle("12345")
+        >>> print(len(bundle.workflow_steps), len(bundle.collections))
     """
-    page = 1
-    while True:
-        response = list_record_workflow_step_comments(
-            record_id=record_id,
-            step_id=step_id,
-            page_number=page,
-            page_size=page_size,
-            include=include,
-            fields=fields,
-            sort=sort,
-        )
+    _check_max_concurrency(max_concurrency)
 
-        if isinstance(response.data, list):
-            for item in response.data:
-                yield item
-        else:
-            yield response.data
+    async def run() -> RecordBundle:
+        async with _get_async_client() as client:
+            return await _gather_record_bundle(client, record_id, max_concurrency)
 
-        if not response.has_next_page():
-            break
+    return asyncio.run(run())
 
-        page += 1
 
+async def _gather_relations(
+    record_ids: list[str], relations: Sequence[str], max_concurrency: int
+) -> list[dict[str, list[Any]]]:
+    """Fetch every relation list of several records concurrently, in order."""
+    prefix = _records_prefix()
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-@handle_request_errors
-def iter_record_collections(
-    record_id: str,
+    async with _get_async_client() as client:
+
+        async def collect(record_id: str, relation: str) -> list[Any]:
+            async with semaphore:
+                return await _acollect_items(
+                    client,
+                    f"{prefix}/{record_id}/{relation}",
+                    _RELATION_ADAPTERS[relation],
+                )
+
+        results = iter(
+            await asyncio.gather(
+                *(
+                    collect(record_id, relation)
+                    for record_id in record_ids
+                    for relation in relations
+                )
+            )
+        )
+    return [{relation: next(results) for relation in relations} for _ in record_ids]
+
+
+def iter_records_with_relations(
+    records: Iterable[RecordResource],
+    relations: Sequence[str] = ("guests", "attachments"),
     *,
-    page_size: int = 100,
-    include: list[str] | None = None,
-    fields: dict[str, list[str]] | None = None,
-    sort: str | None = None,
-) -> Iterator[CollectionResource]:
+    max_concurrency: int = 8,
+    batch_size: int = 100,
+) -> Iterator[tuple[RecordResource, dict[str, list[Any]]]]:
     """
-    Iterate through all collections for a record, automatically handling pagination.
+    Iterate records together with their related lists, fetched concurrently.
+
+    Records are taken in batches of batch_size; for each batch, every
+    requested relation of every record is listed in parallel over one
+    pooled httpx.AsyncClient, at most max_concurrency requests at a time.
+    This replaces one sequential round trip per record and relation with
+    roughly one per batch. All pages of each relation are fetched. Must be
+    called from synchronous code.
 
     Args:
-        record_id: The ID of the record
-        page_size: Number of records per page (1-100, default 100 for efficiency)
-        include: List of related resources to include
-        fields: Sparse fieldsets dict
-        sort: Sort order
+        records: Records to expand, e.g. the output of iter_records
+        relations: Related lists to fetch, any of "guests",
+            "additional-locations", "attachments", "workflow-steps" and
+            "collections" (default guests and attachments)
+        max_concurrency: Maximum number of requests in flight (default 8)
+        batch_size: Number of records expanded at once (default 100)
 
     Yields:
-        CollectionResource objects one at a time across all pages
+        (record, relations) pairs in input order, where relations maps each
+        requested relation name to its list of resources
+
+    Raises:
+        ValueError: If an unsupported relation is requested or
+            max_concurrency is less than 1, raised at call time
+        OpenGovConfigurationError: If API key or community is not configured
+        OpenGovAPIConnectionError: If connection fails
+        OpenGovAPITimeoutError: If request times out
+        OpenGovAPIStatusError: If API returns an error status code
+        OpenGovResponseParseError: If response cannot be parsed
 
     Example:
-        >>> for collection in opengov_api.iter_record_collections("12345"):
-        ...     print(f"{collection.attributes.name}")
+        >>> import opengov_api
+        >>> from opengov_api.models import RecordStatus
+        >>>
+        >>> records = opengov_api.iter_records(status=RecordStatus.ACTIVE)
+        >>> for record, related in opengov_api.iter_records_with_relations(
+        ...     records, ["guests", "attachments"]
+        ... ):
+        ...     print(record.id, len(related["guests"]), len(related["attachments"]))
     """
-    page = 1
-    while True:
-        response = list_record_collections(
-            record_id=record_id,
-            page_number=page,
-            page_size=page_size,
-            include=include,
-            fields=fields,
-            sort=sort,
-        )
+    unsupported = sorted(set(relations) - _RELATION_ADAPTERS.keys())
+    if unsupported:
+        raise ValueError(f"Unsupported relations: {', '.join(unsupported)}")
+    _check_max_concurrency(max_concurrency)
+    return _iter_records_with_relations(records, relations, max_concurrency, batch_size)
 
-        if isinstance(response.data, list):
-            for item in response.data:
-                yield item
-        else:
-            yield response.data
-
-        if not response.has_next_page():
-            break
 
-        page += 1
+def _iter_records_with_relations(
+    records: Iterable[RecordResource],
+    relations: Sequence[str],
+    max_concurrency: int,
+    batch_size: int,
+) -> Iterator[tuple[RecordResource, dict[str, list[Any]]]]:
+    """Yield record batches with their relations once arguments are checked."""
+    for batch in itertools.batched(records, batch_size):
+        related = asyncio.run(
+            _gather_relations(
+                [record.id for record in batch], relations, max_concurrency
+            )
+        )
+        yield from zip(batch, related)
 
 
 @handle_request_errors
@@ -621,6 +2248,9 @@ def get_record(record_id: str) -> JSONAPIResponse[RecordResource]:
     """
     Get a specific record by ID.
 
+    Responses carrying an ETag are cached; later calls send If-None-Match
+    and a 304 Not Modified answer is served from the cache.
+
     Args:
         record_id: The ID of the record to retrieve
 
@@ -642,27 +2272,25 @@ def get_record(record_id: str) -> JSONAPIResponse[RecordResource]:
         >>> response = opengov_api.get_record("12345")
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"records/{record_id}")
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[RecordResource](
-            data=RecordResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return conditional_get(
+        _get_client(),
+        f"{_records_prefix()}/{record_id}",
+        _record_etag_cache,
+        lambda response: validate_json_response(response, _RECORD_ADAPTER),
+        _record_inflight,
+    )
 
 
-@handle_request_errors
-def create_record(data: dict[str, Any]) -> JSONAPIResponse[RecordResource]:
+def create_record(
+    data: dict[str, Any] | RecordCreateRequest,
+) -> JSONAPIResponse[RecordResource]:
     """
     Create a new record.
 
     Args:
-        data: Dictionary containing the record data to create
+        data: Record data to create, as a dictionary or RecordCreateRequest.
+            Attributes left as None on a request model are omitted from
+            the request body.
 
     Returns:
         JSONAPIResponse containing the created RecordResource
@@ -682,30 +2310,23 @@ def create_record(data: dict[str, Any]) -> JSONAPIResponse[RecordResource]:
         >>> response = opengov_api.create_record(record_data)
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "records")
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[RecordResource](
-            data=RecordResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    response = send_request(
+        _get_client(), "POST", _records_prefix(), content=encode_request_body(data)
+    )
+    return validate_json_response(response, _RECORD_ADAPTER)
 
 
-@handle_request_errors
 def update_record(
-    record_id: str, data: dict[str, Any]
+    record_id: str, data: dict[str, Any] | RecordUpdateRequest
 ) -> JSONAPIResponse[RecordResource]:
     """
     Update an existing record.
 
     Args:
         record_id: The ID of the record to update
-        data: Dictionary containing the record data to update
+        data: Record data to update, as a dictionary or RecordUpdateRequest.
+            Attributes left as None on a request model are omitted, so
+            only the fields being changed are sent.
 
     Returns:
         JSONAPIResponse containing the updated RecordResource
@@ -726,21 +2347,13 @@ def update_record(
         >>> response = opengov_api.update_record("12345", record_data)
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"records/{record_id}")
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[RecordResource](
-            data=RecordResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}"
+    response = send_request(
+        _get_client(), "PATCH", url, content=encode_request_body(data)
+    )
+    return validate_json_response(response, _RECORD_ADAPTER)
 
 
-@handle_request_errors
 def archive_record(record_id: str) -> None:
     """
     Archive a record.
@@ -761,10 +2374,8 @@ def archive_record(record_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.archive_record("12345")
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"records/{record_id}")
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Form endpoints
@@ -773,6 +2384,9 @@ def get_record_form(record_id: str) -> FormResource:
     """
     Get form data for a record.
 
+    Responses carrying an ETag are cached; later calls send If-None-Match
+    and a 304 Not Modified answer is served from the cache.
+
     Args:
         record_id: The ID of the record
 
@@ -794,17 +2408,15 @@ def get_record_form(record_id: str) -> FormResource:
         >>> form = opengov_api.get_record_form("12345")
         >>> print(form.fields)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"records/{record_id}/form")
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        # Forms use non-standard format: {"data": {"fields": [...]}}
-        return FormResource(**data["data"])
+    return conditional_get(
+        _get_client(),
+        f"{_records_prefix()}/{record_id}/form",
+        _record_etag_cache,
+        lambda response: validate_json_response(response, _FORM_ADAPTER)["data"],
+        _record_inflight,
+    )
 
 
-@handle_request_errors
 def update_record_form(record_id: str, data: dict[str, Any]) -> FormResource:
     """
     Update form data for a record.
@@ -832,14 +2444,9 @@ def update_record_form(record_id: str, data: dict[str, Any]) -> FormResource:
         >>> form = opengov_api.update_record_form("12345", form_data)
         >>> print(form.fields)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"records/{record_id}/form")
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        # Forms use non-standard format: {"data": {"fields": [...]}}
-        return FormResource(**data["data"])
+    url = f"{_records_prefix()}/{record_id}/form"
+    response = send_request(_get_client(), "PATCH", url, content=dump_json(data))
+    return validate_json_response(response, _FORM_ADAPTER)["data"]
 
 
 # Record Applicant endpoints
@@ -848,6 +2455,9 @@ def get_record_applicant(record_id: str) -> JSONAPIResponse[ApplicantResource]:
     """
     Get the applicant for a record.
 
+    Responses carrying an ETag are cached; later calls send If-None-Match
+    and a 304 Not Modified answer is served from the cache.
+
     Args:
         record_id: The ID of the record
 
@@ -869,23 +2479,15 @@ def get_record_applicant(record_id: str) -> JSONAPIResponse[ApplicantResource]:
         >>> applicant = opengov_api.get_record_applicant("12345")
         >>> print(applicant.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/applicant"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[ApplicantResource](
-            data=ApplicantResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return conditional_get(
+        _get_client(),
+        f"{_records_prefix()}/{record_id}/applicant",
+        _record_etag_cache,
+        lambda response: validate_json_response(response, _APPLICANT_ADAPTER),
+        _record_inflight,
+    )
 
 
-@handle_request_errors
 def update_record_applicant(
     record_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[ApplicantResource]:
@@ -915,23 +2517,11 @@ def update_record_applicant(
         >>> applicant = opengov_api.update_record_applicant("12345", applicant_data)
         >>> print(applicant.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/applicant"
-        )
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[ApplicantResource](
-            data=ApplicantResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/applicant"
+    response = send_request(_get_client(), "PATCH", url, content=dump_json(data))
+    return validate_json_response(response, _APPLICANT_ADAPTER)
 
 
-@handle_request_errors
 def remove_record_applicant(record_id: str) -> None:
     """
     Remove the applicant from a record.
@@ -952,16 +2542,11 @@ def remove_record_applicant(record_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.remove_record_applicant("12345")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/applicant"
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/applicant"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Guests endpoints
-@handle_request_errors
 def list_record_guests(
     record_id: str,
     *,
@@ -1001,29 +2586,13 @@ def list_record_guests(
         >>> for guest in response.data:
         ...     print(f"{guest.attributes.name}: {guest.attributes.email}")
     """
-    params_model = ListRecordGuestsParams(
-        page_number=page_number,
-        page_size=page_size,
-        include=include,
-        fields=fields,
-        sort=sort,
-    )
+    params = list_query_params(page_number, page_size, include, fields, sort)
 
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"records/{record_id}/guests")
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[GuestResource](
-            data=[GuestResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/guests"
+    response = send_request(_get_client(), "GET", url, params=params)
+    return validate_json_response(response, _GUEST_ADAPTER)
 
 
-@handle_request_errors
 def add_record_guest(
     record_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[GuestResource]:
@@ -1053,31 +2622,47 @@ def add_record_guest(
         >>> response = opengov_api.add_record_guest("12345", guest_data)
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"records/{record_id}/guests")
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
+    url = f"{_records_prefix()}/{record_id}/guests"
+    response = send_request(_get_client(), "POST", url, content=dump_json(data))
+    return validate_json_response(response, _GUEST_ADAPTER)
 
-        return JSONAPIResponse[GuestResource](
-            data=GuestResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+
+@overload
+def get_record_guest(
+    record_id: str,
+    user_id: str,
+    *,
+    raw: Literal[False] = False,
+) -> JSONAPIResponse[GuestResource]: ...
 
 
-@handle_request_errors
-def get_record_guest(record_id: str, user_id: str) -> JSONAPIResponse[GuestResource]:
+@overload
+def get_record_guest(
+    record_id: str,
+    user_id: str,
+    *,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def get_record_guest(
+    record_id: str,
+    user_id: str,
+    *,
+    raw: bool = False,
+) -> JSONAPIResponse[GuestResource] | dict[str, Any]:
     """
     Get a specific guest on a record.
 
     Args:
         record_id: The ID of the record
         user_id: The ID of the guest user
+        raw: Return the parsed JSON document as plain dicts without
+            building any models (default False)
 
     Returns:
         JSONAPIResponse containing the GuestResource
+        (the parsed JSON:API document as a dict when raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -1094,23 +2679,11 @@ def get_record_guest(record_id: str, user_id: str) -> JSONAPIResponse[GuestResou
         >>> response = opengov_api.get_record_guest("12345", "user-123")
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/guests/{user_id}"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[GuestResource](
-            data=GuestResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/guests/{user_id}", _GUEST_ADAPTER, raw
+    )
 
 
-@handle_request_errors
 def remove_record_guest(record_id: str, user_id: str) -> None:
     """
     Remove a guest from a record.
@@ -1132,25 +2705,43 @@ def remove_record_guest(record_id: str, user_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.remove_record_guest("12345", "user-123")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/guests/{user_id}"
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/guests/{user_id}"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Primary Location endpoints
-@handle_request_errors
-def get_record_primary_location(record_id: str) -> JSONAPIResponse[LocationResource]:
+@overload
+def get_record_primary_location(
+    record_id: str,
+    *,
+    raw: Literal[False] = False,
+) -> JSONAPIResponse[LocationResource]: ...
+
+
+@overload
+def get_record_primary_location(
+    record_id: str,
+    *,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def get_record_primary_location(
+    record_id: str,
+    *,
+    raw: bool = False,
+) -> JSONAPIResponse[LocationResource] | dict[str, Any]:
     """
     Get the primary location for a record.
 
     Args:
         record_id: The ID of the record
+        raw: Return the parsed JSON document as plain dicts without
+            building any models (default False)
 
     Returns:
         JSONAPIResponse containing the LocationResource
+        (the parsed JSON:API document as a dict when raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -1167,23 +2758,11 @@ def get_record_primary_location(record_id: str) -> JSONAPIResponse[LocationResou
         >>> response = opengov_api.get_record_primary_location("12345")
         >>> print(response.data.attributes.address)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/primary-location"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[LocationResource](
-            data=LocationResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/primary-location", _LOCATION_ADAPTER, raw
+    )
 
 
-@handle_request_errors
 def update_record_primary_location(
     record_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[LocationResource]:
@@ -1213,23 +2792,11 @@ def update_record_primary_location(
         >>> response = opengov_api.update_record_primary_location("12345", location_data)
         >>> print(response.data.attributes.address)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/primary-location"
-        )
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[LocationResource](
-            data=LocationResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/primary-location"
+    response = send_request(_get_client(), "PATCH", url, content=dump_json(data))
+    return validate_json_response(response, _LOCATION_ADAPTER)
 
 
-@handle_request_errors
 def remove_record_primary_location(record_id: str) -> None:
     """
     Remove the primary location from a record.
@@ -1250,16 +2817,11 @@ def remove_record_primary_location(record_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.remove_record_primary_location("12345")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/primary-location"
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/primary-location"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Additional Locations endpoints
-@handle_request_errors
 def list_record_additional_locations(
     record_id: str,
     *,
@@ -1299,31 +2861,13 @@ def list_record_additional_locations(
         >>> for location in response.data:
         ...     print(f"{location.attributes.address}")
     """
-    params_model = ListRecordAdditionalLocationsParams(
-        page_number=page_number,
-        page_size=page_size,
-        include=include,
-        fields=fields,
-        sort=sort,
-    )
-
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/additional-locations"
-        )
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
+    params = list_query_params(page_number, page_size, include, fields, sort)
 
-        return JSONAPIResponse[LocationResource](
-            data=[LocationResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/additional-locations"
+    response = send_request(_get_client(), "GET", url, params=params)
+    return validate_json_response(response, _LOCATION_ADAPTER)
 
 
-@handle_request_errors
 def add_record_additional_location(
     record_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[LocationResource]:
@@ -1353,35 +2897,47 @@ def add_record_additional_location(
         >>> response = opengov_api.add_record_additional_location("12345", location_data)
         >>> print(response.data.attributes.address)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/additional-locations"
-        )
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
+    url = f"{_records_prefix()}/{record_id}/additional-locations"
+    response = send_request(_get_client(), "POST", url, content=dump_json(data))
+    return validate_json_response(response, _LOCATION_ADAPTER)
 
-        return JSONAPIResponse[LocationResource](
-            data=LocationResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+
+@overload
+def get_record_additional_location(
+    record_id: str,
+    location_id: str,
+    *,
+    raw: Literal[False] = False,
+) -> JSONAPIResponse[LocationResource]: ...
 
 
-@handle_request_errors
+@overload
 def get_record_additional_location(
-    record_id: str, location_id: str
-) -> JSONAPIResponse[LocationResource]:
+    record_id: str,
+    location_id: str,
+    *,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def get_record_additional_location(
+    record_id: str,
+    location_id: str,
+    *,
+    raw: bool = False,
+) -> JSONAPIResponse[LocationResource] | dict[str, Any]:
     """
     Get a specific additional location on a record.
 
     Args:
         record_id: The ID of the record
         location_id: The ID of the location
+        raw: Return the parsed JSON document as plain dicts without
+            building any models (default False)
 
     Returns:
         JSONAPIResponse containing the LocationResource
+        (the parsed JSON:API document as a dict when raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -1398,25 +2954,13 @@ def get_record_additional_location(
         >>> response = opengov_api.get_record_additional_location("12345", "loc-123")
         >>> print(response.data.attributes.address)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/additional-locations/{location_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[LocationResource](
-            data=LocationResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/additional-locations/{location_id}",
+        _LOCATION_ADAPTER,
+        raw,
+    )
 
 
-@handle_request_errors
 def remove_record_additional_location(record_id: str, location_id: str) -> None:
     """
     Remove an additional location from a record.
@@ -1438,18 +2982,11 @@ def remove_record_additional_location(record_id: str, location_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.remove_record_additional_location("12345", "loc-123")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/additional-locations/{location_id}",
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/additional-locations/{location_id}"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Attachments endpoints
-@handle_request_errors
 def list_record_attachments(
     record_id: str,
     *,
@@ -1489,31 +3026,13 @@ def list_record_attachments(
         >>> for attachment in response.data:
         ...     print(f"{attachment.attributes.filename}: {attachment.attributes.size} bytes")
     """
-    params_model = ListRecordAttachmentsParams(
-        page_number=page_number,
-        page_size=page_size,
-        include=include,
-        fields=fields,
-        sort=sort,
-    )
+    params = list_query_params(page_number, page_size, include, fields, sort)
 
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/attachments"
-        )
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[AttachmentResource](
-            data=[AttachmentResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/attachments"
+    response = send_request(_get_client(), "GET", url, params=params)
+    return validate_json_response(response, _ATTACHMENT_ADAPTER)
 
 
-@handle_request_errors
 def add_record_attachment(
     record_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[AttachmentResource]:
@@ -1543,35 +3062,47 @@ def add_record_attachment(
         >>> response = opengov_api.add_record_attachment("12345", attachment_data)
         >>> print(response.data.attributes.filename)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/attachments"
-        )
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
+    url = f"{_records_prefix()}/{record_id}/attachments"
+    response = send_request(_get_client(), "POST", url, content=dump_json(data))
+    return validate_json_response(response, _ATTACHMENT_ADAPTER)
 
-        return JSONAPIResponse[AttachmentResource](
-            data=AttachmentResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
 
+@overload
+def get_record_attachment(
+    record_id: str,
+    attachment_id: str,
+    *,
+    raw: Literal[False] = False,
+) -> JSONAPIResponse[AttachmentResource]: ...
 
-@handle_request_errors
+
+@overload
 def get_record_attachment(
-    record_id: str, attachment_id: str
-) -> JSONAPIResponse[AttachmentResource]:
+    record_id: str,
+    attachment_id: str,
+    *,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def get_record_attachment(
+    record_id: str,
+    attachment_id: str,
+    *,
+    raw: bool = False,
+) -> JSONAPIResponse[AttachmentResource] | dict[str, Any]:
     """
     Get a specific attachment on a record.
 
     Args:
         record_id: The ID of the record
         attachment_id: The ID of the attachment
+        raw: Return the parsed JSON document as plain dicts without
+            building any models (default False)
 
     Returns:
         JSONAPIResponse containing the AttachmentResource
+        (the parsed JSON:API document as a dict when raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -1588,25 +3119,13 @@ def get_record_attachment(
         >>> response = opengov_api.get_record_attachment("12345", "att-123")
         >>> print(response.data.attributes.filename)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/attachments/{attachment_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[AttachmentResource](
-            data=AttachmentResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/attachments/{attachment_id}",
+        _ATTACHMENT_ADAPTER,
+        raw,
+    )
 
 
-@handle_request_errors
 def remove_record_attachment(record_id: str, attachment_id: str) -> None:
     """
     Remove an attachment from a record.
@@ -1628,30 +3147,47 @@ def remove_record_attachment(record_id: str, attachment_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.remove_record_attachment("12345", "att-123")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/attachments/{attachment_id}",
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/attachments/{attachment_id}"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Change Requests endpoints
-@handle_request_errors
+@overload
 def get_record_change_request(
-    record_id: str, change_request_id: str
-) -> JSONAPIResponse[ChangeRequestResource]:
+    record_id: str,
+    change_request_id: str,
+    *,
+    raw: Literal[False] = False,
+) -> JSONAPIResponse[ChangeRequestResource]: ...
+
+
+@overload
+def get_record_change_request(
+    record_id: str,
+    change_request_id: str,
+    *,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def get_record_change_request(
+    record_id: str,
+    change_request_id: str,
+    *,
+    raw: bool = False,
+) -> JSONAPIResponse[ChangeRequestResource] | dict[str, Any]:
     """
     Get a change request for a record.
 
     Args:
         record_id: The ID of the record
         change_request_id: The ID of the change request
+        raw: Return the parsed JSON document as plain dicts without
+            building any models (default False)
 
     Returns:
         JSONAPIResponse containing change request data
+        (the parsed JSON:API document as a dict when raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -1668,36 +3204,45 @@ def get_record_change_request(
         >>> change_request = opengov_api.get_record_change_request("12345", "cr-123")
         >>> print(change_request.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/change-requests/{change_request_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/change-requests/{change_request_id}",
+        _CHANGE_REQUEST_ADAPTER,
+        raw,
+    )
 
-        return JSONAPIResponse[ChangeRequestResource](
-            data=ChangeRequestResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+
+@overload
+def get_most_recent_record_change_request(
+    record_id: str,
+    *,
+    raw: Literal[False] = False,
+) -> JSONAPIResponse[ChangeRequestResource]: ...
 
 
-@handle_request_errors
+@overload
 def get_most_recent_record_change_request(
     record_id: str,
-) -> JSONAPIResponse[ChangeRequestResource]:
+    *,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def get_most_recent_record_change_request(
+    record_id: str,
+    *,
+    raw: bool = False,
+) -> JSONAPIResponse[ChangeRequestResource] | dict[str, Any]:
     """
     Get the most recent change request for a record.
 
     Args:
         record_id: The ID of the record
+        raw: Return the parsed JSON document as plain dicts without
+            building any models (default False)
 
     Returns:
         JSONAPIResponse containing change request data
+        (the parsed JSON:API document as a dict when raw=True)
 
     Raises:
         OpenGovConfigurationError: If API key or community is not configured
@@ -1714,23 +3259,13 @@ def get_most_recent_record_change_request(
         >>> change_request = opengov_api.get_most_recent_record_change_request("12345")
         >>> print(change_request.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/change-requests"
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[ChangeRequestResource](
-            data=ChangeRequestResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/change-requests"
+    response = send_request(_get_client(), "GET", url)
+    if raw:
+        return parse_json_response(response)
+    return validate_json_response(response, _CHANGE_REQUEST_ADAPTER)
 
 
-@handle_request_errors
 def create_record_change_request(
     record_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[ChangeRequestResource]:
@@ -1760,23 +3295,11 @@ def create_record_change_request(
         >>> change_request = opengov_api.create_record_change_request("12345", change_request_data)
         >>> print(change_request.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/change-requests"
-        )
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[ChangeRequestResource](
-            data=ChangeRequestResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/change-requests"
+    response = send_request(_get_client(), "POST", url, content=dump_json(data))
+    return validate_json_response(response, _CHANGE_REQUEST_ADAPTER)
 
 
-@handle_request_errors
 def cancel_record_change_request(record_id: str, change_request_id: str) -> None:
     """
     Cancel a change request for a record.
@@ -1798,18 +3321,11 @@ def cancel_record_change_request(record_id: str, change_request_id: str) -> None
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.cancel_record_change_request("12345", "cr-123")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/change-requests/{change_request_id}",
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/change-requests/{change_request_id}"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Workflow Steps endpoints
-@handle_request_errors
 def list_record_workflow_steps(
     record_id: str,
     *,
@@ -1849,31 +3365,13 @@ def list_record_workflow_steps(
         >>> for step in response.data:
         ...     print(f"{step.attributes.name}: {step.attributes.status}")
     """
-    params_model = ListRecordWorkflowStepsParams(
-        page_number=page_number,
-        page_size=page_size,
-        include=include,
-        fields=fields,
-        sort=sort,
-    )
+    params = list_query_params(page_number, page_size, include, fields, sort)
 
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/workflow-steps"
-        )
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[WorkflowStepResource](
-            data=[WorkflowStepResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/workflow-steps"
+    response = send_request(_get_client(), "GET", url, params=params)
+    return validate_json_response(response, _WORKFLOW_STEP_ADAPTER)
 
 
-@handle_request_errors
 def create_record_workflow_step(
     record_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[WorkflowStepResource]:
@@ -1903,23 +3401,11 @@ def create_record_workflow_step(
         >>> response = opengov_api.create_record_workflow_step("12345", step_data)
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/workflow-steps"
-        )
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[WorkflowStepResource](
-            data=WorkflowStepResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/workflow-steps"
+    response = send_request(_get_client(), "POST", url, content=dump_json(data))
+    return validate_json_response(response, _WORKFLOW_STEP_ADAPTER)
 
 
-@handle_request_errors
 def get_record_workflow_step(
     record_id: str, step_id: str
 ) -> JSONAPIResponse[WorkflowStepResource]:
@@ -1948,25 +3434,12 @@ def get_record_workflow_step(
         >>> response = opengov_api.get_record_workflow_step("12345", "step-123")
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/workflow-steps/{step_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[WorkflowStepResource](
-            data=WorkflowStepResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}",
+        _WORKFLOW_STEP_ADAPTER,
+    )
 
 
-@handle_request_errors
 def update_record_workflow_step(
     record_id: str, step_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[WorkflowStepResource]:
@@ -1997,25 +3470,11 @@ def update_record_workflow_step(
         >>> response = opengov_api.update_record_workflow_step("12345", "step-123", step_data)
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/workflow-steps/{step_id}",
-        )
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[WorkflowStepResource](
-            data=WorkflowStepResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}"
+    response = send_request(_get_client(), "PATCH", url, content=dump_json(data))
+    return validate_json_response(response, _WORKFLOW_STEP_ADAPTER)
 
 
-@handle_request_errors
 def delete_record_workflow_step(record_id: str, step_id: str) -> None:
     """
     Delete a workflow step from a record.
@@ -2037,18 +3496,11 @@ def delete_record_workflow_step(record_id: str, step_id: str) -> None:
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.delete_record_workflow_step("12345", "step-123")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/workflow-steps/{step_id}",
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Workflow Step Comments endpoints
-@handle_request_errors
 def list_record_workflow_step_comments(
     record_id: str,
     step_id: str,
@@ -2090,33 +3542,13 @@ def list_record_workflow_step_comments(
         >>> for comment in response.data:
         ...     print(f"{comment.attributes.text}")
     """
-    params_model = ListRecordWorkflowStepCommentsParams(
-        page_number=page_number,
-        page_size=page_size,
-        include=include,
-        fields=fields,
-        sort=sort,
-    )
-
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/workflow-steps/{step_id}/comments",
-        )
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
+    params = list_query_params(page_number, page_size, include, fields, sort)
 
-        return JSONAPIResponse[WorkflowStepCommentResource](
-            data=[WorkflowStepCommentResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments"
+    response = send_request(_get_client(), "GET", url, params=params)
+    return validate_json_response(response, _COMMENT_ADAPTER)
 
 
-@handle_request_errors
 def create_record_workflow_step_comment(
     record_id: str, step_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[WorkflowStepCommentResource]:
@@ -2147,25 +3579,11 @@ def create_record_workflow_step_comment(
         >>> response = opengov_api.create_record_workflow_step_comment("12345", "step-123", comment_data)
         >>> print(response.data.attributes.text)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/workflow-steps/{step_id}/comments",
-        )
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[WorkflowStepCommentResource](
-            data=WorkflowStepCommentResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments"
+    response = send_request(_get_client(), "POST", url, content=dump_json(data))
+    return validate_json_response(response, _COMMENT_ADAPTER)
 
 
-@handle_request_errors
 def get_record_workflow_step_comment(
     record_id: str, step_id: str, comment_id: str
 ) -> JSONAPIResponse[WorkflowStepCommentResource]:
@@ -2195,25 +3613,12 @@ def get_record_workflow_step_comment(
         >>> response = opengov_api.get_record_workflow_step_comment("12345", "step-123", "comment-123")
         >>> print(response.data.attributes.text)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/workflow-steps/{step_id}/comments/{comment_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[WorkflowStepCommentResource](
-            data=WorkflowStepCommentResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments/{comment_id}",
+        _COMMENT_ADAPTER,
+    )
 
 
-@handle_request_errors
 def delete_record_workflow_step_comment(
     record_id: str, step_id: str, comment_id: str
 ) -> None:
@@ -2238,18 +3643,11 @@ def delete_record_workflow_step_comment(
         >>> opengov_api.set_community("your-community")
         >>> opengov_api.delete_record_workflow_step_comment("12345", "step-123", "comment-123")
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/workflow-steps/{step_id}/comments/{comment_id}",
-        )
-        response = client.delete(url)
-        response.raise_for_status()
+    url = f"{_records_prefix()}/{record_id}/workflow-steps/{step_id}/comments/{comment_id}"
+    send_request(_get_client(), "DELETE", url)
 
 
 # Record Collections endpoints
-@handle_request_errors
 def list_record_collections(
     record_id: str,
     *,
@@ -2289,31 +3687,13 @@ def list_record_collections(
         >>> for collection in response.data:
         ...     print(f"{collection.attributes.name}")
     """
-    params_model = ListRecordCollectionsParams(
-        page_number=page_number,
-        page_size=page_size,
-        include=include,
-        fields=fields,
-        sort=sort,
-    )
-
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(), get_community(), f"records/{record_id}/collections"
-        )
-        response = client.get(url, params=params_model.to_query_params())
-        response.raise_for_status()
-        data = parse_json_response(response)
+    params = list_query_params(page_number, page_size, include, fields, sort)
 
-        return JSONAPIResponse[CollectionResource](
-            data=[CollectionResource(**item) for item in data["data"]],
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/collections"
+    response = send_request(_get_client(), "GET", url, params=params)
+    return validate_json_response(response, _COLLECTION_ADAPTER)
 
 
-@handle_request_errors
 def get_record_collection(
     record_id: str, collection_id: str
 ) -> JSONAPIResponse[CollectionResource]:
@@ -2342,25 +3722,12 @@ def get_record_collection(
         >>> response = opengov_api.get_record_collection("12345", "coll-123")
         >>> print(response.data.attributes.name)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/collections/{collection_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[CollectionResource](
-            data=CollectionResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/collections/{collection_id}",
+        _COLLECTION_ADAPTER,
+    )
 
 
-@handle_request_errors
 def create_record_collection_entry(
     record_id: str, collection_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[CollectionEntryResource]:
@@ -2391,25 +3758,61 @@ def create_record_collection_entry(
         >>> entry = opengov_api.create_record_collection_entry("12345", "coll-123", entry_data)
         >>> print(entry.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/collections/{collection_id}",
-        )
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
+    url = f"{_records_prefix()}/{record_id}/collections/{collection_id}"
+    response = send_request(_get_client(), "POST", url, content=dump_json(data))
+    return validate_json_response(response, _COLLECTION_ENTRY_ADAPTER)
 
-        return JSONAPIResponse[CollectionEntryResource](
-            data=CollectionEntryResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+
+def create_record_collection_entries(
+    record_id: str,
+    collection_id: str,
+    entries: list[dict[str, Any]],
+    *,
+    max_concurrency: int = 16,
+) -> list[JSONAPIResponse[CollectionEntryResource]]:
+    """
+    Create several entries in a record collection concurrently.
+
+    The entries are posted in parallel over a single pooled
+    httpx.AsyncClient, at most max_concurrency at a time, so bulk imports
+    pay roughly one round trip per batch instead of one per entry. A
+    failed entry does not stop the others, and entries that were created
+    are not rolled back: the raised OpenGovBulkRequestError holds each
+    entry's response or exception, in order. Must be called from
+    synchronous code.
+
+    Args:
+        record_id: The ID of the record
+        collection_id: The ID of the collection
+        entries: Entry payloads, each as accepted by
+            create_record_collection_entry
+        max_concurrency: Maximum number of requests in flight (default 16)
+
+    Returns:
+        One JSONAPIResponse per entry, in the order given
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+        OpenGovConfigurationError: If API key or community is not configured
+        OpenGovBulkRequestError: If any entry failed; its results hold the
+            created entries and the per-entry exceptions
+
+    Example:
+        >>> import opengov_api
+        >>> rows = [{"data": {...}}, {"data": {...}}]
+        >>> created = opengov_api.create_record_collection_entries(
+        ...     "12345", "coll-123", rows
+        ... )
+        >>> print([entry.data.id for entry in created])
+    """
+    _check_max_concurrency(max_concurrency)
+    url = f"{_records_prefix()}/{record_id}/collections/{collection_id}"
+    bodies = [dump_json(entry) for entry in entries]
+    return asyncio.run(
+        _gather_posts(url, bodies, _COLLECTION_ENTRY_ADAPTER, max_concurrency)
+    )
 
 
-@handle_request_errors
 def get_record_collection_entry(
     record_id: str, collection_id: str, entry_id: str
 ) -> JSONAPIResponse[CollectionEntryResource]:
@@ -2439,25 +3842,12 @@ def get_record_collection_entry(
         >>> entry = opengov_api.get_record_collection_entry("12345", "coll-123", "entry-123")
         >>> print(entry.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/collections/{collection_id}/entries/{entry_id}",
-        )
-        response = client.get(url)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[CollectionEntryResource](
-            data=CollectionEntryResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    return _get_cached_resource(
+        f"{_records_prefix()}/{record_id}/collections/{collection_id}/entries/{entry_id}",
+        _COLLECTION_ENTRY_ADAPTER,
+    )
 
 
-@handle_request_errors
 def update_record_collection_entry(
     record_id: str, collection_id: str, entry_id: str, data: dict[str, Any]
 ) -> JSONAPIResponse[CollectionEntryResource]:
@@ -2489,19 +3879,6 @@ def update_record_collection_entry(
         >>> entry = opengov_api.update_record_collection_entry("12345", "coll-123", "entry-123", entry_data)
         >>> print(entry.data.id)
     """
-    with _get_client() as client:
-        url = build_url(
-            get_base_url(),
-            get_community(),
-            f"records/{record_id}/collections/{collection_id}/entries/{entry_id}",
-        )
-        response = client.patch(url, json=data)
-        response.raise_for_status()
-        data = parse_json_response(response)
-
-        return JSONAPIResponse[CollectionEntryResource](
-            data=CollectionEntryResource(**data["data"]),
-            included=data.get("included"),
-            links=Links(**data["links"]) if data.get("links") else None,
-            meta=Meta(**data["meta"]) if data.get("meta") else None,
-        )
+    url = f"{_records_prefix()}/{record_id}/collections/{collection_id}/entries/{entry_id}"
+    response = send_request(_get_client(), "PATCH", url, content=dump_json(data))
+    return validate_json_response(response, _COLLECTION_ENTRY_ADAPTER)
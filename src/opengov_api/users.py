@@ -44,7 +44,7 @@ print(flags)
 from typing import Any
 
 
-from .base import build_url, handle_request_errors, parse_json_response
+from .base import build_url, dump_json, handle_request_errors, parse_json_response
 from .client import _get_client, get_base_url, get_community
 
 
@@ -70,11 +70,11 @@ def list_users() -> dict[str, Any]:
         >>> users = opengov_api.list_users()
         >>> print(users)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "users")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "users")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -102,11 +102,11 @@ def get_user(user_id: str) -> dict[str, Any]:
         >>> user = opengov_api.get_user("user-12345")
         >>> print(user)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"users/{user_id}")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"users/{user_id}")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -143,11 +143,11 @@ def create_user(data: dict[str, Any]) -> dict[str, Any]:
         ... })
         >>> print(new_user)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), "users")
-        response = client.post(url, json=data)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), "users")
+    response = client.post(url, content=dump_json(data))
+    response.raise_for_status()
+    return parse_json_response(response)
 
 
 @handle_request_errors
@@ -175,8 +175,8 @@ def list_user_flags(user_id: str) -> dict[str, Any]:
         >>> flags = opengov_api.list_user_flags("user-12345")
         >>> print(flags)
     """
-    with _get_client() as client:
-        url = build_url(get_base_url(), get_community(), f"users/{user_id}/flags")
-        response = client.get(url)
-        response.raise_for_status()
-        return parse_json_response(response)
+    client = _get_client()
+    url = build_url(get_base_url(), get_community(), f"users/{user_id}/flags")
+    response = client.get(url)
+    response.raise_for_status()
+    return parse_json_response(response)
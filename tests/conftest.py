@@ -141,6 +141,8 @@ def reset_config(test_base_url):
     client._community = None
     client._timeout = 30.0
     client._retry_config = RetryConfig()  # Reset to default
+    opengov_api.clear_record_type_cache()
+    opengov_api.clear_record_cache()
 
     yield
 
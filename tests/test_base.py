@@ -1,19 +1,29 @@
 """Tests for base utility functions."""
 
+import threading
 from unittest.mock import patch
 
 import httpx
 import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from opengov_api.base import (
     build_url,
+    dump_json,
+    encode_request_body,
     make_status_error,
     parse_json_response,
+    parse_url,
+    validate_json_response,
+    iter_prefetched_pages,
+    iter_streamed_items,
     handle_request_errors,
+    send_request,
     _calculate_retry_delay,
     _is_retryable_error,
 )
 from opengov_api.client import get_retry_config
+from opengov_api.models import JSONAPIResponse, Links
 from opengov_api.exceptions import (
     OpenGovBadRequestError,
     OpenGovAuthenticationError,
@@ -174,6 +184,205 @@ class TestParseJsonResponse:
         with pytest.raises(OpenGovResponseParseError):
             parse_json_response(response)
 
+    def test_parse_valid_json_without_orjson(self):
+        """Test the stdlib fallback is used when orjson is not installed."""
+        response = httpx.Response(200, json={"data": "value"})
+        with patch("opengov_api.base.orjson", None):
+            result = parse_json_response(response)
+        assert result == {"data": "value"}
+
+    def test_parse_invalid_json_without_orjson(self):
+        """Test the stdlib fallback raises OpenGovResponseParseError."""
+        response = httpx.Response(200, text="not valid json")
+        with patch("opengov_api.base.orjson", None):
+            with pytest.raises(OpenGovResponseParseError):
+                parse_json_response(response)
+
+
+class TestValidateJsonResponse:
+    """Tests for validate_json_response function."""
+
+    adapter = TypeAdapter(dict[str, int])
+
+    def test_validate_valid_json(self):
+        """Test valid JSON is parsed and validated in one step."""
+        response = httpx.Response(200, json={"count": 3})
+        assert validate_json_response(response, self.adapter) == {"count": 3}
+
+    def test_validate_invalid_json(self):
+        """Test malformed JSON raises OpenGovResponseParseError."""
+        response = httpx.Response(200, text="not valid json")
+        with pytest.raises(OpenGovResponseParseError) as exc_info:
+            validate_json_response(response, self.adapter)
+        assert "Failed to parse JSON" in str(exc_info.value)
+        assert exc_info.value.body == "not valid json"
+
+    def test_validate_schema_mismatch(self):
+        """Test well-formed JSON of the wrong shape raises ValidationError."""
+        response = httpx.Response(200, json={"count": "many"})
+        with pytest.raises(ValidationError):
+            validate_json_response(response, self.adapter)
+
+
+class TestIterPrefetchedPages:
+    """Tests for iter_prefetched_pages function."""
+
+    @staticmethod
+    def make_fetch(last_page: int, requested: list[int]):
+        def fetch(page: int) -> JSONAPIResponse[int]:
+            requested.append(page)
+            links = Links(next=f"?page={page + 1}") if page < last_page else None
+            return JSONAPIResponse[int](data=[page], links=links)
+
+        return fetch
+
+    def test_yields_all_pages_in_order(self):
+        """Test every page is fetched once and yielded in order."""
+        requested: list[int] = []
+        pages = list(iter_prefetched_pages(self.make_fetch(3, requested)))
+        assert [page.data for page in pages] == [[1], [2], [3]]
+        assert requested == [1, 2, 3]
+
+    def test_single_page_does_not_prefetch(self):
+        """Test no request is made past the last page."""
+        requested: list[int] = []
+        pages = list(iter_prefetched_pages(self.make_fetch(1, requested)))
+        assert len(pages) == 1
+        assert requested == [1]
+
+    def test_prefetches_next_page_before_yield(self):
+        """Test the next page is requested while the current one is consumed."""
+        requested: list[int] = []
+        page_two_requested = threading.Event()
+        fetch = self.make_fetch(5, requested)
+
+        def tracked_fetch(page: int) -> JSONAPIResponse[int]:
+            if page == 2:
+                page_two_requested.set()
+            return fetch(page)
+
+        pages = iter_prefetched_pages(tracked_fetch)
+        assert next(pages).data == [1]
+        # Page 2 is requested while the caller still holds page 1
+        assert page_two_requested.wait(timeout=5)
+        pages.close()
+        assert requested == [1, 2]
+
+    def test_propagates_fetch_errors(self):
+        """Test an error fetching a later page is raised when it is reached."""
+
+        def fetch(page: int) -> JSONAPIResponse[int]:
+            if page == 2:
+                raise ValueError("gone")
+            return JSONAPIResponse[int](data=[page], links=Links(next="?page=2"))
+
+        pages = iter_prefetched_pages(fetch)
+        assert next(pages).data == [1]
+        with pytest.raises(ValueError, match="gone"):
+            next(pages)
+
+
+class TestIterStreamedItems:
+    """Tests for iter_streamed_items function."""
+
+    class Item(BaseModel):
+        id: int
+        tags: list[str] = []
+
+    def test_builds_items_and_follows_top_level_next(self):
+        """Test nested containers and nested links.next do not confuse paging."""
+        bodies = {
+            1: b'{"data": [{"id": 1, "tags": ["a"], "links": {"next": "x"}},'
+            b' {"id": 2}], "links": {"next": "?page=2"}}',
+            2: b'{"links": {"next": null}, "data": [{"id": 3,'
+            b' "links": {"next": "y"}}]}',
+        }
+        requested: list[int] = []
+
+        def open_page(page: int) -> httpx.Response:
+            requested.append(page)
+            return httpx.Response(200, content=bodies[page])
+
+        items = list(iter_streamed_items(open_page, self.Item))
+
+        assert [(item.id, item.tags) for item in items] == [
+            (1, ["a"]),
+            (2, []),
+            (3, []),
+        ]
+        assert requested == [1, 2]
+
+    def test_invalid_json_raises_parse_error(self):
+        """Test a malformed page body raises OpenGovResponseParseError."""
+        pages = iter_streamed_items(
+            lambda page: httpx.Response(200, content=b'{"data": [{"id": 1},'),
+            self.Item,
+        )
+        with pytest.raises(OpenGovResponseParseError):
+            list(pages)
+
+
+class TestDumpJson:
+    """Tests for request body serialization."""
+
+    def test_dump_json_is_compact_utf8(self):
+        """Test output matches the compact encoding httpx uses for json=."""
+        body = dump_json({"name": "Café", "ids": [1, 2]})
+        assert body == '{"name":"Café","ids":[1,2]}'.encode()
+
+    def test_encode_request_body_drops_unset_model_fields(self):
+        """Test models are serialized by alias without None values."""
+        from opengov_api.models import RecordUpdateRequest
+
+        body = encode_request_body(
+            RecordUpdateRequest(data={"attributes": {"status": "ACTIVE"}})
+        )
+        assert body == b'{"data":{"type":"records","attributes":{"status":"ACTIVE"}}}'
+
+    def test_encode_request_body_passes_dicts_through(self):
+        """Test plain dictionaries are encoded as given."""
+        assert encode_request_body({"data": None}) == b'{"data":null}'
+
+
+class TestParseUrl:
+    """Tests for parse_url function."""
+
+    def test_reuses_parsed_url(self):
+        """Test repeated URLs are parsed once and shared."""
+        url = "https://api.example.com/v2/community/records/123"
+
+        parsed = parse_url(url)
+
+        assert isinstance(parsed, httpx.URL)
+        assert str(parsed) == url
+        assert parse_url(url) is parsed
+
+
+class TestSendRequest:
+    """Tests for send_request function."""
+
+    @patch("time.sleep")
+    def test_retries_then_returns_response(self, mock_sleep):
+        """Test transient statuses are retried and the response returned."""
+        statuses = iter([503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"ok": True})
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            response = send_request(client, "GET", "http://test/x", params={"a": 1})
+
+        assert response.status_code == 200
+        assert response.request.url.params["a"] == "1"
+        assert mock_sleep.call_count == 1
+
+    def test_maps_error_status(self):
+        """Test error statuses are raised as SDK exceptions."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+        with httpx.Client(transport=transport) as client:
+            with pytest.raises(OpenGovNotFoundError):
+                send_request(client, "DELETE", "http://test/x")
+
 
 class TestHandleRequestErrors:
     """Tests for handle_request_errors decorator."""
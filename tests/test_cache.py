@@ -0,0 +1,313 @@
+"""Tests for response caching utilities."""
+
+import threading
+from unittest.mock import patch
+
+import httpx
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+import opengov_api
+from opengov_api.cache import _MISSING, SingleFlight, TTLCache, cached_response
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_missing_key(self):
+        """Test absent keys return the sentinel."""
+        cache = TTLCache()
+        assert cache.get("missing") is _MISSING
+
+    def test_set_and_get(self):
+        """Test stored values are returned."""
+        cache = TTLCache()
+        cache.set("key", {"data": 1})
+        assert cache.get("key") == {"data": 1}
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL has passed."""
+        cache = TTLCache(ttl=10.0)
+        with patch("opengov_api.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("opengov_api.cache.time.monotonic", return_value=109.0):
+            assert cache.get("key") == "value"
+        with patch("opengov_api.cache.time.monotonic", return_value=110.0):
+            assert cache.get("key") is _MISSING
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is _MISSING
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        """Test clear removes all entries."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestCachedResponse:
+    """Tests for cached_response decorator."""
+
+    @pytest.fixture
+    def counted(self, configure_client):
+        calls: list[str] = []
+        cache = TTLCache()
+
+        @cached_response(cache)
+        def fetch(resource_id: str) -> dict:
+            calls.append(resource_id)
+            return {"data": {"id": resource_id}}
+
+        return fetch, calls
+
+    def test_repeated_calls_hit_cache(self, counted):
+        """Test the wrapped function runs once per distinct argument."""
+        fetch, calls = counted
+        assert fetch("a") == {"data": {"id": "a"}}
+        assert fetch("a") == {"data": {"id": "a"}}
+        assert fetch("b") == {"data": {"id": "b"}}
+        assert calls == ["a", "b"]
+
+    def test_returns_independent_copies(self, counted):
+        """Test mutating a result does not corrupt the cached entry."""
+        fetch, _ = counted
+        fetch("a")["data"]["id"] = "mutated"
+        assert fetch("a") == {"data": {"id": "a"}}
+
+    def test_keyed_on_community(self, counted):
+        """Test a different community does not reuse cached results."""
+        fetch, calls = counted
+        fetch("a")
+        opengov_api.set_community("othercommunity")
+        fetch("a")
+        assert calls == ["a", "a"]
+
+    def test_errors_are_not_cached(self, configure_client):
+        """Test failed calls are retried on the next invocation."""
+        attempts: list[int] = []
+
+        @cached_response(TTLCache())
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("transient")
+            return "ok"
+
+        with pytest.raises(ValueError):
+            flaky()
+        assert flaky() == "ok"
+        assert len(attempts) == 2
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test callers arriving mid-flight get the leader's result."""
+        flight = SingleFlight()
+        entered = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            entered.set()
+            release.wait(5)
+            return "value"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        leader.start()
+        entered.wait(5)
+        follower = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        follower.start()
+        # Give the follower time to join the in-flight call
+        threading.Event().wait(0.05)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert results == ["value", "value"]
+        assert len(calls) == 1
+
+    def test_exception_is_raised_and_not_kept(self):
+        """Test failures propagate and the next call runs again."""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: "ok") == "ok"
+
+
+class TestConditionalGet:
+    """Tests for ETag revalidation of record lookups."""
+
+    RECORD = {"data": {"id": "123", "type": "records", "attributes": {}}}
+
+    def test_not_modified_is_served_from_cache(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test a 304 answer returns the cached record."""
+        url = build_url("testcommunity/records/123")
+        httpx_mock.add_response(url=url, json=self.RECORD, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(
+            url=url, status_code=304, match_headers={"If-None-Match": '"v1"'}
+        )
+
+        first = opengov_api.get_record("123")
+        second = opengov_api.get_record("123")
+
+        assert second == first
+        assert second is not first
+        assert second.data.id == "123"
+
+    def test_mutating_result_does_not_corrupt_cache(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test nested containers of a result are not shared with the cache."""
+        url = build_url("testcommunity/records/123")
+        httpx_mock.add_response(
+            url=url,
+            json={**self.RECORD, "included": [{"id": "app-1", "type": "applicants"}]},
+            headers={"ETag": '"v1"'},
+        )
+        httpx_mock.add_response(
+            url=url, status_code=304, match_headers={"If-None-Match": '"v1"'}
+        )
+
+        opengov_api.get_record("123").included.clear()
+        second = opengov_api.get_record("123")
+
+        assert second.included == [{"id": "app-1", "type": "applicants"}]
+
+    def test_changed_resource_replaces_entry(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test a 200 answer to a conditional request is parsed and stored."""
+        url = build_url("testcommunity/records/123/applicant")
+        httpx_mock.add_response(
+            url=url,
+            json={"data": {"id": "u-1", "type": "applicants", "attributes": {}}},
+            headers={"ETag": '"v1"'},
+        )
+        httpx_mock.add_response(
+            url=url,
+            json={"data": {"id": "u-2", "type": "applicants", "attributes": {}}},
+            headers={"ETag": '"v2"'},
+            match_headers={"If-None-Match": '"v1"'},
+        )
+        httpx_mock.add_response(
+            url=url, status_code=304, match_headers={"If-None-Match": '"v2"'}
+        )
+
+        assert opengov_api.get_record_applicant("123").data.id == "u-1"
+        assert opengov_api.get_record_applicant("123").data.id == "u-2"
+        assert opengov_api.get_record_applicant("123").data.id == "u-2"
+
+    def test_responses_without_etag_are_not_cached(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test no conditional header is sent when no ETag was returned."""
+        url = build_url("testcommunity/records/123")
+        httpx_mock.add_response(url=url, json=self.RECORD)
+        httpx_mock.add_response(url=url, json=self.RECORD)
+
+        opengov_api.get_record("123")
+        opengov_api.get_record("123")
+
+        assert all(
+            "If-None-Match" not in request.headers
+            for request in httpx_mock.get_requests()
+        )
+
+    def test_sub_resource_lookups_are_revalidated(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test single sub-resource lookups share the ETag cache."""
+        url = build_url("testcommunity/records/123/attachments/att-1")
+        httpx_mock.add_response(
+            url=url,
+            json={"data": {"id": "att-1", "type": "attachments", "attributes": {}}},
+            headers={"ETag": '"v1"'},
+        )
+        httpx_mock.add_response(
+            url=url, status_code=304, match_headers={"If-None-Match": '"v1"'}
+        )
+        httpx_mock.add_response(url=url, json={"data": {"id": "att-1"}})
+
+        assert opengov_api.get_record_attachment("123", "att-1").data.id == "att-1"
+        assert opengov_api.get_record_attachment("123", "att-1").data.id == "att-1"
+        opengov_api.clear_record_cache()
+        assert opengov_api.get_record_attachment("123", "att-1", raw=True) == {
+            "data": {"id": "att-1"}
+        }
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+
+    def test_collection_entry_not_modified(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test collection entry lookups are served from cache on a 304."""
+        url = build_url("testcommunity/records/123/collections/col-1/entries/e-1")
+        httpx_mock.add_response(
+            url=url,
+            json={"data": {"id": "e-1", "type": "entries", "attributes": {}}},
+            headers={"ETag": '"v1"'},
+        )
+        httpx_mock.add_response(
+            url=url, status_code=304, match_headers={"If-None-Match": '"v1"'}
+        )
+
+        first = opengov_api.get_record_collection_entry("123", "col-1", "e-1")
+        second = opengov_api.get_record_collection_entry("123", "col-1", "e-1")
+
+        assert second == first
+        assert second is not first
+
+    def test_concurrent_record_lookups_share_one_request(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test simultaneous get_record calls for one record send one request."""
+        entered = threading.Event()
+        release = threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            entered.set()
+            release.wait(5)
+            return httpx.Response(200, json=self.RECORD)
+
+        httpx_mock.add_callback(
+            respond, url=build_url("testcommunity/records/123"), is_reusable=True
+        )
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(opengov_api.get_record("123"))
+            )
+            for _ in range(2)
+        ]
+        threads[0].start()
+        entered.wait(5)
+        threads[1].start()
+        threading.Event().wait(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert [result.data.id for result in results] == ["123", "123"]
+        assert results[0] is not results[1]
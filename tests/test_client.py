@@ -1,5 +1,6 @@
 """Tests for client configuration and factory."""
 
+import asyncio
 import os
 from unittest.mock import patch
 
@@ -20,7 +21,14 @@ from opengov_api.client import (
     get_timeout,
     get_auth_scheme,
     get_retry_config,
+    _HTTP2,
+    _POOL_LIMITS,
+    _close_client,
+    _get_async_client,
     _get_client,
+    _get_shared_async_client,
+    _record_types_prefix,
+    _records_prefix,
 )
 from opengov_api.exceptions import OpenGovConfigurationError
 
@@ -177,23 +185,67 @@ class TestGetClient:
         )
         client.close()
 
-    def test_get_client_context_manager(self):
-        """Test _get_client can be used as context manager."""
+    def test_get_client_reuses_shared_instance(self):
+        """Test _get_client returns the same pooled client across calls."""
         set_api_key("test-key")
-        with _get_client() as client:
-            assert isinstance(client, httpx.Client)
-            assert not client.is_closed
-        # Client should be closed after context
-        assert client.is_closed
+        client1 = _get_client()
+        client2 = _get_client()
+        assert client1 is client2
+        assert not client1.is_closed
+
+    def test_get_client_keeps_connections_alive(self):
+        """Test the shared client pools keep-alive connections."""
+        set_api_key("test-key")
+        _close_client()
+        with patch("opengov_api.client.httpx.Client", wraps=httpx.Client) as factory:
+            _get_client()
+        assert factory.call_args.kwargs["limits"] == _POOL_LIMITS
+        assert _POOL_LIMITS.max_connections == 64
+        assert _POOL_LIMITS.max_keepalive_connections == 32
+
+    def test_get_client_negotiates_http2_when_available(self):
+        """Test HTTP/2 is enabled exactly when h2 is installed."""
+        set_api_key("test-key")
+        _close_client()
+        with patch("opengov_api.client.httpx.Client", wraps=httpx.Client) as factory:
+            _get_client()
+        assert factory.call_args.kwargs["http2"] is _HTTP2
+
+    def test_get_client_negotiates_compression(self):
+        """Test the client leaves Accept-Encoding to httpx's decoder support."""
+        set_api_key("test-key")
+        accepted = _get_client().headers["Accept-Encoding"].split(", ")
+        assert "gzip" in accepted
+        assert set(accepted) <= {"gzip", "deflate", "br", "zstd"}
 
-    def test_get_client_creates_new_instance(self):
-        """Test _get_client creates new client instance each time."""
+    def test_get_client_rebuilds_when_settings_change(self):
+        """Test changing settings replaces the old client without closing it."""
         set_api_key("test-key")
         client1 = _get_client()
+        set_timeout(10.0)
         client2 = _get_client()
-        assert client1 is not client2
+        assert client2 is not client1
+        # Other threads may still be sending on the replaced client
+        assert not client1.is_closed
+        assert not client2.is_closed
         client1.close()
-        client2.close()
+
+    def test_get_client_rebuilds_after_close(self):
+        """Test a closed shared client is replaced on the next call."""
+        set_api_key("test-key")
+        client1 = _get_client()
+        client1.close()
+        client2 = _get_client()
+        assert client2 is not client1
+        assert not client2.is_closed
+
+    def test_close_client(self):
+        """Test _close_client closes the shared client."""
+        set_api_key("test-key")
+        client = _get_client()
+        _close_client()
+        assert client.is_closed
+        assert _get_client() is not client
 
     def test_get_client_updates_with_new_api_key(self):
         """Test _get_client uses updated API key."""
@@ -244,6 +296,110 @@ class TestGetClient:
         client3.close()
 
 
+class TestGetAsyncClient:
+    """Tests for _get_async_client factory function."""
+
+    def test_get_async_client_requires_api_key(self):
+        """Test _get_async_client raises error when API key not set."""
+        with pytest.raises(OpenGovConfigurationError):
+            _get_async_client()
+
+    def test_get_async_client_matches_sync_configuration(self):
+        """Test the async client uses the same auth header and timeout."""
+        set_api_key("test-key")
+        set_auth_scheme("bearer")
+        set_timeout(45.0)
+        client = _get_async_client()
+        assert isinstance(client, httpx.AsyncClient)
+        assert client.headers["Authorization"] == "Bearer test-key"
+        assert client.timeout.connect == 45.0
+        assert _get_async_client() is not client
+
+
+class TestGetSharedAsyncClient:
+    """Tests for _get_shared_async_client."""
+
+    def test_requires_running_loop(self):
+        """Test calling outside a coroutine raises."""
+        set_api_key("test-key")
+        with pytest.raises(RuntimeError):
+            _get_shared_async_client()
+
+    def test_reused_per_loop_and_rebuilt_on_change(self):
+        """Test one client per loop, replaced when settings change."""
+        set_api_key("test-key")
+
+        async def clients():
+            first = _get_shared_async_client()
+            same = _get_shared_async_client()
+            set_timeout(10.0)
+            second = _get_shared_async_client()
+            await asyncio.sleep(0)
+            # The replaced client may still have requests in flight
+            assert not first.is_closed
+            return first, same, second
+
+        first, same, second = asyncio.run(clients())
+        assert first is same
+        assert second is not first
+        assert first.is_closed
+        assert second.is_closed
+
+    def test_closed_when_loop_shuts_down(self):
+        """Test asyncio.run closes the loop's client instead of leaking it."""
+        set_api_key("test-key")
+
+        async def client():
+            return _get_shared_async_client()
+
+        assert asyncio.run(client()).is_closed
+
+    def test_separate_loops_get_separate_clients(self):
+        """Test clients are never shared across event loops."""
+        set_api_key("test-key")
+
+        async def client():
+            return _get_shared_async_client()
+
+        assert asyncio.run(client()) is not asyncio.run(client())
+
+
+class TestUrlPrefix:
+    """Tests for cached resource URL prefixes."""
+
+    def test_record_types_prefix(self):
+        """Test the prefix combines base URL, community and resource."""
+        set_community("your-community")
+        assert (
+            _record_types_prefix()
+            == "https://api.plce.opengov.com/plce/v2/your-community/record-types"
+        )
+
+    def test_record_types_prefix_follows_configuration(self):
+        """Test changing base URL or community yields a fresh prefix."""
+        set_community("first")
+        first = _record_types_prefix()
+        set_community("second")
+        set_base_url("https://custom.api.com/v3/")
+        assert first.endswith("/first/record-types")
+        assert _record_types_prefix() == (
+            "https://custom.api.com/v3/second/record-types"
+        )
+
+    def test_records_prefix(self):
+        """Test the records prefix shares the cached builder."""
+        set_community("your-community")
+        assert _records_prefix() == (
+            "https://api.plce.opengov.com/plce/v2/your-community/records"
+        )
+        assert _records_prefix() is _records_prefix()
+
+    def test_record_types_prefix_requires_community(self):
+        """Test the prefix raises when community is not configured."""
+        with pytest.raises(OpenGovConfigurationError):
+            _record_types_prefix()
+
+
 class TestRetryConfiguration:
     """Tests for retry configuration."""
 
@@ -9,6 +9,7 @@ from opengov_api.exceptions import (
     OpenGovAPIConnectionError,
     OpenGovAPITimeoutError,
     OpenGovResponseParseError,
+    OpenGovBulkRequestError,
     OpenGovAPIStatusError,
     OpenGovBadRequestError,
     OpenGovAuthenticationError,
@@ -63,6 +64,15 @@ def test_response_parse_error():
     assert isinstance(error, OpenGovAPIError)
 
 
+def test_bulk_request_error():
+    """Test bulk error keeps every result and indexes the failures."""
+    failure = OpenGovAPIError("boom")
+    error = OpenGovBulkRequestError("1 of 2 requests failed", results=["ok", failure])
+    assert error.results == ["ok", failure]
+    assert error.errors == {1: failure}
+    assert isinstance(error, OpenGovAPIError)
+
+
 def test_status_error():
     """Test status error with response context."""
     response = httpx.Response(
@@ -153,6 +153,18 @@ class TestInfrastructure:
                 opengov_api.list_projects,
                 "testcommunity/projects",
             ),
+            (
+                opengov_api.list_record_types,
+                "testcommunity/record-types",
+            ),
+            (
+                lambda: opengov_api.list_records(fast=True),
+                "testcommunity/records",
+            ),
+            (
+                lambda: opengov_api.list_record_types(fast=True),
+                "testcommunity/record-types",
+            ),
         ],
     )
     def test_handles_invalid_json(
@@ -6,9 +6,12 @@ and test_common_endpoints.py. This file only tests behaviors unique to
 the record-types endpoint.
 """
 
+import pytest
+from pydantic import ValidationError
 from pytest_httpx import HTTPXMock
 
 import opengov_api
+from opengov_api.models import RecordTypeResource
 
 
 class TestRecordTypesEndpoint:
@@ -70,6 +73,80 @@ class TestRecordTypesEndpoint:
         assert result.total_records() == 1
         assert not result.has_next_page()
 
+    def test_list_record_types_without_validation(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test validate=False builds models from the raw JSON."""
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/record-types?page%5Bnumber%5D=1&page%5Bsize%5D=20"
+            ),
+            json={
+                "data": [
+                    {
+                        "id": "rt-12345",
+                        "type": "recordType",
+                        "attributes": {
+                            "name": "Building Permit",
+                            "isEnabled": True,
+                            "createdAt": "2025-01-01T00:00:00Z",
+                        },
+                    }
+                ],
+                "links": {"next": "http://example.com/record-types?page[number]=2"},
+                "meta": {"page": 1, "size": 20, "totalPages": 2, "totalRecords": 21},
+            },
+        )
+
+        result = opengov_api.list_record_types(validate=False)
+
+        record_type = result.data[0]
+        assert record_type.id == "rt-12345"
+        assert record_type.attributes.name == "Building Permit"
+        assert record_type.attributes.is_enabled is True
+        # No coercion: datetimes are left as the API's ISO strings
+        assert record_type.attributes.created_at == "2025-01-01T00:00:00Z"
+        assert result.has_next_page()
+        assert result.total_records() == 21
+
+    def test_list_record_types_fast(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test fast=True decodes into structs with the same attribute names."""
+        pytest.importorskip("msgspec")
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/record-types?page%5Bnumber%5D=1&page%5Bsize%5D=20"
+            ),
+            json={
+                "data": [
+                    {
+                        "id": "rt-12345",
+                        "type": "recordType",
+                        "attributes": {
+                            "name": "Building Permit",
+                            "isEnabled": True,
+                            "parentRecordTypeID": "rt-1",
+                            "createdAt": "2025-01-01T00:00:00Z",
+                        },
+                    }
+                ],
+                "links": {"next": "http://example.com/record-types?page[number]=2"},
+                "meta": {"page": 1, "size": 20, "totalPages": 2, "totalRecords": 21},
+            },
+        )
+
+        result = opengov_api.list_record_types(fast=True)
+
+        record_type = result.data[0]
+        assert not isinstance(record_type, RecordTypeResource)
+        assert record_type.attributes.name == "Building Permit"
+        assert record_type.attributes.is_enabled is True
+        assert record_type.attributes.parent_record_type_id == "rt-1"
+        assert record_type.attributes.created_at.year == 2025
+        assert result.has_next_page()
+        assert result.total_records() == 21
+
     def test_list_record_types_with_department_filter(
         self, httpx_mock: HTTPXMock, configure_client, build_url
     ):
@@ -135,8 +212,26 @@ class TestRecordTypesEndpoint:
         assert result["data"]["attributes"]["status"] == "Published"
         assert result["data"]["attributes"]["isEnabled"] is True
 
-    def test_iter_record_types_handles_pagination(
+    def test_get_record_type_is_cached(
         self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test repeated lookups reuse the first response until cleared."""
+        url = build_url("testcommunity/record-types/rt-12345")
+        httpx_mock.add_response(url=url, json={"data": {"id": "rt-12345"}})
+
+        first = opengov_api.get_record_type("rt-12345")
+        second = opengov_api.get_record_type("rt-12345")
+        assert first == second
+        assert len(httpx_mock.get_requests()) == 1
+
+        opengov_api.clear_record_type_cache()
+        httpx_mock.add_response(url=url, json={"data": {"id": "rt-12345"}})
+        opengov_api.get_record_type("rt-12345")
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iter_record_types_handles_pagination(
+        self, httpx_mock: HTTPXMock, configure_client, build_url, stream
     ):
         """Test iter_record_types automatically handles pagination."""
         # Page 1
@@ -176,12 +271,84 @@ class TestRecordTypesEndpoint:
         )
 
         # Collect all record types
-        record_types = list(opengov_api.iter_record_types())
+        record_types = list(opengov_api.iter_record_types(stream=stream))
 
         assert len(record_types) == 2
         assert record_types[0].attributes.name == "Type 1"
         assert record_types[1].attributes.name == "Type 2"
 
+    def test_iter_record_types_stream_maps_status_errors(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test streamed iteration raises SDK errors for error statuses."""
+        pytest.importorskip("ijson")
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/record-types?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+            ),
+            status_code=404,
+            json={"errors": [{"detail": "Not found"}]},
+        )
+
+        with pytest.raises(opengov_api.OpenGovNotFoundError):
+            list(opengov_api.iter_record_types(stream=True))
+
+    def test_iter_record_types_stream_rejects_malformed_json(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test streamed iteration raises a parse error for truncated bodies."""
+        pytest.importorskip("ijson")
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/record-types?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+            ),
+            content=b'{"data": [{"id": "rt-1", "type": "recordType", "attri',
+        )
+
+        with pytest.raises(opengov_api.OpenGovResponseParseError):
+            list(opengov_api.iter_record_types(stream=True))
+
+    def test_iter_record_types_stream_ignores_nested_next_links(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test only the top-level links.next decides whether to page on."""
+        pytest.importorskip("ijson")
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/record-types?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+            ),
+            json={
+                "data": [
+                    {
+                        "id": f"rt-{i}",
+                        "type": "recordType",
+                        "attributes": {"name": f"Type {i}", "status": "Published"},
+                        "links": {"next": f"http://example.com/record-types/{i}"},
+                    }
+                    for i in (1, 2)
+                ],
+                "links": {"next": None},
+            },
+        )
+
+        record_types = list(opengov_api.iter_record_types(stream=True))
+
+        assert [record_type.id for record_type in record_types] == ["rt-1", "rt-2"]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_record_type_resources_are_frozen(self):
+        """Test parsed record types are immutable."""
+        record_type = RecordTypeResource(
+            id="rt-1",
+            type="recordType",
+            attributes={"name": "Type 1", "isEnabled": True},
+        )
+
+        with pytest.raises(ValidationError):
+            record_type.id = "rt-2"
+        with pytest.raises(ValidationError):
+            record_type.attributes.name = "Renamed"
+
 
 class TestRecordTypeNestedEndpoints:
     """Tests for nested record-type endpoints (attachments, fees, etc)."""
@@ -324,6 +491,22 @@ class TestRecordTypeNestedEndpoints:
         assert len(result["data"]) == 1
         assert result["data"][0]["attributes"]["label"] == "Processing Fee"
 
+    def test_list_record_type_fees_custom_page(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test non-default pagination is sent in the query string."""
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/record-types/rt-123/fees?page%5Bnumber%5D=3&page%5Bsize%5D=50"
+            ),
+            json={"data": []},
+        )
+
+        result = opengov_api.list_record_type_fees(
+            "rt-123", page_number=3, page_size=50
+        )
+        assert result["data"] == []
+
     def test_get_record_type_fee(
         self, httpx_mock: HTTPXMock, configure_client, build_url
     ):
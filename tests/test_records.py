@@ -6,9 +6,36 @@ and test_common_endpoints.py. This file tests behaviors unique to the
 records resource including CRUD operations, nested resources, and edge cases.
 """
 
-from pytest_httpx import HTTPXMock
+import asyncio
+import gzip
+import json
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from pytest_httpx import HTTPXMock, IteratorStream
 
 import opengov_api
+from opengov_api.models import (
+    AttachmentAttributes,
+    AttachmentResource,
+    ChangeRequestResource,
+    CollectionEntryResource,
+    CollectionResource,
+    DateRangeFilter,
+    GuestResource,
+    ListRecordsParams,
+    LocationAttributes,
+    LocationResource,
+    RecordAttributes,
+    RecordResource,
+    WorkflowStepAttributes,
+    WorkflowStepCommentResource,
+    WorkflowStepResource,
+)
+from opengov_api.models.params import list_query_params, list_records_query_params
 
 
 class TestRecordsEdgeCases:
@@ -35,6 +62,974 @@ class TestRecordsEdgeCases:
         assert result.data.id == record_id
         assert result.data.attributes.number == "REC-001"
 
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iter_records_stream(
+        self, httpx_mock: HTTPXMock, configure_client, build_url, stream
+    ):
+        """Test stream=True yields the same records across pages."""
+        page_url = (
+            "testcommunity/records?include=applicant"
+            "&page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(1)),
+            json={
+                "data": [
+                    {"id": "rec-1", "type": "records", "attributes": {"number": "A"}}
+                ],
+                "included": [{"id": "app-1", "type": "applicants"}],
+                "links": {"next": "http://example.com/records?page[number]=2"},
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(2)),
+            json={
+                "data": [{"id": "rec-2", "type": "records", "attributes": {}}],
+                "links": {"next": None},
+            },
+        )
+
+        records = list(opengov_api.iter_records(include=["applicant"], stream=stream))
+
+        assert [record.id for record in records] == ["rec-1", "rec-2"]
+        assert isinstance(records[0], RecordResource)
+        assert records[0].attributes.number == "A"
+
+    def test_iter_records_stream_maps_mid_page_errors(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test a connection dropped mid-page raises the SDK exception."""
+        pytest.importorskip("ijson")
+
+        def body():
+            yield b'{"data": [{"id": "rec-1", "type": "records", "attributes": {}},'
+            raise httpx.ReadError("connection reset")
+
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/records?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+            ),
+            stream=IteratorStream(body()),
+        )
+
+        records = opengov_api.iter_records(stream=True)
+        assert next(records).id == "rec-1"
+        with pytest.raises(opengov_api.OpenGovAPIConnectionError):
+            next(records)
+
+    def test_iter_records_fast(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test fast=True decodes each page into structs and paginates."""
+        pytest.importorskip("msgspec")
+        page_url = "testcommunity/records?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        httpx_mock.add_response(
+            url=build_url(page_url.format(1)),
+            json={
+                "data": [
+                    {
+                        "id": "rec-1",
+                        "type": "records",
+                        "attributes": {
+                            "number": "BP-1",
+                            "histID": "h-1",
+                            "status": "ACTIVE",
+                            "submittedAt": "2025-01-01T00:00:00Z",
+                        },
+                    }
+                ],
+                "links": {"next": "http://example.com/records?page[number]=2"},
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(2)),
+            json={
+                "data": [{"id": "rec-2", "type": "records", "attributes": {}}],
+                "links": {},
+            },
+        )
+
+        records = list(opengov_api.iter_records(fast=True))
+
+        assert [record.id for record in records] == ["rec-1", "rec-2"]
+        assert not isinstance(records[0], RecordResource)
+        assert records[0].attributes.hist_id == "h-1"
+        assert records[0].attributes.status is opengov_api.RecordStatus.ACTIVE
+        assert records[0].attributes.submitted_at.year == 2025
+
+    def test_iter_records_raw(self, httpx_mock: HTTPXMock, configure_client, build_url):
+        """Test raw=True yields the parsed dicts across pages."""
+        page_url = "testcommunity/records?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        httpx_mock.add_response(
+            url=build_url(page_url.format(1)),
+            json={
+                "data": [
+                    {"id": "rec-1", "type": "records", "attributes": {"histID": "h"}}
+                ],
+                "links": {"next": "http://example.com/records?page[number]=2"},
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(2)),
+            json={"data": [{"id": "rec-2", "type": "records"}], "links": {}},
+        )
+
+        records = list(opengov_api.iter_records(raw=True, fast=True))
+
+        assert records == [
+            {"id": "rec-1", "type": "records", "attributes": {"histID": "h"}},
+            {"id": "rec-2", "type": "records"},
+        ]
+
+    def test_list_records_decodes_compressed_body(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test gzip-encoded pages are decompressed before parsing."""
+        body = json.dumps(
+            {"data": [{"id": "rec-1", "type": "records", "attributes": {}}]}
+        ).encode()
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records?page%5Bnumber%5D=1&page%5Bsize%5D=20"),
+            stream=IteratorStream([gzip.compress(body)]),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+        )
+
+        response = opengov_api.list_records()
+        assert response.data[0].id == "rec-1"
+        assert "gzip" in httpx_mock.get_request().headers["Accept-Encoding"]
+
+    def test_list_record_guests_encodes_query_params(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test nested list params match the JSON:API bracket encoding."""
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/records/123/guests?page%5Bnumber%5D=3"
+                "&page%5Bsize%5D=50&include=user&fields%5Bguests%5D=email%2Cphone"
+                "&sort=-email"
+            ),
+            json={"data": []},
+        )
+
+        response = opengov_api.list_record_guests(
+            "123",
+            page_number=3,
+            page_size=50,
+            include=["user"],
+            fields={"guests": ["email", "phone"]},
+            sort="-email",
+        )
+        assert response.data == []
+
+    def test_list_record_guests_rejects_out_of_range_page_size(self, configure_client):
+        """Test invalid pagination still fails validation before any request."""
+        with pytest.raises(ValidationError):
+            opengov_api.list_record_guests("123", page_size=101)
+
+    def test_list_records_raw(self, httpx_mock: HTTPXMock, configure_client, build_url):
+        """Test raw=True returns the parsed JSON:API document."""
+        document = {
+            "data": [{"id": "rec-1", "type": "records", "attributes": {}}],
+            "meta": {"page": 1, "totalPages": 1},
+        }
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records?page%5Bnumber%5D=1&page%5Bsize%5D=20"),
+            json=document,
+        )
+
+        assert opengov_api.list_records(raw=True) == document
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iter_record_attachments_handles_pagination(
+        self, httpx_mock: HTTPXMock, configure_client, build_url, stream
+    ):
+        """Test nested iterators keep their filters while paging."""
+        page_url = (
+            "testcommunity/records/123/attachments"
+            "?page%5Bnumber%5D={}&page%5Bsize%5D=100&sort=-createdAt"
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(1)),
+            json={
+                "data": [{"id": "att-1", "type": "attachments", "attributes": {}}],
+                "links": {"next": "http://example.com/attachments?page[number]=2"},
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(2)),
+            json={"data": [{"id": "att-2", "type": "attachments", "attributes": {}}]},
+        )
+
+        attachments = list(
+            opengov_api.iter_record_attachments("123", sort="-createdAt", stream=stream)
+        )
+        assert [attachment.id for attachment in attachments] == ["att-1", "att-2"]
+        assert isinstance(attachments[0], AttachmentResource)
+
+    def test_iter_record_workflow_step_comments_raw(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test nested iterators support raw=True on their own endpoint."""
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/records/123/workflow-steps/s-1/comments"
+                "?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+            ),
+            json={"data": [{"id": "c-1", "type": "comments"}]},
+        )
+
+        comments = list(
+            opengov_api.iter_record_workflow_step_comments("123", "s-1", raw=True)
+        )
+        assert comments == [{"id": "c-1", "type": "comments"}]
+
+
+class TestRecordModelAliases:
+    """Tests for camelCase alias handling on record attribute models."""
+
+    @pytest.mark.parametrize(
+        "model,field_name,alias,value",
+        [
+            (RecordAttributes, "submitted_online", "submittedOnline", True),
+            (RecordAttributes, "renewal_of_record_id", "renewalOfRecordID", "r-1"),
+            (LocationAttributes, "owner_postal_code", "ownerPostalCode", "02110"),
+            (LocationAttributes, "gis_id", "gisID", "gis-9"),
+            (
+                AttachmentAttributes,
+                "attachment_template_id",
+                "attachmentTemplateID",
+                "t-1",
+            ),
+        ],
+    )
+    def test_alias_round_trip(self, model, field_name, alias, value):
+        """Test fields validate by alias or name and serialize by alias."""
+        by_alias = model.model_validate({alias: value})
+        by_name = model.model_validate({field_name: value})
+
+        assert getattr(by_alias, field_name) == value
+        assert by_alias == by_name
+        assert by_alias.model_dump(by_alias=True, exclude_none=True) == {alias: value}
+
+    def test_unknown_fields_are_dropped(self):
+        """Test undocumented server fields are not stored on resources."""
+        resource = RecordResource.model_validate(
+            {
+                "id": "rec-1",
+                "type": "records",
+                "attributes": {"number": "BP-1", "internalFlag": True},
+                "unexpected": {"nested": 1},
+            }
+        )
+
+        assert not hasattr(resource, "unexpected")
+        assert "unexpected" not in resource.model_dump(by_alias=True)
+        assert not hasattr(resource.attributes, "internalFlag")
+        assert "internalFlag" not in resource.attributes.model_dump(by_alias=True)
+        assert resource.attributes.number == "BP-1"
+        assert "unexpected" not in resource.model_dump()
+
+
+class TestWorkflowStepAttributes:
+    """Tests for workflow step timestamp normalization."""
+
+    @pytest.mark.parametrize(
+        "activated_key,completed_key",
+        [("activatedAt", "completedAt"), ("activated_at", "completed_at")],
+    )
+    def test_empty_timestamps_become_none(self, activated_key, completed_key):
+        """Test empty-string timestamps validate to None by alias or name."""
+        attributes = WorkflowStepAttributes.model_validate(
+            {
+                "stepType": "APPROVAL",
+                "status": "ACTIVE",
+                activated_key: "2024-01-15T10:00:00Z",
+                completed_key: "",
+            }
+        )
+
+        assert attributes.activated_at is not None
+        assert attributes.completed_at is None
+
+
+class TestRecordAsyncIteration:
+    """Tests for the async iter_* counterparts."""
+
+    def test_aiter_records_handles_pagination(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test aiter_records walks every page on one async client."""
+        page_url = "testcommunity/records?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        httpx_mock.add_response(
+            url=build_url(page_url.format(1)),
+            json={
+                "data": [{"id": "rec-1", "type": "records", "attributes": {}}],
+                "links": {"next": "http://example.com/records?page[number]=2"},
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(2)),
+            json={
+                "data": [{"id": "rec-2", "type": "records", "attributes": {}}],
+                "links": {},
+            },
+        )
+
+        async def collect():
+            return [record async for record in opengov_api.aiter_records()]
+
+        records = asyncio.run(collect())
+        assert [record.id for record in records] == ["rec-1", "rec-2"]
+        assert isinstance(records[0], RecordResource)
+
+    def test_aiter_records_prefetches_next_page(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test page 2 is requested before page 1's records are consumed."""
+        page_url = "testcommunity/records?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        httpx_mock.add_response(
+            url=build_url(page_url.format(1)),
+            json={
+                "data": [{"id": "rec-1", "type": "records", "attributes": {}}],
+                "links": {"next": "http://example.com/records?page[number]=2"},
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(2)),
+            json={"data": [{"id": "rec-2", "type": "records", "attributes": {}}]},
+        )
+
+        async def first_only():
+            records = opengov_api.aiter_records()
+            record = await anext(records)
+            # Let the prefetch task run while page 1 is being consumed
+            await asyncio.sleep(0.05)
+            requested = len(httpx_mock.get_requests())
+            await records.aclose()
+            return record, requested
+
+        record, requested = asyncio.run(first_only())
+        assert record.id == "rec-1"
+        assert requested == 2
+
+    def test_aiter_records_fetches_windows_concurrently(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test max_concurrency fans out over totalPages and keeps order."""
+        page_url = "testcommunity/records?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        for page in range(1, 6):
+            httpx_mock.add_response(
+                url=build_url(page_url.format(page)),
+                json={
+                    "data": [
+                        {"id": f"rec-{page}", "type": "records", "attributes": {}}
+                    ],
+                    "meta": {"page": page, "totalPages": 5},
+                },
+            )
+
+        async def collect():
+            records = opengov_api.aiter_records(max_concurrency=2)
+            first = await anext(records)
+            # Pages 2 and 3 are requested together while page 1 is consumed
+            await asyncio.sleep(0.05)
+            requested = len(httpx_mock.get_requests())
+            rest = [record async for record in records]
+            return [first, *rest], requested
+
+        records, requested = asyncio.run(collect())
+        assert [record.id for record in records] == [
+            f"rec-{page}" for page in range(1, 6)
+        ]
+        assert requested == 3
+
+    def test_aiter_records_windows_follow_stale_total(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test pages beyond a stale totalPages are still followed."""
+        page_url = "testcommunity/records?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        for page in range(1, 4):
+            httpx_mock.add_response(
+                url=build_url(page_url.format(page)),
+                json={
+                    "data": [
+                        {"id": f"rec-{page}", "type": "records", "attributes": {}}
+                    ],
+                    "meta": {"page": page, "totalPages": 2},
+                    "links": {
+                        "next": (
+                            f"http://example.com/records?page[number]={page + 1}"
+                            if page < 3
+                            else None
+                        )
+                    },
+                },
+            )
+
+        async def collect():
+            return [
+                record async for record in opengov_api.aiter_records(max_concurrency=4)
+            ]
+
+        records = asyncio.run(collect())
+        assert [record.id for record in records] == ["rec-1", "rec-2", "rec-3"]
+
+    def test_aiter_records_window_errors(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test a failing page in a window raises the SDK exception."""
+        page_url = "testcommunity/records?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        httpx_mock.add_response(
+            url=build_url(page_url.format(1)),
+            json={"data": [], "meta": {"page": 1, "totalPages": 3}},
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(2)),
+            status_code=404,
+            json={"errors": [{"detail": "Not found"}]},
+        )
+        httpx_mock.add_response(
+            url=build_url(page_url.format(3)), json={"data": []}, is_optional=True
+        )
+
+        async def collect():
+            return [
+                record async for record in opengov_api.aiter_records(max_concurrency=4)
+            ]
+
+        with pytest.raises(opengov_api.OpenGovNotFoundError):
+            asyncio.run(collect())
+
+    def test_aiter_record_guests(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test nested async iterators target the record's sub-resource."""
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/records/123/guests?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+            ),
+            json={"data": [{"id": "guest-1", "type": "guests", "attributes": {}}]},
+        )
+
+        async def collect():
+            return [guest async for guest in opengov_api.aiter_record_guests("123")]
+
+        guests = asyncio.run(collect())
+        assert [guest.id for guest in guests] == ["guest-1"]
+
+    def test_aiter_records_retries_server_errors(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test async pages retry transient errors without blocking the loop."""
+        url = build_url("testcommunity/records?page%5Bnumber%5D=1&page%5Bsize%5D=100")
+        httpx_mock.add_response(url=url, status_code=503)
+        httpx_mock.add_response(url=url, json={"data": []})
+
+        async def collect():
+            return [record async for record in opengov_api.aiter_records()]
+
+        with patch("opengov_api.base.asyncio.sleep") as mock_sleep:
+            assert asyncio.run(collect()) == []
+        mock_sleep.assert_called_once()
+
+    def test_aiter_records_maps_status_errors(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test async iteration raises SDK exceptions for error statuses."""
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/records?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+            ),
+            status_code=404,
+            json={"errors": [{"detail": "Not found"}]},
+        )
+
+        async def collect():
+            return [record async for record in opengov_api.aiter_records()]
+
+        with pytest.raises(opengov_api.OpenGovNotFoundError):
+            asyncio.run(collect())
+
+
+class TestRecordAsyncLookups:
+    """Tests for the async get/list counterparts."""
+
+    def test_gathered_lookups_share_one_client(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test concurrent lookups on one loop reuse the shared async client."""
+        for record_id in ("1", "2"):
+            httpx_mock.add_response(
+                url=build_url(f"testcommunity/records/{record_id}/primary-location"),
+                json={
+                    "data": {
+                        "id": f"loc-{record_id}",
+                        "type": "locations",
+                        "attributes": {},
+                    }
+                },
+            )
+
+        async def lookup():
+            clients = [opengov_api.client._get_shared_async_client()]
+            results = await asyncio.gather(
+                opengov_api.aget_record_primary_location("1"),
+                opengov_api.aget_record_primary_location("2"),
+            )
+            clients.append(opengov_api.client._get_shared_async_client())
+            return results, clients
+
+        results, clients = asyncio.run(lookup())
+        assert [result.data.id for result in results] == ["loc-1", "loc-2"]
+        assert clients[0] is clients[1]
+
+    @pytest.mark.parametrize(
+        ("func", "args", "path", "resource"),
+        [
+            ("alist_record_guests", (), "guests", GuestResource),
+            ("aget_record_guest", ("u-1",), "guests/u-1", GuestResource),
+            (
+                "aget_record_primary_location",
+                (),
+                "primary-location",
+                LocationResource,
+            ),
+            (
+                "alist_record_additional_locations",
+                (),
+                "additional-locations",
+                LocationResource,
+            ),
+            (
+                "aget_record_additional_location",
+                ("loc-1",),
+                "additional-locations/loc-1",
+                LocationResource,
+            ),
+            ("alist_record_attachments", (), "attachments", AttachmentResource),
+            (
+                "aget_record_attachment",
+                ("att-1",),
+                "attachments/att-1",
+                AttachmentResource,
+            ),
+            (
+                "aget_record_change_request",
+                ("cr-1",),
+                "change-requests/cr-1",
+                ChangeRequestResource,
+            ),
+            (
+                "aget_most_recent_record_change_request",
+                (),
+                "change-requests",
+                ChangeRequestResource,
+            ),
+            (
+                "alist_record_workflow_steps",
+                (),
+                "workflow-steps",
+                WorkflowStepResource,
+            ),
+            (
+                "aget_record_workflow_step",
+                ("s-1",),
+                "workflow-steps/s-1",
+                WorkflowStepResource,
+            ),
+            (
+                "alist_record_workflow_step_comments",
+                ("s-1",),
+                "workflow-steps/s-1/comments",
+                WorkflowStepCommentResource,
+            ),
+            (
+                "aget_record_workflow_step_comment",
+                ("s-1", "c-1"),
+                "workflow-steps/s-1/comments/c-1",
+                WorkflowStepCommentResource,
+            ),
+            ("alist_record_collections", (), "collections", CollectionResource),
+            (
+                "aget_record_collection",
+                ("col-1",),
+                "collections/col-1",
+                CollectionResource,
+            ),
+            (
+                "aget_record_collection_entry",
+                ("col-1", "e-1"),
+                "collections/col-1/entries/e-1",
+                CollectionEntryResource,
+            ),
+        ],
+    )
+    def test_async_lookups_match_sync_endpoints(
+        self,
+        httpx_mock: HTTPXMock,
+        configure_client,
+        build_url,
+        func,
+        args,
+        path,
+        resource,
+    ):
+        """Test each async lookup targets its URL and validates its resource."""
+        attributes = {}
+        if resource is WorkflowStepResource:
+            attributes = {"stepType": "REVIEW", "status": "ACTIVE"}
+        item = {"id": "res-1", "type": "resources", "attributes": attributes}
+        is_list = func.startswith("alist_")
+        query = "?page%5Bnumber%5D=2&page%5Bsize%5D=5" if is_list else ""
+        kwargs = {"page_number": 2, "page_size": 5} if is_list else {}
+        httpx_mock.add_response(
+            url=build_url(f"testcommunity/records/123/{path}{query}"),
+            json={"data": [item] if is_list else item},
+        )
+
+        response = asyncio.run(getattr(opengov_api, func)("123", *args, **kwargs))
+        data = response.data[0] if is_list else response.data
+        assert isinstance(data, resource)
+        assert data.id == "res-1"
+
+    def test_aget_record_guest_maps_status_errors(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test async lookups raise SDK exceptions for error statuses."""
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records/123/guests/u-1"), status_code=404
+        )
+
+        with pytest.raises(opengov_api.OpenGovNotFoundError):
+            asyncio.run(opengov_api.aget_record_guest("123", "u-1"))
+
+    def test_hydrate_workflow_and_collections_concurrently(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test workflow and collection lookups can be gathered together."""
+        httpx_mock.add_response(
+            url=build_url(
+                "testcommunity/records/123/workflow-steps"
+                "?page%5Bnumber%5D=1&page%5Bsize%5D=20"
+            ),
+            json={
+                "data": [
+                    {
+                        "id": "s-1",
+                        "type": "workflowSteps",
+                        "attributes": {"stepType": "REVIEW", "status": "ACTIVE"},
+                    }
+                ]
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records/123/workflow-steps/s-1/comments/c-1"),
+            json={"data": {"id": "c-1", "type": "comments", "attributes": {}}},
+        )
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records/123/collections/col-1/entries/e-1"),
+            json={"data": {"id": "e-1", "type": "entries", "attributes": {}}},
+        )
+
+        async def hydrate():
+            return await asyncio.gather(
+                opengov_api.alist_record_workflow_steps("123"),
+                opengov_api.aget_record_workflow_step_comment("123", "s-1", "c-1"),
+                opengov_api.aget_record_collection_entry("123", "col-1", "e-1"),
+            )
+
+        steps, comment, entry = asyncio.run(hydrate())
+        assert steps.data[0].id == "s-1"
+        assert comment.data.id == "c-1"
+        assert entry.data.id == "e-1"
+
+
+class TestRecordBundle:
+    """Tests for fetching a record's steps, comments and collections together."""
+
+    def test_rejects_invalid_concurrency(self, configure_client):
+        """Test a limit below 1 raises instead of blocking forever."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            opengov_api.fetch_record_bundle("123", max_concurrency=0)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(opengov_api.afetch_record_bundle("123", max_concurrency=0))
+
+    def _mock_bundle(self, httpx_mock, build_url):
+        page = "?page%5Bnumber%5D={}&page%5Bsize%5D=100"
+        step = {
+            "type": "workflowSteps",
+            "attributes": {"stepType": "REVIEW", "status": "ACTIVE"},
+        }
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records/123/workflow-steps" + page.format(1)),
+            json={
+                "data": [{"id": "s-1", **step}],
+                "links": {"next": "http://example.com/workflow-steps?page[number]=2"},
+            },
+        )
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records/123/workflow-steps" + page.format(2)),
+            json={"data": [{"id": "s-2", **step}]},
+        )
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records/123/collections" + page.format(1)),
+            json={"data": [{"id": "col-1", "type": "collections", "attributes": {}}]},
+        )
+        for step_id in ("s-1", "s-2"):
+            httpx_mock.add_response(
+                url=build_url(
+                    f"testcommunity/records/123/workflow-steps/{step_id}/comments"
+                    + page.format(1)
+                ),
+                json={
+                    "data": [
+                        {"id": f"c-{step_id}", "type": "comments", "attributes": {}}
+                    ]
+                },
+            )
+
+    def _assert_bundle(self, bundle):
+        assert [step.id for step in bundle.workflow_steps] == ["s-1", "s-2"]
+        assert [c.id for c in bundle.collections] == ["col-1"]
+        assert {k: [c.id for c in v] for k, v in bundle.comments.items()} == {
+            "s-1": ["c-s-1"],
+            "s-2": ["c-s-2"],
+        }
+
+    def test_fetch_record_bundle(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test the sync bundle pages through steps and fans out comments."""
+        self._mock_bundle(httpx_mock, build_url)
+
+        self._assert_bundle(opengov_api.fetch_record_bundle("123"))
+
+    def test_afetch_record_bundle(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test the async bundle returns the same structure."""
+        self._mock_bundle(httpx_mock, build_url)
+
+        bundle = asyncio.run(opengov_api.afetch_record_bundle("123", max_concurrency=1))
+        assert isinstance(bundle, opengov_api.RecordBundle)
+        self._assert_bundle(bundle)
+
+
+class TestIterRecordsWithRelations:
+    """Tests for expanding records with their related lists."""
+
+    def test_relations_are_fetched_per_record(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test each record is paired with its own guests and attachments."""
+        page = "?page%5Bnumber%5D=1&page%5Bsize%5D=100"
+        for record_id in ("1", "2"):
+            httpx_mock.add_response(
+                url=build_url(f"testcommunity/records/{record_id}/guests" + page),
+                json={
+                    "data": [
+                        {"id": f"g-{record_id}", "type": "guests", "attributes": {}}
+                    ]
+                },
+            )
+            httpx_mock.add_response(
+                url=build_url(f"testcommunity/records/{record_id}/attachments" + page),
+                json={"data": []},
+            )
+        records = [
+            RecordResource(id=record_id, type="records", attributes={})
+            for record_id in ("1", "2")
+        ]
+
+        pairs = list(opengov_api.iter_records_with_relations(records, batch_size=1))
+
+        assert [record.id for record, _ in pairs] == ["1", "2"]
+        assert [[guest.id for guest in related["guests"]] for _, related in pairs] == [
+            ["g-1"],
+            ["g-2"],
+        ]
+        assert all(related["attachments"] == [] for _, related in pairs)
+
+    def test_unsupported_relation(self, configure_client):
+        """Test unknown relation names are rejected when the call is made."""
+        with pytest.raises(ValueError, match="forms"):
+            opengov_api.iter_records_with_relations([], ["forms"])
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_rejects_invalid_concurrency(self, configure_client, max_concurrency):
+        """Test a limit below 1 raises instead of blocking forever."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            opengov_api.iter_records_with_relations([], max_concurrency=max_concurrency)
+
+
+class TestListRecordsPages:
+    """Tests for fetching several record pages concurrently."""
+
+    def test_list_records_pages_preserves_order(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test pages come back in the requested order with shared filters."""
+        page_url = (
+            "testcommunity/records?filter%5Bstatus%5D=ACTIVE"
+            "&page%5Bnumber%5D={}&page%5Bsize%5D=50"
+        )
+        for page in (3, 2):
+            httpx_mock.add_response(
+                url=build_url(page_url.format(page)),
+                json={
+                    "data": [
+                        {"id": f"rec-{page}", "type": "records", "attributes": {}}
+                    ],
+                    "meta": {"page": page},
+                },
+            )
+
+        pages = opengov_api.list_records_pages(
+            [3, 2], status=opengov_api.RecordStatus.ACTIVE, page_size=50
+        )
+        assert [page.current_page() for page in pages] == [3, 2]
+        assert [page.data[0].id for page in pages] == ["rec-3", "rec-2"]
+        assert isinstance(pages[0].data[0], RecordResource)
+
+    def test_list_records_pages_bounds_concurrency(
+        self, httpx_mock: HTTPXMock, configure_client
+    ):
+        """Test no more than max_concurrency pages are in flight at once."""
+        in_flight = peak = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            page = int(request.url.params["page[number]"])
+            return httpx.Response(200, json={"data": [], "meta": {"page": page}})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+
+        pages = opengov_api.list_records_pages(list(range(1, 7)), max_concurrency=2)
+        assert [page.current_page() for page in pages] == list(range(1, 7))
+        assert peak == 2
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_list_records_pages_rejects_invalid_concurrency(
+        self, configure_client, max_concurrency
+    ):
+        """Test a limit below 1 raises instead of blocking forever."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            opengov_api.list_records_pages([1], max_concurrency=max_concurrency)
+
+    def test_list_records_pages_maps_status_errors(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test a failing page raises the SDK exception."""
+        httpx_mock.add_response(
+            url=build_url("testcommunity/records?page%5Bnumber%5D=1&page%5Bsize%5D=20"),
+            status_code=404,
+            json={"errors": [{"detail": "Not found"}]},
+        )
+
+        with pytest.raises(opengov_api.OpenGovNotFoundError):
+            opengov_api.list_records_pages([1])
+
+
+class TestListQueryParams:
+    """Tests for building nested list query params without the model."""
+
+    def test_coerces_string_pagination(self):
+        """Test numeric strings are coerced by the model as before."""
+        params = list_query_params(page_size="50")
+        assert params == {"page[number]": 1, "page[size]": 50}
+
+    def test_non_int_pagination_raises_validation_error(self):
+        """Test fractional and out-of-range pagination is rejected."""
+        with pytest.raises(ValidationError):
+            list_query_params(page_size=2.5)
+        with pytest.raises(ValidationError):
+            list_query_params(page_number=0)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"include": "a,b"},
+            {"include": ["guests", 1]},
+            {"fields": {"records": "name"}},
+            {"sort": ["name"]},
+        ],
+    )
+    def test_malformed_list_params_raise_validation_error(self, kwargs):
+        """Test include, fields and sort of the wrong type are not encoded."""
+        with pytest.raises(ValidationError):
+            list_query_params(**kwargs)
+
+    def test_tuple_include_is_encoded(self):
+        """Test a tuple of strings takes the fast path like a list."""
+        params = list_query_params(include=("guests", "attachments"))
+        assert params["include"] == "guests,attachments"
+
+
+class TestListRecordsQueryParams:
+    """Tests for building list_records query params without the model."""
+
+    def test_matches_model_encoding(self):
+        """Test the plain builder produces the model's dict, in order."""
+        filters = {
+            "number": "REC-1",
+            "type_id": "type-1",
+            "status": opengov_api.RecordStatus.ACTIVE,
+            "is_enabled": False,
+            "created_at": DateRangeFilter(gte=date(2025, 1, 1), lt=date(2025, 4, 1)),
+            "updated_at": datetime(2025, 3, 1, tzinfo=timezone.utc),
+            "expires_at": date(2026, 1, 1),
+            "renewal_number": "",
+        }
+        expected = ListRecordsParams(
+            **{f"filter_{name}": value for name, value in filters.items()},
+            page_number=3,
+            page_size=50,
+            include=["applicant"],
+            fields={"records": ["number"]},
+            sort="-createdAt",
+        ).to_query_params()
+
+        params = list_records_query_params(
+            **filters,
+            page_number=3,
+            page_size=50,
+            include=["applicant"],
+            fields={"records": ["number"]},
+            sort="-createdAt",
+        )
+        assert list(params.items()) == list(expected.items())
+
+    def test_coerces_through_model(self):
+        """Test values needing coercion still go through the model."""
+        params = list_records_query_params(status="ACTIVE", created_at="2025-01-01")
+        assert params["filter[status]"] == "ACTIVE"
+        assert params["filter[createdAt]"] == "2025-01-01"
+        assert list_records_query_params(page_size="50")["page[size]"] == 50
+
+    def test_invalid_values_raise_validation_error(self):
+        """Test invalid pagination and filters keep raising ValidationError."""
+        with pytest.raises(ValidationError):
+            list_records_query_params(page_size=500)
+        with pytest.raises(ValidationError):
+            list_records_query_params(page_size=2.5)
+        with pytest.raises(ValidationError):
+            list_records_query_params(status="NOT_A_STATUS")
+        with pytest.raises(ValidationError):
+            list_records_query_params(include="applicant")
+        with pytest.raises(ValidationError):
+            list_records_query_params(fields={"records": "number"})
+        with pytest.raises(ValidationError):
+            list_records_query_params(sort=["-createdAt"])
+
+    def test_unknown_filter_raises(self):
+        """Test a misspelled filter keyword is rejected."""
+        with pytest.raises(TypeError, match="statuss"):
+            list_records_query_params(statuss="ACTIVE")
+
 
 class TestRecordCRUD:
     """Tests for basic record CRUD operations."""
@@ -79,6 +1074,28 @@ class TestRecordCRUD:
         assert result.data.id == "123"
         assert_request_method("PATCH")
 
+    def test_update_record_with_model_omits_unset_fields(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test request models are sent without None-valued attributes."""
+        url = build_url("testcommunity/records/123")
+        httpx_mock.add_response(
+            url=url,
+            json={"data": {"id": "123", "type": "records", "attributes": {}}},
+        )
+
+        opengov_api.update_record(
+            "123",
+            opengov_api.RecordUpdateRequest(
+                data={"attributes": {"name": "Updated"}},
+            ),
+        )
+
+        request = httpx_mock.get_request()
+        assert json.loads(request.content) == {
+            "data": {"type": "records", "attributes": {"name": "Updated"}}
+        }
+
     def test_archive_record(
         self, httpx_mock: HTTPXMock, configure_client, build_url, assert_request_method
     ):
@@ -232,6 +1249,31 @@ class TestRecordGuests:
         assert request is not None
         assert request.method == "DELETE"
 
+    def test_get_record_guest_retries_once_per_attempt(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test a transient error is retried by a single retry loop."""
+        url = build_url("testcommunity/records/123/guests/user-1")
+        httpx_mock.add_response(url=url, status_code=503)
+        httpx_mock.add_response(
+            url=url,
+            json={"data": {"id": "user-1", "type": "guests", "attributes": {}}},
+        )
+
+        result = opengov_api.get_record_guest("123", "user-1")
+        assert result.data.id == "user-1"
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_get_record_guest_not_found(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test status errors are still mapped to SDK exceptions."""
+        url = build_url("testcommunity/records/123/guests/user-1")
+        httpx_mock.add_response(url=url, status_code=404, json={"message": "nope"})
+
+        with pytest.raises(opengov_api.OpenGovNotFoundError):
+            opengov_api.get_record_guest("123", "user-1")
+
 
 class TestRecordLocations:
     """Tests for record location operations."""
@@ -421,6 +1463,24 @@ class TestRecordAttachments:
         assert not isinstance(result.data, list)
         assert result.data.id == "att-1"
 
+    def test_get_record_attachment_raw(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test raw=True returns the parsed document without validation."""
+        url = build_url("testcommunity/records/123/attachments/att-1")
+        document = {
+            "data": {
+                "id": "att-1",
+                "type": "attachments",
+                "attributes": {"filename": "test.pdf"},
+            }
+        }
+        httpx_mock.add_response(url=url, json=document)
+
+        result = opengov_api.get_record_attachment("123", "att-1", raw=True)
+        assert result == document
+        assert result["data"]["attributes"]["filename"] == "test.pdf"
+
     def test_remove_record_attachment(
         self, httpx_mock: HTTPXMock, configure_client, build_url
     ):
@@ -747,6 +1807,81 @@ class TestRecordCollections:
         assert not isinstance(result.data, list)
         assert result.data.id == "entry-1"
 
+    def test_create_record_collection_entries(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test bulk entry creation posts every entry and keeps their order."""
+        url = build_url("testcommunity/records/123/collections/coll-1")
+        entries = [{"data": {"attributes": {"value": str(i)}}} for i in range(3)]
+        for i, entry in enumerate(entries):
+            httpx_mock.add_response(
+                url=url,
+                method="POST",
+                match_json=entry,
+                json={
+                    "data": {
+                        "id": f"entry-{i}",
+                        "type": "collection-entries",
+                        "attributes": {},
+                    }
+                },
+            )
+
+        results = opengov_api.create_record_collection_entries(
+            "123", "coll-1", entries, max_concurrency=2
+        )
+        assert [result.data.id for result in results] == [
+            "entry-0",
+            "entry-1",
+            "entry-2",
+        ]
+
+    def test_create_record_collection_entries_reports_partial_failure(
+        self, httpx_mock: HTTPXMock, configure_client, build_url
+    ):
+        """Test a failed entry leaves the others running and reports each one."""
+        url = build_url("testcommunity/records/123/collections/coll-1")
+        entries = [{"data": {"attributes": {"value": str(i)}}} for i in range(3)]
+        for i, entry in enumerate(entries):
+            if i == 1:
+                httpx_mock.add_response(
+                    url=url, method="POST", match_json=entry, status_code=400
+                )
+                continue
+            httpx_mock.add_response(
+                url=url,
+                method="POST",
+                match_json=entry,
+                json={
+                    "data": {
+                        "id": f"entry-{i}",
+                        "type": "collection-entries",
+                        "attributes": {},
+                    }
+                },
+            )
+
+        with pytest.raises(opengov_api.OpenGovBulkRequestError) as exc_info:
+            opengov_api.create_record_collection_entries("123", "coll-1", entries)
+
+        results = exc_info.value.results
+        assert [result.data.id for result in (results[0], results[2])] == [
+            "entry-0",
+            "entry-2",
+        ]
+        assert list(exc_info.value.errors) == [1]
+        assert isinstance(results[1], opengov_api.OpenGovBadRequestError)
+        assert isinstance(exc_info.value.__cause__, opengov_api.OpenGovBadRequestError)
+
+    def test_create_record_collection_entries_rejects_invalid_concurrency(
+        self, configure_client
+    ):
+        """Test a limit below 1 raises instead of blocking forever."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            opengov_api.create_record_collection_entries(
+                "123", "coll-1", [{"data": {"attributes": {}}}], max_concurrency=0
+            )
+
     def test_get_record_collection_entry(
         self, httpx_mock: HTTPXMock, configure_client, build_url
     ):